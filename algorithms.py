@@ -1,111 +1,1499 @@
 import heapq
+import time
+from itertools import count
+
+from heuristics import make_heuristic
+from observers import MetricsCollector, combine_observers
+from open_lists import OPEN_LISTS, HeapOpenList
+
+
+# Niveaux de trace acceptés par BestFirstSearch, du plus léger au plus complet :
+# - 'none' : aucune instrumentation (ni étapes ni ordre d'exploration)
+# - 'expansions' : ordre d'exploration uniquement
+# - 'delta' : ordre d'exploration et SearchTrace compacte
+# - 'full' : copie complète de l'état à chaque étape
+TRACE_LEVELS = ('none', 'expansions', 'delta', 'full')
+
+# Nombre d'expansions entre deux vérifications d'annulation et rapports de progression
+PROGRESS_INTERVAL = 1024
+
+
+class SearchCancelled(Exception):
+    """Levée par une recherche ou un export interrompu à la demande (voir cancel)."""
+
+
+def greedy_priority(g, h):
+    """Best-First Search glouton : seule l'heuristique compte, f = h."""
+    return h
+
+
+def a_star_priority(g, h):
+    """A* : coût parcouru plus estimation restante, f = g + h."""
+    return g + h
+
+
+def uniform_cost_priority(g, h):
+    """Recherche à coût uniforme (Dijkstra) : f = g."""
+    return g
+
+
+def weighted_a_star_priority(epsilon):
+    """
+    Construit la priorité de A* pondéré, f = g + ε·h.
+
+    Avec une heuristique admissible, le coût du chemin trouvé est au plus
+    ε fois le coût optimal ; un ε plus grand explore moins de nœuds.
+
+    Args:
+        epsilon: Poids ε >= 1 de l'heuristique
+
+    Returns:
+        function: Fonction de priorité f(g, h)
+    """
+    if epsilon < 1:
+        raise ValueError("Le poids epsilon doit être supérieur ou égal à 1")
+
+    def priority(g, h):
+        return g + epsilon * h
+    priority.__name__ = f"weighted_a_star_priority({epsilon})"
+    return priority
+
+
+# Modes de recherche disponibles par nom
+SEARCH_MODES = ('greedy', 'astar', 'weighted_astar', 'ucs')
+
+
+def make_priority(mode, epsilon=1.0):
+    """
+    Renvoie la fonction de priorité f(g, h) correspondant à un mode.
+
+    Args:
+        mode: Nom du mode parmi SEARCH_MODES
+        epsilon: Poids de l'heuristique pour 'weighted_astar'
+
+    Returns:
+        function: Fonction de priorité
+    """
+    if mode == 'greedy':
+        return greedy_priority
+    if mode == 'astar':
+        return a_star_priority
+    if mode == 'weighted_astar':
+        return weighted_a_star_priority(epsilon)
+    if mode == 'ucs':
+        return uniform_cost_priority
+    raise ValueError(f"Mode de recherche inconnu: {mode}")
+
+
+class SearchTrace:
+    """
+    Trace compacte d'une exécution de Best-First Search.
+
+    Au lieu de copier la file de priorité, l'ensemble des nœuds visités et le
+    chemin partiel à chaque étape, seules les différences sont enregistrées :
+    le nœud développé, son lien parent, le nombre d'entrées obsolètes retirées
+    de la file et les entrées ajoutées. La mémoire est ainsi proportionnelle
+    au nombre d'opérations sur la file plutôt qu'à expansions × frontière.
+
+    Les nœuds sont enregistrés sous forme d'indices du graphe compilé et
+    traduits en identifiants lors de la reconstruction.
+
+    L'objet se comporte comme la liste ``steps`` classique : ``len(trace)``,
+    ``trace[i]`` et l'itération reconstruisent à la demande l'état complet de
+    l'étape (``current``, ``open_set``, ``visited``, ``path_so_far``). Le rejeu
+    reprend depuis la dernière étape reconstruite, donc un parcours séquentiel
+    (animation) coûte O(opérations totales).
+    """
+
+    def __init__(self, start_entry, node_ids, open_list_factory=HeapOpenList):
+        """
+        Initialise une trace vide.
+
+        Args:
+            start_entry: Entrée (priorité, nœud, parent, g) du nœud de départ
+            node_ids: Identifiants des nœuds, indexés comme dans les entrées
+            open_list_factory: Classe de liste ouverte utilisée par la
+                recherche, réutilisée pour rejouer les mêmes opérations
+        """
+        self.start_entry = start_entry
+        self.node_ids = node_ids
+        self.open_list_factory = open_list_factory
+        self.nodes = []  # Nœud développé à chaque étape
+        self.parents = {}  # Lien parent de chaque nœud développé
+        self.stale_pops = []  # Entrées obsolètes retirées avant chaque étape
+        self.pushed = []  # Entrées ajoutées à la file, toutes étapes confondues
+        self.push_offsets = []  # Début des ajouts de chaque étape dans pushed
+        self._replay = None  # (étape, file) du dernier rejeu
+
+    def record_expansion(self, node, parent, stale_pops):
+        """
+        Enregistre le développement d'un nœud.
+
+        Args:
+            node: Indice du nœud retiré de la file et développé
+            parent: Indice du parent (-1 pour le départ)
+            stale_pops: Nombre d'entrées déjà visitées retirées juste avant
+        """
+        self.nodes.append(node)
+        if parent >= 0:
+            self.parents[node] = parent
+        self.stale_pops.append(stale_pops)
+        self.push_offsets.append(len(self.pushed))
+
+    def record_push(self, entry):
+        """Enregistre une entrée ajoutée à la file lors de l'étape courante."""
+        self.pushed.append(entry)
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def __iter__(self):
+        for index in range(len(self.nodes)):
+            yield self[index]
+
+    def __getitem__(self, index):
+        """
+        Reconstruit l'état complet d'une étape.
+
+        Args:
+            index: Numéro de l'étape (les indices négatifs sont acceptés)
+
+        Returns:
+            dict: Même format que les étapes de la trace complète
+        """
+        if index < 0:
+            index += len(self.nodes)
+        if not 0 <= index < len(self.nodes):
+            raise IndexError("Indice d'étape hors limites")
+
+        node_ids = self.node_ids
+        current = self.nodes[index]
+        return {
+            'current': node_ids[current],
+            'open_set': [(priority, node_ids[node], node_ids[parent] if parent >= 0 else None)
+                         for priority, node, parent, _ in self._replay_open_set(index).entries()],
+            'visited': [node_ids[node] for node in self.nodes[:index + 1]],
+            'path_so_far': [node_ids[node] for node in self.path_to(current)]
+        }
+
+    def path_to(self, node):
+        """
+        Reconstruit le chemin (en indices) du départ jusqu'à un nœud développé.
+
+        Les liens parents sont fixés au moment du développement, donc le
+        chemin d'une étape ne dépend que des étapes précédentes.
+        """
+        path = [node]
+        while node in self.parents:
+            node = self.parents[node]
+            path.append(node)
+        return path[::-1]
+
+    def _replay_open_set(self, index):
+        """Rejoue les opérations sur la file jusqu'à l'étape demandée."""
+        if self._replay is None or self._replay[0] > index:
+            position, open_set = -1, self.open_list_factory()
+            open_set.push(self.start_entry)
+        else:
+            position, open_set = self._replay
+
+        while position < index:
+            if position >= 0:
+                end = (self.push_offsets[position + 1]
+                       if position + 1 < len(self.push_offsets)
+                       else len(self.pushed))
+                for entry in self.pushed[self.push_offsets[position]:end]:
+                    open_set.push(entry)
+            position += 1
+            for _ in range(self.stale_pops[position] + 1):
+                open_set.pop()
+
+        self._replay = (position, open_set)
+        return open_set
+
+
+class ShortestPathTree:
+    """
+    Arbre des plus courts chemins depuis un départ (voir BestFirstSearch.search_many).
+
+    Pour chaque nœud développé, l'arbre garde son coût définitif et son
+    parent, indexés par les entiers du graphe compilé : le chemin vers
+    n'importe quel nœud atteint se reconstruit en remontant les parents, en
+    O(longueur du chemin), sans relancer de recherche.
+    """
+
+    def __init__(self, compiled, start, goals, distances, parents, settled, expansions):
+        """
+        Args:
+            compiled: Graphe compilé exploré
+            start: Indice du nœud de départ
+            goals: Indices des buts demandés (None : tous les nœuds)
+            distances: Coût de chaque nœud (définitif pour les nœuds développés)
+            parents: Parent de chaque nœud développé (-1 pour le départ)
+            settled: bytearray, 1 pour les nœuds développés
+            expansions: Nombre de nœuds développés
+        """
+        self.compiled = compiled
+        self.start = start
+        self.goals = goals
+        self.distances = distances
+        self.parents = parents
+        self.settled = settled
+        self.expansions = expansions
+
+    @property
+    def start_node(self):
+        """Identifiant du nœud de départ."""
+        return self.compiled.node_ids[self.start]
+
+    @property
+    def reached_goals(self):
+        """Buts développés, dans l'ordre de la requête."""
+        node_ids = self.compiled.node_ids
+        return [node_ids[goal] for goal in self.goals or () if self.settled[goal]]
+
+    @property
+    def unreached_goals(self):
+        """Buts non atteints (inaccessibles, ou budget d'expansions épuisé)."""
+        node_ids = self.compiled.node_ids
+        return [node_ids[goal] for goal in self.goals or () if not self.settled[goal]]
+
+    @property
+    def complete(self):
+        """Vrai si tous les buts demandés ont été atteints."""
+        return self.goals is not None and all(self.settled[goal] for goal in self.goals)
+
+    def __contains__(self, node):
+        index = self.compiled.index.get(node)
+        return index is not None and bool(self.settled[index])
+
+    def cost_to(self, node):
+        """
+        Coût du plus court chemin vers un nœud.
+
+        Args:
+            node: Identifiant du nœud
+
+        Returns:
+            float: Coût, ou None si le nœud n'a pas été atteint
+        """
+        if node not in self:
+            return None
+        return self.distances[self.compiled.index[node]]
+
+    def path_to(self, node):
+        """
+        Reconstruit le plus court chemin du départ jusqu'à un nœud.
+
+        Args:
+            node: Identifiant du nœud
+
+        Returns:
+            list: Identifiants des nœuds du chemin, ou None si le nœud n'a
+                pas été atteint
+        """
+        if node not in self:
+            return None
+        parents = self.parents
+        index = self.compiled.index[node]
+        path = [index]
+        while parents[index] >= 0:
+            index = parents[index]
+            path.append(index)
+        node_ids = self.compiled.node_ids
+        return [node_ids[index] for index in reversed(path)]
+
+    def results_data(self):
+        """
+        Résume l'arbre dans un dictionnaire sérialisable en JSON.
+
+        Returns:
+            dict: Chemin et coût de chaque but atteint, buts non atteints
+        """
+        return {
+            "algorithm": "One-to-many Search",
+            "start_node": self.start_node,
+            "routes": [{"goal": goal, "path": self.path_to(goal), "path_cost": self.cost_to(goal)}
+                       for goal in self.reached_goals],
+            "unreached_goals": self.unreached_goals,
+            "complete": self.complete,
+            "steps_count": self.expansions
+        }
+
 
 class BestFirstSearch:
     """
     Implémentation de l'algorithme Best-First Search (recherche meilleur d'abord).
     Cet algorithme utilise une fonction heuristique pour guider la recherche vers le but.
+
+    L'ordre d'exploration est donné par une fonction de priorité f(g, h), où g
+    est le coût du chemin depuis le départ et h l'heuristique : glouton par
+    défaut, A*, A* pondéré ou coût uniforme (voir make_priority).
+
+    La recherche s'exécute sur l'instantané CSR renvoyé par graph.compile() :
+    la boucle principale ne manipule que des indices entiers et des listes,
+    sans aucun appel à networkx.
+
+    L'heuristique h est par défaut la valeur stockée de chaque nœud ; une
+    heuristique calculée pour le but de chaque requête (voir heuristics)
+    peut être passée à la recherche ou définie sur le graphe.
     """
 
-    
-    
-    def __init__(self, graph):
+    def __init__(self, graph, trace='full', open_list='heap', priority='greedy', epsilon=1.0,
+                 heuristic=None):
         """
         Initialise l'algorithme avec un graphe.
         
         Args:
             graph: Instance de la classe Graph contenant le graphe à explorer
+            trace: Niveau d'instrumentation parmi TRACE_LEVELS ('none',
+                'expansions', 'delta' ou 'full', valeur par défaut)
+            open_list: Implémentation de la liste ouverte, nom de OPEN_LISTS
+                ('heap' : tas à suppression paresseuse, 'indexed' : tas
+                indexé avec decrease-key) ou classe compatible
+            priority: Mode de recherche parmi SEARCH_MODES ou fonction f(g, h)
+            epsilon: Poids de l'heuristique pour le mode 'weighted_astar'
+            heuristic: Heuristique calculée (voir heuristics.make_heuristic) ;
+                par défaut celle du graphe (Graph.set_heuristic), sinon les
+                valeurs stockées des nœuds
         """
+        if trace not in TRACE_LEVELS:
+            raise ValueError(f"Niveau de trace inconnu: {trace}")
+        if getattr(graph, 'implicit', False):
+            if trace not in ('none', 'expansions'):
+                raise ValueError(f"Niveau de trace non disponible sur un graphe implicite: {trace}")
+            if heuristic is not None:
+                raise ValueError("Un graphe implicite fournit sa propre heuristique")
+        if isinstance(open_list, str):
+            if open_list not in OPEN_LISTS:
+                raise ValueError(f"Liste ouverte inconnue: {open_list}")
+            open_list = OPEN_LISTS[open_list]
+        if isinstance(priority, str):
+            self.mode = priority
+            priority = make_priority(priority, epsilon)
+        else:
+            self.mode = priority.__name__
+        
         self.graph = graph
-        self.visited = set()
-        self.path = {}  # Pour reconstruire le chemin
+        self.trace = trace
+        self.open_list_factory = open_list
+        self.priority = priority
+        self.epsilon = epsilon
+        self.heuristic = make_heuristic(heuristic)
+        self.path_cost = None  # Coût du chemin trouvé par la dernière recherche
+        self.start_node = None  # Nœuds de départ et d'arrivée de la dernière recherche
+        self.goal_node = None
+        self.compiled = None  # Instantané utilisé par la dernière recherche
         self.expanded_nodes = []  # Liste des nœuds dans l'ordre où ils ont été explorés
-        self.open_set = []  # File de priorité (heap) pour les nœuds à explorer
+        self.expansions = 0  # Nombre de nœuds développés, quel que soit le niveau de trace
+        self.progress = None  # Fonction appelée avec self.expansions toutes les PROGRESS_INTERVAL expansions
+        self._cancel_requested = False
+        self._heuristic_memo = None  # Valeurs calculées de la dernière recherche
+        self.observers = []  # Observateurs notifiés par search() (voir add_observer)
+        
+        # États internes, indexés par les entiers du graphe compilé
+        self._closed = set()
+        self._parents = {}  # Pour reconstruire le chemin
+        self._open_set = open_list()  # File de priorité pour les nœuds à explorer
+    
+    @property
+    def visited(self):
+        """Ensemble des nœuds visités par la dernière recherche."""
+        if self.compiled is None:
+            return set()
+        node_ids = self.compiled.node_ids
+        return {node_ids[node] for node in self._closed}
+    
+    @property
+    def path(self):
+        """Liens parents (nœud -> parent) établis par la dernière recherche."""
+        if self.compiled is None:
+            return {}
+        node_ids = self.compiled.node_ids
+        return {node_ids[node]: node_ids[parent] for node, parent in self._parents.items()}
     
-    def search(self):
+    @property
+    def open_set(self):
+        """File de priorité restante, au format (priorité, node_id, parent)."""
+        if self.compiled is None:
+            return []
+        return self._entries_to_ids(self._open_set.entries())
+    
+    def cancel(self):
+        """
+        Demande l'arrêt de la recherche en cours.
+        
+        Peut être appelée depuis un autre thread : la boucle de recherche
+        vérifie la demande toutes les PROGRESS_INTERVAL expansions et lève
+        alors SearchCancelled.
+        """
+        self._cancel_requested = True
+    
+    def add_observer(self, observer):
+        """
+        Ajoute un observateur des événements de la recherche.
+        
+        Seule la boucle de BestFirstSearch.search notifie les observateurs :
+        les variantes qui la remplacent (bidirectionnelle, faisceau, mémoire
+        bornée) les refusent.
+        
+        Args:
+            observer: Instance de observers.SearchObserver (par exemple
+                observers.MetricsCollector)
+        """
+        if type(self).search is not BestFirstSearch.search:
+            raise ValueError(f"{type(self).__name__} ne prend pas en charge les observateurs")
+        self.observers.append(observer)
+    
+    def remove_observer(self, observer):
+        """Retire un observateur ajouté par add_observer."""
+        self.observers.remove(observer)
+    
+    def search(self, start=None, goal=None):
         """
         Exécute l'algorithme Best-First Search sur le graphe.
         
+        Args:
+            start: Nœud de départ (par défaut graph.start_node)
+            goal: Nœud objectif (par défaut graph.goal_node)
+        
+        Les nœuds passés en argument ne modifient pas le graphe : plusieurs
+        requêtes peuvent partager le même graphe sans se gêner.
+        
         Returns:
             tuple: (chemin, nœuds_explorés, steps) où:
                 - chemin est la liste des nœuds formant le chemin de la solution
                 - nœuds_explorés est la liste des nœuds visités dans l'ordre
                 - steps est une liste d'états pour visualiser l'exécution étape par étape
-        """
-        if not self.graph.start_node or not self.graph.goal_node:
-            raise ValueError("Les nœuds de départ et d'arrivée doivent être définis")
+                  (une SearchTrace avec le niveau de trace 'delta')
+            Avec les niveaux 'none' et 'expansions', les listes non
+            instrumentées sont renvoyées vides ; self.expansions reste à jour.
+            Le coût du chemin trouvé est disponible dans self.path_cost.
         
-        start = self.graph.start_node
-        goal = self.graph.goal_node
+        Si cancel() est appelée pendant la recherche, SearchCancelled est levée.
         
-        # Réinitialiser les structures de données
-        self.visited = set()
-        self.path = {}
-        self.expanded_nodes = []
-        self.open_set = []
+        Les modes A* et coût uniforme ne renvoient un chemin optimal que si
+        l'heuristique est cohérente : un nœud visité n'est jamais rouvert.
         
-        # Pour garder une trace de chaque étape pour la visualisation
-        steps = []
+        Un graphe implicite (implicit_graph.ImplicitGraph) est exploré à la
+        demande par _search_implicit ; chemin et nœuds explorés contiennent
+        alors des états.
+        """
+        if getattr(self.graph, 'implicit', False):
+            return self._search_implicit(start, goal)
+        compiled, start, goal = self._prepare_query(start, goal)
+        indptr, indices, weights, heuristics = compiled.adjacency_lists()
+        heuristics, prefetch = self._heuristic_values(compiled, goal, heuristics)
+        priority = self.priority
+        greedy = priority is greedy_priority
+        node_ids = compiled.node_ids
+        
+        # Réinitialiser les structures de données
+        self._closed = closed = set()
+        self._parents = parents = {}
+        self._open_set = open_set = self.open_list_factory()
+        push = open_set.push
+        pop = open_set.pop
+        self.expanded_nodes = expanded_nodes = []
+        self.expansions = 0
+        self.path_cost = None
+        self._cancel_requested = False
+        progress = self.progress
+        observer = combine_observers(self.observers)
+        if observer is not None:
+            observer.on_start(self, node_ids[start], node_ids[goal])
+            pushed = []  # Entrées ajoutées par l'expansion en cours, notifiées après mesure
+            clock = time.perf_counter
         
         # Ajouter le nœud de départ à la file de priorité
-        # Format (heuristic, node_id, parent)
-        heapq.heappush(self.open_set, (self.graph.get_heuristic(start), start, None))
+        # Format (priorité, node_index, parent_index, g), -1 pour l'absence de parent
+        start_entry = (priority(0.0, heuristics[start]), start, -1, 0.0)
+        push(start_entry)
+        if observer is not None:
+            observer.on_push(node_ids[start], None, start_entry[0], 0.0)
         
-        while self.open_set:
-            # Prendre le nœud avec la plus petite valeur heuristique
-            _, current, parent = heapq.heappop(self.open_set)
+        # Pour garder une trace de chaque étape pour la visualisation
+        record_expansions = self.trace != 'none'
+        full_trace = self.trace == 'full'
+        delta = None
+        if self.trace == 'delta':
+            delta = SearchTrace(start_entry, node_ids, self.open_list_factory)
+        steps = delta if delta is not None else []
+        stale_pops = 0
+        
+        while open_set:
+            # Prendre le nœud avec la plus petite priorité
+            _, current, parent, cost = pop()
             
             # Si le nœud a déjà été visité, passer au suivant
-            if current in self.visited:
+            if current in closed:
+                if delta is not None:
+                    stale_pops += 1
+                if observer is not None:
+                    observer.on_pop(node_ids[current], True)
                 continue
+            if observer is not None:
+                observer.on_pop(node_ids[current], False)
             
             # Marquer le nœud comme visité
-            self.visited.add(current)
-            self.expanded_nodes.append(current)
+            closed.add(current)
+            self.expansions += 1
+            if not self.expansions % PROGRESS_INTERVAL:
+                if self._cancel_requested:
+                    raise SearchCancelled(f"Recherche annulée après {self.expansions} expansions")
+                if progress is not None:
+                    progress(self.expansions)
             
             # Enregistrer le parent pour reconstruire le chemin
-            if parent:
-                self.path[current] = parent
+            if parent >= 0:
+                parents[current] = parent
             
             # Enregistrer l'état actuel pour la visualisation
-            steps.append({
-                'current': current,
-                'open_set': list(self.open_set),
-                'visited': list(self.visited),
-                'path_so_far': self._reconstruct_path(current)
-            })
+            if record_expansions:
+                expanded_nodes.append(node_ids[current])
+                if full_trace:
+                    steps.append({
+                        'current': node_ids[current],
+                        'open_set': self._entries_to_ids(open_set.entries()),
+                        'visited': [node_ids[node] for node in closed],
+                        'path_so_far': self._reconstruct_path(current)
+                    })
+                elif delta is not None:
+                    delta.record_expansion(current, parent, stale_pops)
+                    stale_pops = 0
             
             # Si nous avons atteint l'objectif, terminer la recherche
             if current == goal:
                 # Reconstruire et retourner le chemin trouvé
                 path = self._reconstruct_path(current)
-                return path, self.expanded_nodes, steps
+                self.path_cost = cost
+                if observer is not None:
+                    observer.on_goal(node_ids[current], cost)
+                    observer.on_finish(self, path)
+                return path, expanded_nodes, steps
             
             # Explorer les voisins non visités
-            for neighbor in self.graph.get_neighbors(current):
-                if neighbor not in self.visited:
-                    # Ajouter le voisin à la file de priorité avec sa valeur heuristique
-                    heapq.heappush(
-                        self.open_set, 
-                        (self.graph.get_heuristic(neighbor), neighbor, current)
-                    )
+            if observer is not None:
+                started = clock()
+            if prefetch is not None:
+                prefetch(indptr[current], indptr[current + 1])
+            for k in range(indptr[current], indptr[current + 1]):
+                neighbor = indices[k]
+                if neighbor not in closed:
+                    # Ajouter le voisin à la file de priorité avec sa priorité f(g, h)
+                    g = cost + weights[k]
+                    if greedy:
+                        entry = (heuristics[neighbor], neighbor, current, g)
+                    else:
+                        entry = (priority(g, heuristics[neighbor]), neighbor, current, g)
+                    push(entry)
+                    if delta is not None:
+                        delta.record_push(entry)
+                    if observer is not None:
+                        pushed.append(entry)
+            if observer is not None:
+                elapsed = clock() - started
+                for entry in pushed:
+                    observer.on_push(node_ids[entry[1]], node_ids[current], entry[0], entry[3])
+                pushed.clear()
+                observer.on_expand(node_ids[current], cost, len(open_set), elapsed)
         
         # Si aucun chemin n'est trouvé
-        return None, self.expanded_nodes, steps
+        if observer is not None:
+            observer.on_finish(self, None)
+        return None, expanded_nodes, steps
+    
+    def search_many(self, start=None, goals=None, max_expansions=None):
+        """
+        Explore le graphe une seule fois depuis un départ vers plusieurs buts.
+        
+        Les nœuds sont développés par coût croissant depuis le départ
+        (Dijkstra), quel que soit le mode de la recherche : c'est le seul
+        ordre où le coût d'un nœud développé est définitif pour tous les buts
+        à la fois, et les heuristiques ne portent que sur un but. La
+        recherche s'arrête dès que tous les buts sont développés, ou quand
+        le budget d'expansions est épuisé.
+        
+        Args:
+            start: Nœud de départ (par défaut graph.start_node)
+            goals: Identifiants des buts ; None explore tout ce qui est
+                accessible depuis le départ
+            max_expansions: Nombre maximal de nœuds développés (optionnel)
+            
+        Returns:
+            ShortestPathTree: Arbre réutilisable ; path_to et cost_to
+                répondent pour tout nœud développé, but ou non
+        
+        Les poids doivent être positifs ou nuls. self.expansions et, selon
+        le niveau de trace, self.expanded_nodes sont mis à jour ; les
+        observateurs ne sont pas notifiés.
+        """
+        if start is None:
+            start = getattr(self.graph, 'start_node', None)
+        if start is None:
+            raise ValueError("Le nœud de départ doit être défini")
+        if max_expansions is not None and max_expansions < 1:
+            raise ValueError("Le budget d'expansions doit être au moins 1")
+        if goals is not None:
+            goals = list(goals)  # Parcourus deux fois : validation puis indexation
+        compiled = self.graph.compile()
+        index = compiled.index
+        for node in [start] + (goals or []):
+            if node not in index:
+                raise ValueError(f"Le nœud {node} n'existe pas dans le graphe")
+        self.start_node = start
+        self.goal_node = None
+        self.compiled = compiled
+        start = index[start]
+        if goals is not None:
+            goals = list(dict.fromkeys(index[goal] for goal in goals))
+        
+        indptr, indices, weights, _ = compiled.adjacency_lists()
+        node_ids = compiled.node_ids
+        num_nodes = compiled.num_nodes
+        distances = [float('inf')] * num_nodes
+        parents = [-1] * num_nodes
+        settled = bytearray(num_nodes)
+        remaining = set(goals) if goals is not None else None
+        
+        self.expanded_nodes = expanded_nodes = []
+        self.expansions = expansions = 0
+        self.path_cost = None
+        self._cancel_requested = False
+        progress = self.progress
+        record_expansions = self.trace != 'none'
+        
+        distances[start] = 0.0
+        heap = [(0.0, start, -1)] if remaining != set() else []
+        pop = heapq.heappop
+        push = heapq.heappush
+        while heap:
+            cost, current, parent = pop(heap)
+            if settled[current]:
+                continue  # Entrée obsolète
+            settled[current] = 1
+            parents[current] = parent
+            expansions += 1
+            if not expansions % PROGRESS_INTERVAL:
+                self.expansions = expansions
+                if self._cancel_requested:
+                    raise SearchCancelled(f"Recherche annulée après {expansions} expansions")
+                if progress is not None:
+                    progress(expansions)
+            if record_expansions:
+                expanded_nodes.append(node_ids[current])
+            if remaining is not None:
+                remaining.discard(current)
+                if not remaining:
+                    break
+            if expansions == max_expansions:
+                break
+            
+            for k in range(indptr[current], indptr[current + 1]):
+                neighbor = indices[k]
+                g = cost + weights[k]
+                if g < distances[neighbor]:
+                    distances[neighbor] = g
+                    push(heap, (g, neighbor, current))
+        
+        self.expansions = expansions
+        return ShortestPathTree(compiled, start, goals, distances, parents, settled, expansions)
+    
+    def _search_implicit(self, start, goal):
+        """
+        Boucle de search() sur un graphe implicite.
+        
+        Les successeurs sont générés à la demande et les nœuds visités ne
+        sont mémorisés que par leur empreinte (graph.fingerprint) ; seule la
+        frontière garde des états. Les états n'étant pas forcément
+        comparables, les priorités égales sont départagées par ordre
+        d'insertion (premier inséré, premier développé) et non par indice
+        de nœud comme sur un graphe compilé : à priorités égales, l'ordre
+        d'exploration et le chemin trouvé peuvent donc différer (le coût
+        reste optimal pour ucs et astar avec une heuristique cohérente).
+        Le chemin est retrouvé en régénérant les successeurs le long de la
+        chaîne des empreintes. La liste ouverte est toujours un tas à
+        suppression paresseuse (option open_list ignorée), et l'objectif
+        peut être un état ou la condition graph.is_goal.
+        """
+        graph = self.graph
+        if start is None:
+            start = graph.start_node
+        if start is None:
+            raise ValueError("L'état de départ doit être défini")
+        if goal is None:
+            goal = graph.goal_node
+            is_goal = graph.is_goal
+        else:
+            def is_goal(state):
+                return state == goal
+        self.start_node = start
+        self.goal_node = goal
+        self.compiled = None
+        successors = graph.successors
+        heuristic = graph.heuristic
+        fingerprint = graph.fingerprint
+        priority = self.priority
+        greedy = priority is greedy_priority
+        
+        self._closed = closed = set()  # Empreintes des états développés
+        self._parents = parents = {}  # Empreinte -> empreinte du parent
+        self._open_set = self.open_list_factory()  # Non utilisée : états dans heap
+        self._heuristic_memo = None
+        self.expanded_nodes = expanded_nodes = []
+        self.expansions = 0
+        self.path_cost = None
+        self._cancel_requested = False
+        progress = self.progress
+        record_expansions = self.trace != 'none'
+        observer = combine_observers(self.observers)
+        if observer is not None:
+            observer.on_start(self, start, goal)
+            clock = time.perf_counter
+        
+        # Entrées (priorité, ordre d'insertion, état, empreinte du parent, g) :
+        # l'ordre d'insertion départage les égalités sans comparer les états
+        order = count()
+        heap = [(priority(0.0, heuristic(start)), next(order), start, None, 0.0)]
+        push = heapq.heappush
+        pop = heapq.heappop
+        if observer is not None:
+            observer.on_push(start, None, heap[0][0], 0.0)
+        
+        while heap:
+            _, _, current, parent, cost = pop(heap)
+            key = fingerprint(current)
+            if key in closed:
+                if observer is not None:
+                    observer.on_pop(current, True)
+                continue
+            if observer is not None:
+                observer.on_pop(current, False)
+            closed.add(key)
+            self.expansions += 1
+            if not self.expansions % PROGRESS_INTERVAL:
+                if self._cancel_requested:
+                    raise SearchCancelled(f"Recherche annulée après {self.expansions} expansions")
+                if progress is not None:
+                    progress(self.expansions)
+            if parent is not None:
+                parents[key] = parent
+            if record_expansions:
+                expanded_nodes.append(current)
+            
+            if is_goal(current):
+                path = self._rederive_path(start, key, current)
+                self.path_cost = cost
+                if observer is not None:
+                    observer.on_goal(current, cost)
+                    observer.on_finish(self, path)
+                return path, expanded_nodes, []
+            
+            if observer is not None:
+                started = clock()
+                pushed = []
+            for neighbor, weight in successors(current):
+                if fingerprint(neighbor) not in closed:
+                    g = cost + weight
+                    if greedy:
+                        value = heuristic(neighbor)
+                    else:
+                        value = priority(g, heuristic(neighbor))
+                    push(heap, (value, next(order), neighbor, key, g))
+                    if observer is not None:
+                        pushed.append((neighbor, value, g))
+            if observer is not None:
+                elapsed = clock() - started
+                for neighbor, value, g in pushed:
+                    observer.on_push(neighbor, current, value, g)
+                observer.on_expand(current, cost, len(heap), elapsed)
+        
+        if observer is not None:
+            observer.on_finish(self, None)
+        return None, expanded_nodes, []
+    
+    def _rederive_path(self, start, goal_key, goal_state):
+        """
+        Retrouve les états du chemin à partir des empreintes enregistrées.
+        
+        La chaîne des parents ne contient que des empreintes : depuis le
+        départ, le successeur dont l'empreinte est la suivante de la chaîne
+        est régénéré, en O(longueur du chemin × nombre de successeurs).
+        """
+        graph = self.graph
+        fingerprint = graph.fingerprint
+        keys = [goal_key]
+        while keys[-1] in self._parents:
+            keys.append(self._parents[keys[-1]])
+        keys.reverse()
+        
+        path = [start]
+        for key in keys[1:-1]:
+            for neighbor, _ in graph.successors(path[-1]):
+                if fingerprint(neighbor) == key:
+                    path.append(neighbor)
+                    break
+            else:
+                raise ValueError("Chemin introuvable en régénérant les successeurs : "
+                                 "successors() doit être déterministe")
+        if len(keys) > 1:
+            path.append(goal_state)
+        return path
+    
+    def _prepare_query(self, start, goal):
+        """
+        Valide une requête et compile le graphe.
+        
+        Args:
+            start: Nœud de départ (par défaut graph.start_node)
+            goal: Nœud objectif (par défaut graph.goal_node)
+            
+        Returns:
+            tuple: (graphe compilé, indice du départ, indice de l'arrivée)
+        """
+        if start is None:
+            start = getattr(self.graph, 'start_node', None)
+        if goal is None:
+            goal = getattr(self.graph, 'goal_node', None)
+        if start is None or goal is None:
+            raise ValueError("Les nœuds de départ et d'arrivée doivent être définis")
+        
+        compiled = self.graph.compile()
+        for node in (start, goal):
+            if node not in compiled.index:
+                raise ValueError(f"Le nœud {node} n'existe pas dans le graphe")
+        self.start_node = start
+        self.goal_node = goal
+        self.compiled = compiled
+        return compiled, compiled.index[start], compiled.index[goal]
+    
+    def signature(self):
+        """
+        Paramètres dont dépend le résultat d'une recherche.
+        
+        Sert de clé, avec le graphe et les nœuds de la requête, au cache de
+        requêtes (voir query_cache). L'heuristique calculée y figure par sa
+        signature (voir Heuristic.signature).
+        
+        Returns:
+            tuple: Valeurs sérialisables en JSON, ou None si l'heuristique
+                n'a pas d'identité stable (la requête n'est pas mise en cache)
+        """
+        heuristic = self.heuristic
+        if heuristic is None:
+            heuristic = getattr(self.graph, 'heuristic', None)
+        heuristic_signature = None
+        if heuristic is not None:
+            heuristic_signature = heuristic.signature()
+            if heuristic_signature is None:
+                return None
+        return (type(self).__name__, self.mode, self.epsilon, self.open_list_factory.__name__,
+                heuristic_signature)
+    
+    def _heuristic_values(self, compiled, goal, heuristics):
+        """
+        Choisit les valeurs heuristiques d'une requête.
+        
+        Args:
+            compiled: Graphe compilé de la requête
+            goal: Indice du nœud objectif
+            heuristics: Valeurs stockées (voir CompiledGraph.adjacency_lists)
+            
+        Returns:
+            tuple: (heuristics, prefetch) où heuristics s'indexe par nœud et
+                prefetch(début, fin), s'il n'est pas None, évalue en un appel
+                les successeurs indices[début:fin] d'un nœud développé
+        """
+        heuristic = self.heuristic
+        if heuristic is None:
+            heuristic = getattr(self.graph, 'heuristic', None)
+        if heuristic is None:
+            self._heuristic_memo = None
+            return heuristics, None
+        
+        self._heuristic_memo = memo = heuristic.bind(compiled, goal)
+        if not heuristic.vectorized:
+            return memo, None
+        targets = compiled.adjacency_lists()[1]
+        
+        def prefetch(begin, end):
+            memo.prefetch(targets[begin:end])
+        return memo, prefetch
+    
+    def results_data(self, path, expanded_nodes):
+        """
+        Résume la dernière recherche dans un dictionnaire sérialisable en JSON.
+        
+        C'est le format des fichiers de résultats écrits par l'application
+        et par la ligne de commande.
+        
+        Args:
+            path: Chemin renvoyé par search()
+            expanded_nodes: Nœuds explorés renvoyés par search()
+            
+        Returns:
+            dict: Données des résultats
+        """
+        results = {
+            "algorithm": "Best-First Search",
+            "mode": self.mode,
+            "start_node": self.start_node,
+            "goal_node": self.goal_node,
+            "path": path if path else [],
+            "path_cost": self.path_cost,
+            "expanded_nodes": expanded_nodes,
+            "steps_count": self.expansions
+        }
+        if self._heuristic_memo is not None:
+            heuristic = self.heuristic or self.graph.heuristic
+            results["heuristic"] = heuristic.name
+            results["heuristic_evaluations"] = self._heuristic_memo.evaluations
+        for observer in self.observers:
+            if isinstance(observer, MetricsCollector) and observer.finished:
+                results["metrics"] = observer.summary()
+                break
+        return results
+    
+    def _entries_to_ids(self, entries):
+        """Traduit des entrées de la file en identifiants de nœuds."""
+        node_ids = self.compiled.node_ids
+        return [(priority, node_ids[node], node_ids[parent] if parent >= 0 else None)
+                for priority, node, parent, _ in entries]
     
     def _reconstruct_path(self, node):
         """
         Reconstruit le chemin du nœud de départ jusqu'au nœud actuel.
         
         Args:
-            node: Nœud actuel
+            node: Indice du nœud actuel dans le graphe compilé
             
         Returns:
-            list: Liste des nœuds formant le chemin
+            list: Liste des identifiants des nœuds formant le chemin
         """
         path = [node]
-        while node in self.path:
-            node = self.path[node]
+        while node in self._parents:
+            node = self._parents[node]
             path.append(node)
         
         # Inverser le chemin pour qu'il commence par le nœud de départ
-        return path[::-1]
\ No newline at end of file
+        node_ids = self.compiled.node_ids
+        return [node_ids[node] for node in reversed(path)]
+
+
+class AStarSearch(BestFirstSearch):
+    """Recherche A* : f = g + h."""
+    def __init__(self, graph, **kwargs):
+        super().__init__(graph, priority='astar', **kwargs)
+
+
+class WeightedAStarSearch(BestFirstSearch):
+    """Recherche A* pondérée : f = g + ε·h."""
+    def __init__(self, graph, epsilon=1.5, **kwargs):
+        super().__init__(graph, priority='weighted_astar', epsilon=epsilon, **kwargs)
+
+
+class UniformCostSearch(BestFirstSearch):
+    """Recherche à coût uniforme : f = g, l'heuristique est ignorée."""
+    def __init__(self, graph, **kwargs):
+        super().__init__(graph, priority='ucs', **kwargs)
+
+
+class BidirectionalSearch(BestFirstSearch):
+    """
+    Recherche meilleur d'abord bidirectionnelle.
+
+    Deux frontières progressent en même temps : vers l'avant depuis le
+    départ (successeurs) et vers l'arrière depuis l'arrivée (prédécesseurs,
+    voir CompiledGraph.reverse_adjacency_lists). La plus petite des deux
+    frontières est développée à chaque itération. Vers l'arrière,
+    l'heuristique estime la distance au départ par max(0, h(départ) - h(n)).
+
+    Règle d'arrêt, μ étant le coût du meilleur chemin trouvé par rencontre :
+    - 'ucs' : g_min(avant) + g_min(arrière) >= μ ;
+    - 'astar', 'weighted_astar' : max(f_min(avant), f_min(arrière)) >= μ ;
+    - 'greedy' ou priorité personnalisée : première rencontre des frontières.
+
+    Comme pour la recherche simple, 'ucs' et 'astar' ne garantissent un
+    chemin optimal que si l'heuristique est cohérente (dans les deux sens
+    pour 'astar'). Seuls les niveaux de trace 'none' et 'expansions' sont
+    disponibles : steps est toujours renvoyé vide.
+    """
+    def __init__(self, graph, trace='expansions', open_list='heap', priority='greedy', epsilon=1.0,
+                 heuristic=None):
+        if trace not in ('none', 'expansions'):
+            raise ValueError(f"Niveau de trace non disponible en recherche bidirectionnelle: {trace}")
+        super().__init__(graph, trace=trace, open_list=open_list, priority=priority, epsilon=epsilon,
+                         heuristic=heuristic)
+        self._priority_option = priority  # Pour relancer la même recherche dans un seul sens
+        self.forward_expansions = 0
+        self.backward_expansions = 0
+        self.meeting_node = None  # Nœud où les deux moitiés du chemin se rejoignent
+    
+    def search(self, start=None, goal=None):
+        """
+        Exécute la recherche depuis les deux extrémités.
+        
+        Args:
+            start: Nœud de départ (par défaut graph.start_node)
+            goal: Nœud objectif (par défaut graph.goal_node)
+            
+        Returns:
+            tuple: (chemin, nœuds_explorés, steps) comme BestFirstSearch.search ;
+                nœuds_explorés mêle les deux directions dans l'ordre des expansions
+        """
+        compiled, start, goal = self._prepare_query(start, goal)
+        indptr, indices, weights, heuristics = compiled.adjacency_lists()
+        heuristics, _ = self._heuristic_values(compiled, goal, heuristics)
+        rindptr, rindices, rweights = compiled.reverse_adjacency_lists()
+        priority = self.priority
+        node_ids = compiled.node_ids
+        h_start = heuristics[start]
+        if self.mode == 'ucs':
+            stop_rule = 'sum'
+        elif self.mode in ('astar', 'weighted_astar'):
+            stop_rule = 'max'
+        else:
+            stop_rule = 'meet'
+        
+        # Une entrée par direction : 0 vers l'avant, 1 vers l'arrière
+        adjacency = ((indptr, indices, weights), (rindptr, rindices, rweights))
+        open_sets = (self.open_list_factory(), self.open_list_factory())
+        closed = (set(), set())
+        best = ({start: (0.0, -1)}, {goal: (0.0, -1)})  # nœud -> (meilleur g connu, parent)
+        open_sets[0].push((priority(0.0, h_start), start, -1, 0.0))
+        open_sets[1].push((priority(0.0, max(0.0, h_start - heuristics[goal])), goal, -1, 0.0))
+        
+        self.expanded_nodes = expanded_nodes = []
+        self.expansions = 0
+        self.path_cost = None
+        self.meeting_node = None
+        self._cancel_requested = False
+        progress = self.progress
+        record_expansions = self.trace != 'none'
+        expansions = [0, 0]
+        mu = float('inf')
+        meeting = start if start == goal else None
+        if meeting is not None:
+            mu = 0.0
+        
+        while open_sets[0] and open_sets[1]:
+            if meeting is not None:
+                if stop_rule == 'meet':
+                    break
+                top_forward = open_sets[0].peek()[0]
+                top_backward = open_sets[1].peek()[0]
+                if stop_rule == 'sum' and top_forward + top_backward >= mu:
+                    break
+                if stop_rule == 'max' and max(top_forward, top_backward) >= mu:
+                    break
+            
+            # Développer la plus petite frontière
+            side = 0 if len(open_sets[0]) <= len(open_sets[1]) else 1
+            _, current, _, _ = open_sets[side].pop()
+            if current in closed[side]:
+                continue
+            closed[side].add(current)
+            expansions[side] += 1
+            self.expansions += 1
+            if not self.expansions % PROGRESS_INTERVAL:
+                if self._cancel_requested:
+                    raise SearchCancelled(f"Recherche annulée après {self.expansions} expansions")
+                if progress is not None:
+                    progress(self.expansions)
+            if record_expansions:
+                expanded_nodes.append(node_ids[current])
+            
+            # Le meilleur g connu fait foi : il correspond à la chaîne de parents enregistrée
+            own_best = best[side]
+            other_best = best[1 - side]
+            own_closed = closed[side]
+            push = open_sets[side].push
+            ptr, targets, costs = adjacency[side]
+            cost = own_best[current][0]
+            for k in range(ptr[current], ptr[current + 1]):
+                neighbor = targets[k]
+                if neighbor in own_closed:
+                    continue
+                g = cost + costs[k]
+                known = own_best.get(neighbor)
+                if known is not None and known[0] <= g:
+                    continue
+                own_best[neighbor] = (g, current)
+                h = heuristics[neighbor] if side == 0 else max(0.0, h_start - heuristics[neighbor])
+                push((priority(g, h), neighbor, current, g))
+                
+                # Rencontre avec l'autre frontière
+                other = other_best.get(neighbor)
+                if other is not None and g + other[0] < mu:
+                    mu = g + other[0]
+                    meeting = neighbor
+        
+        self.forward_expansions, self.backward_expansions = expansions
+        self._closed = closed[0] | closed[1]
+        self._parents = {node: parent for node, (_, parent) in best[0].items() if parent >= 0}
+        self._open_set = open_sets[0]
+        if meeting is None:
+            return None, expanded_nodes, []
+        
+        self.meeting_node = node_ids[meeting]
+        self.path_cost = best[0][meeting][0] + best[1][meeting][0]
+        return self._join_path(best, meeting), expanded_nodes, []
+    
+    def _join_path(self, best, meeting):
+        """Assemble les deux moitiés du chemin autour du nœud de rencontre."""
+        node_ids = self.compiled.node_ids
+        forward = [meeting]
+        while best[0][forward[-1]][1] >= 0:
+            forward.append(best[0][forward[-1]][1])
+        backward = []
+        node = best[1][meeting][1]
+        while node >= 0:
+            backward.append(node)
+            node = best[1][node][1]
+        return [node_ids[node] for node in reversed(forward)] + [node_ids[node] for node in backward]
+    
+    def compare_with_unidirectional(self, start=None, goal=None):
+        """
+        Compare le nombre d'expansions avec BestFirstSearch.search sur la même requête.
+        
+        Args:
+            start: Nœud de départ (par défaut graph.start_node)
+            goal: Nœud objectif (par défaut graph.goal_node)
+            
+        Returns:
+            dict: Expansions et coûts des deux recherches, et expansions économisées
+        """
+        self.search(start, goal)
+        single = BestFirstSearch(self.graph, trace='none', open_list=self.open_list_factory,
+                                 priority=self._priority_option, epsilon=self.epsilon,
+                                 heuristic=self.heuristic)
+        single.search(start, goal)
+        return {
+            'mode': self.mode,
+            'unidirectional_expansions': single.expansions,
+            'bidirectional_expansions': self.expansions,
+            'forward_expansions': self.forward_expansions,
+            'backward_expansions': self.backward_expansions,
+            'expansions_saved': single.expansions - self.expansions,
+            'unidirectional_cost': single.path_cost,
+            'bidirectional_cost': self.path_cost
+        }
+    
+    def results_data(self, path, expanded_nodes):
+        """Résultats au format de BestFirstSearch, avec le détail des deux directions."""
+        results = super().results_data(path, expanded_nodes)
+        results.update({
+            "algorithm": "Bidirectional Best-First Search",
+            "meeting_node": self.meeting_node,
+            "forward_expansions": self.forward_expansions,
+            "backward_expansions": self.backward_expansions
+        })
+        return results
+
+
+class BeamSearch(BestFirstSearch):
+    """
+    Recherche en faisceau (beam search) de largeur k.
+
+    La recherche progresse par niveaux : tous les nœuds du faisceau sont
+    développés, puis seuls les k meilleurs successeurs (selon la priorité
+    du mode choisi) forment le faisceau suivant. La mémoire de la frontière
+    est bornée par k × degré sortant.
+
+    La recherche n'est ni complète ni optimale : un nœud écarté du faisceau
+    n'est jamais reconsidéré, si bien qu'un chemin existant peut être manqué.
+    Seuls les niveaux de trace 'none' et 'expansions' sont disponibles.
+    """
+    def __init__(self, graph, width, trace='expansions', priority='greedy', epsilon=1.0, **kwargs):
+        """
+        Args:
+            graph: Graph ou CompiledGraph à explorer
+            width: Largeur k du faisceau
+            trace: 'none' ou 'expansions'
+            priority: Mode de recherche parmi SEARCH_MODES ou fonction f(g, h)
+            epsilon: Poids de l'heuristique pour le mode 'weighted_astar'
+            **kwargs: Autres options de BestFirstSearch (open_list, heuristic)
+        """
+        if trace not in ('none', 'expansions'):
+            raise ValueError(f"Niveau de trace non disponible en recherche en faisceau: {trace}")
+        if width < 1:
+            raise ValueError("La largeur du faisceau doit être au moins 1")
+        super().__init__(graph, trace=trace, priority=priority, epsilon=epsilon, **kwargs)
+        self.width = width
+        self.peak_frontier = 0  # Plus grand nombre de candidats d'un niveau
+        self.pruned_entries = 0  # Candidats écartés du faisceau
+    
+    def search(self, start=None, goal=None):
+        """
+        Exécute la recherche en faisceau.
+        
+        Args:
+            start: Nœud de départ (par défaut graph.start_node)
+            goal: Nœud objectif (par défaut graph.goal_node)
+            
+        Returns:
+            tuple: (chemin, nœuds_explorés, steps) comme BestFirstSearch.search ;
+                steps est toujours vide
+        """
+        compiled, start, goal = self._prepare_query(start, goal)
+        indptr, indices, weights, heuristics = compiled.adjacency_lists()
+        heuristics, prefetch = self._heuristic_values(compiled, goal, heuristics)
+        priority = self.priority
+        node_ids = compiled.node_ids
+        width = self.width
+        
+        self._closed = closed = set()
+        self._parents = parents = {}
+        self._open_set = self.open_list_factory()
+        self.expanded_nodes = expanded_nodes = []
+        self.expansions = 0
+        self.path_cost = None
+        self.peak_frontier = 1
+        self.pruned_entries = 0
+        self._cancel_requested = False
+        progress = self.progress
+        record_expansions = self.trace != 'none'
+        
+        beam = [(priority(0.0, heuristics[start]), start, -1, 0.0)]
+        while beam:
+            candidates = {}  # nœud -> meilleure entrée du niveau suivant
+            for entry in beam:
+                _, current, parent, cost = entry
+                if current in closed:
+                    continue
+                closed.add(current)
+                self.expansions += 1
+                if not self.expansions % PROGRESS_INTERVAL:
+                    if self._cancel_requested:
+                        raise SearchCancelled(f"Recherche annulée après {self.expansions} expansions")
+                    if progress is not None:
+                        progress(self.expansions)
+                if parent >= 0:
+                    parents[current] = parent
+                if record_expansions:
+                    expanded_nodes.append(node_ids[current])
+                
+                if current == goal:
+                    self.path_cost = cost
+                    return self._reconstruct_path(current), expanded_nodes, []
+                
+                if prefetch is not None:
+                    prefetch(indptr[current], indptr[current + 1])
+                for k in range(indptr[current], indptr[current + 1]):
+                    neighbor = indices[k]
+                    if neighbor not in closed:
+                        g = cost + weights[k]
+                        candidate = (priority(g, heuristics[neighbor]), neighbor, current, g)
+                        known = candidates.get(neighbor)
+                        if known is None or candidate < known:
+                            candidates[neighbor] = candidate
+            
+            # Ne garder que les `width` meilleurs candidats
+            if len(candidates) > self.peak_frontier:
+                self.peak_frontier = len(candidates)
+            beam = heapq.nsmallest(width, candidates.values())
+            self.pruned_entries += len(candidates) - len(beam)
+        
+        return None, expanded_nodes, []
+    
+    def signature(self):
+        """Paramètres de la recherche, largeur du faisceau comprise."""
+        signature = super().signature()
+        return None if signature is None else signature + (self.width,)
+    
+    def results_data(self, path, expanded_nodes):
+        """Résultats au format de BestFirstSearch, avec la mémoire utilisée et les garanties."""
+        results = super().results_data(path, expanded_nodes)
+        results.update({
+            "algorithm": "Beam Search",
+            "beam_width": self.width,
+            "peak_frontier": self.peak_frontier,
+            "pruned_entries": self.pruned_entries,
+            "complete": False,
+            "optimal": False,
+            "caveats": "Les nœuds écartés du faisceau ne sont jamais reconsidérés : "
+                       "un chemin existant peut être manqué, et le chemin trouvé "
+                       "n'est pas forcément optimal."
+        })
+        return results
+
+
+class MemoryBoundedSearch(BestFirstSearch):
+    """
+    Recherche meilleur d'abord à mémoire bornée, dans l'esprit de SMA*.
+
+    Dès que la frontière dépasse node_budget entrées, le quart le moins
+    prometteur est oublié. Comme dans SMA*, la meilleure priorité des
+    successeurs oubliés est reportée sur leur parent, qui est remis dans la
+    frontière : il sera redéveloppé (avec son coût et son parent d'origine)
+    si cette branche redevient la plus prometteuse. Un nœud n'est rouvert que
+    si sa valeur reportée augmente, ce qui garantit la terminaison même avec
+    un budget très faible.
+
+    Tant qu'aucune entrée n'est oubliée, le résultat est celui de
+    BestFirstSearch. Sinon la recherche n'est plus garantie complète (une
+    entrée du nœud de départ oubliée est perdue) ni optimale. Les nœuds
+    visités restent mémorisés : le budget porte sur la frontière, qui est la
+    structure qui croît le plus vite. Seuls les niveaux de trace 'none' et
+    'expansions' sont disponibles.
+    """
+    def __init__(self, graph, node_budget, trace='expansions', **kwargs):
+        """
+        Args:
+            graph: Graph ou CompiledGraph à explorer
+            node_budget: Nombre maximal d'entrées de la frontière
+            trace: 'none' ou 'expansions'
+            **kwargs: Options de BestFirstSearch (open_list, priority, epsilon,
+                heuristic)
+        """
+        if trace not in ('none', 'expansions'):
+            raise ValueError(f"Niveau de trace non disponible en recherche à mémoire bornée: {trace}")
+        if node_budget < 2:
+            raise ValueError("Le budget de nœuds doit être au moins 2")
+        super().__init__(graph, trace=trace, **kwargs)
+        self.node_budget = node_budget
+        self.peak_frontier = 0  # Plus grande taille atteinte par la frontière
+        self.pruned_entries = 0  # Entrées oubliées
+        self.reexpansions = 0  # Nœuds redéveloppés après l'oubli de leurs successeurs
+    
+    def search(self, start=None, goal=None):
+        """
+        Exécute la recherche en respectant le budget de la frontière.
+        
+        Args:
+            start: Nœud de départ (par défaut graph.start_node)
+            goal: Nœud objectif (par défaut graph.goal_node)
+            
+        Returns:
+            tuple: (chemin, nœuds_explorés, steps) comme BestFirstSearch.search ;
+                un nœud redéveloppé apparaît plusieurs fois dans nœuds_explorés
+                et steps est toujours vide
+        """
+        compiled, start, goal = self._prepare_query(start, goal)
+        indptr, indices, weights, heuristics = compiled.adjacency_lists()
+        heuristics, prefetch = self._heuristic_values(compiled, goal, heuristics)
+        priority = self.priority
+        node_ids = compiled.node_ids
+        budget = self.node_budget
+        keep = budget - budget // 4
+        
+        self._closed = closed = set()
+        self._parents = parents = {}
+        self._open_set = open_set = self.open_list_factory()
+        push = open_set.push
+        pop = open_set.pop
+        self.expanded_nodes = expanded_nodes = []
+        self.expansions = 0
+        self.path_cost = None
+        self.peak_frontier = 1
+        self.pruned_entries = 0
+        self.reexpansions = 0
+        self._cancel_requested = False
+        progress = self.progress
+        record_expansions = self.trace != 'none'
+        expanded_cost = {}  # Coût de chaque nœud lors de sa première expansion
+        backed = {}  # Valeur reportée de chaque nœud rouvert
+        
+        push((priority(0.0, heuristics[start]), start, -1, 0.0))
+        while open_set:
+            _, current, parent, cost = pop()
+            if current in closed:
+                continue
+            
+            floor = 0.0
+            if current in expanded_cost:
+                # Nœud rouvert : le coût et le parent d'origine sont conservés,
+                # ce qui garde l'arbre des parents sans cycle ; ses successeurs
+                # héritent de la valeur reportée (pathmax de SMA*)
+                cost = expanded_cost[current]
+                floor = backed[current]
+                self.reexpansions += 1
+            else:
+                expanded_cost[current] = cost
+                if parent >= 0:
+                    parents[current] = parent
+            closed.add(current)
+            self.expansions += 1
+            if not self.expansions % PROGRESS_INTERVAL:
+                if self._cancel_requested:
+                    raise SearchCancelled(f"Recherche annulée après {self.expansions} expansions")
+                if progress is not None:
+                    progress(self.expansions)
+            if record_expansions:
+                expanded_nodes.append(node_ids[current])
+            
+            if current == goal:
+                self.path_cost = cost
+                return self._reconstruct_path(current), expanded_nodes, []
+            
+            if prefetch is not None:
+                prefetch(indptr[current], indptr[current + 1])
+            for k in range(indptr[current], indptr[current + 1]):
+                neighbor = indices[k]
+                if neighbor not in closed:
+                    g = cost + weights[k]
+                    value = priority(g, heuristics[neighbor])
+                    # Un nœud déjà oublié repart de sa valeur reportée
+                    value = max(value, floor, backed.get(neighbor, value))
+                    push((value, neighbor, current, g))
+            
+            size = len(open_set)
+            if size > self.peak_frontier:
+                self.peak_frontier = size
+            if size > budget:
+                self._forget(open_set, keep, closed, parents, expanded_cost, backed)
+        
+        return None, expanded_nodes, []
+    
+    def _forget(self, open_set, keep, closed, parents, expanded_cost, backed):
+        """
+        Oublie les pires entrées de la frontière et rouvre leurs parents.
+        
+        Chaque parent est remis dans la frontière avec la meilleure priorité
+        de ses successeurs oubliés (valeur reportée, comme dans SMA*).
+        """
+        backed_up = {}
+        removed = open_set.prune(keep)
+        kept = {entry[1] for entry in open_set.entries()}
+        for priority, node, parent, _ in removed:
+            if node in closed or node in kept:
+                continue  # Entrée obsolète, ou doublon d'un nœud encore dans la frontière
+            self.pruned_entries += 1
+            if parent >= 0 and priority < backed_up.get(parent, float('inf')):
+                backed_up[parent] = priority
+        
+        for parent, priority in backed_up.items():
+            # Un nœud n'est rouvert que si sa valeur reportée augmente : sinon la
+            # branche n'a pas progressé depuis sa dernière réouverture et elle
+            # est abandonnée, ce qui garantit la terminaison
+            if parent in closed and priority > backed.get(parent, float('-inf')):
+                closed.discard(parent)
+                backed[parent] = priority
+                open_set.push((priority, parent, parents.get(parent, -1), expanded_cost[parent]))
+    
+    def signature(self):
+        """Paramètres de la recherche, budget de la frontière compris."""
+        signature = super().signature()
+        return None if signature is None else signature + (self.node_budget,)
+    
+    def results_data(self, path, expanded_nodes):
+        """Résultats au format de BestFirstSearch, avec la mémoire utilisée et les garanties."""
+        results = super().results_data(path, expanded_nodes)
+        pruned = self.pruned_entries > 0
+        if pruned:
+            caveats = ("Des entrées de la frontière ont été oubliées : un chemin existant "
+                       "peut être manqué et le chemin trouvé n'est pas forcément optimal. "
+                       "Augmenter node_budget pour retrouver les garanties.")
+        else:
+            caveats = "Aucune entrée oubliée : résultat identique à la recherche sans limite."
+        results.update({
+            "algorithm": "Memory-Bounded Best-First Search",
+            "node_budget": self.node_budget,
+            "peak_frontier": self.peak_frontier,
+            "pruned_entries": self.pruned_entries,
+            "reexpansions": self.reexpansions,
+            "complete": not pruned,
+            "optimal": not pruned and self.mode in ('astar', 'ucs'),
+            "caveats": caveats
+        })
+        return results
@@ -0,0 +1,245 @@
+import os
+import shutil
+import multiprocessing
+import subprocess
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from algorithms import SearchCancelled
+
+
+# Taille des images exportées, identique à la figure de animate_search
+FIGSIZE = (12, 8)
+DPI = 100
+
+
+class FrameRenderer:
+    """
+    Rend les images d'une animation de recherche hors de pyplot.
+
+    La figure Agg et la scène statique sont créées une seule fois, et le
+    fond est mémorisé : chaque image restaure ce fond puis ne dessine que
+    les artistes animés. Une image ne dépend que de son numéro d'étape, pas
+    des précédentes, ce qui permet de répartir les images entre processus.
+    """
+    def __init__(self, visualizer, steps, figsize=FIGSIZE, dpi=DPI):
+        """
+        Args:
+            visualizer: GraphVisualizer (graphe et positions des nœuds)
+            steps: Liste des états ou SearchTrace
+            figsize: Taille de la figure en pouces
+            dpi: Résolution de la figure
+        """
+        from visualization import SearchAnimationScene
+
+        self.steps = steps
+        self.figure = Figure(figsize=figsize, dpi=dpi)
+        self.canvas = FigureCanvasAgg(self.figure)
+        self.scene = SearchAnimationScene(visualizer, self.figure.add_subplot())
+        for artist in self.scene.artists:
+            artist.set_animated(True)
+        self.canvas.draw()
+        self.background = self.canvas.copy_from_bbox(self.figure.bbox)
+
+    def render(self, frame_num):
+        """
+        Rend une image.
+
+        Args:
+            frame_num: Numéro de l'étape à dessiner
+
+        Returns:
+            bytes: Pixels RGB (largeur × hauteur × 3 octets)
+        """
+        artists = self.scene.update(self.steps[frame_num], frame_num, len(self.steps))
+        self.canvas.restore_region(self.background)
+        for artist in artists:
+            artist.set_animated(True)
+            self.figure.draw_artist(artist)
+        return np.asarray(self.canvas.buffer_rgba())[:, :, :3].tobytes()
+
+
+# Moteur de rendu de chaque processus, initialisé une seule fois par _init_worker
+_worker_state = {}
+
+
+def _scene_data(visualizer):
+    """
+    Données de la scène transmises aux processus de rendu.
+
+    Seuls les nœuds, arêtes, départ, arrivée et positions sont envoyés : le
+    Graph lui-même peut contenir des objets impossibles à sérialiser
+    (heuristique définie par une lambda, fonctions de add_listener).
+    """
+    graph = visualizer.graph
+    graph_nx = graph.graph
+    nodes = [(node, data['heuristic']) for node, data in graph_nx.nodes(data=True)]
+    edges = [(u, v, data['weight']) for u, v, data in graph_nx.edges(data=True)]
+    return nodes, edges, graph.start_node, graph.goal_node, visualizer.compute_layout()
+
+
+def _init_worker(scene_data, steps):
+    from graph import Graph
+    from visualization import GraphVisualizer
+
+    nodes, edges, start, goal, pos = scene_data
+    graph = Graph()
+    graph.add_nodes(nodes)
+    graph.add_edges(edges)
+    graph.start_node = start
+    graph.goal_node = goal
+    visualizer = GraphVisualizer(graph, layout=lambda graph_nx: pos)
+    _worker_state['renderer'] = FrameRenderer(visualizer, steps)
+
+
+def _render_frame(frame_num):
+    return _worker_state['renderer'].render(frame_num)
+
+
+def render_frames(visualizer, steps, processes=None, chunksize=4):
+    """
+    Rend toutes les images d'une recherche, dans l'ordre des étapes.
+
+    Les images sont calculées en parallèle par un groupe de processus ;
+    Pool.imap conserve l'ordre des étapes quel que soit le processus qui
+    a rendu chaque image. Les processus sont lancés par spawn : l'export
+    est démarré depuis un thread de l'interface Tk, qu'il serait dangereux
+    de dupliquer par fork.
+
+    Args:
+        visualizer: GraphVisualizer (graphe et positions des nœuds)
+        steps: Liste des états ou SearchTrace
+        processes: Nombre de processus (par défaut le nombre de cœurs) ;
+            1 rend les images dans le processus courant
+        chunksize: Nombre d'images consécutives confiées à un processus
+
+    Yields:
+        bytes: Pixels RGB de chaque image
+    """
+    frames = range(len(steps))
+
+    if processes == 1 or (processes is None and (os.cpu_count() or 1) == 1):
+        renderer = FrameRenderer(visualizer, steps)
+        for frame_num in frames:
+            yield renderer.render(frame_num)
+        return
+
+    # Les positions sont calculées une fois ici puis transmises aux processus
+    scene_data = _scene_data(visualizer)
+    context = multiprocessing.get_context('spawn')
+    with context.Pool(processes, initializer=_init_worker,
+                      initargs=(scene_data, steps)) as pool:
+        yield from pool.imap(_render_frame, frames, chunksize)
+
+
+def find_ffmpeg():
+    """Chemin de l'exécutable ffmpeg, ou None s'il n'est pas installé."""
+    return shutil.which('ffmpeg')
+
+
+def export_animation(visualizer, steps, filename, fps=1.0, processes=None, chunksize=4,
+                     progress=None, cancel=None):
+    """
+    Exporte l'animation d'une recherche dans un fichier vidéo ou GIF.
+
+    Les images brutes sont envoyées directement sur l'entrée standard de
+    ffmpeg, sans fichiers intermédiaires. Sans ffmpeg, un GIF est produit
+    avec Pillow si le fichier se termine par .gif, sinon une séquence
+    d'images PNG est écrite dans un répertoire à côté du fichier demandé.
+
+    Args:
+        visualizer: GraphVisualizer (graphe et positions des nœuds)
+        steps: Liste des états ou SearchTrace
+        filename: Fichier de sortie (.mp4, .gif...)
+        fps: Nombre d'images par seconde
+        processes: Nombre de processus de rendu (voir render_frames)
+        chunksize: Nombre d'images consécutives confiées à un processus
+        progress: Fonction appelée avec (images_rendues, images_totales)
+        cancel: threading.Event ; s'il est positionné, l'export s'arrête
+            entre deux images en levant SearchCancelled
+
+    Returns:
+        str: Fichier ou répertoire effectivement écrit
+    """
+    if not len(steps):
+        raise ValueError("Aucune étape à exporter")
+
+    width, height = int(FIGSIZE[0] * DPI), int(FIGSIZE[1] * DPI)
+    frames = render_frames(visualizer, steps, processes, chunksize)
+    if progress is not None or cancel is not None:
+        frames = _monitor(frames, len(steps), progress, cancel)
+    ffmpeg = find_ffmpeg()
+
+    if ffmpeg:
+        _encode_ffmpeg(ffmpeg, frames, filename, width, height, fps)
+        return filename
+    if filename.lower().endswith('.gif'):
+        _write_gif(frames, filename, width, height, fps)
+        return filename
+    return _write_png_sequence(frames, filename, width, height)
+
+
+def _monitor(frames, total, progress, cancel):
+    """Relaie les images en signalant la progression et les demandes d'annulation."""
+    for frame_num, frame in enumerate(frames, 1):
+        if cancel is not None and cancel.is_set():
+            raise SearchCancelled(f"Export annulé après {frame_num - 1} images sur {total}")
+        yield frame
+        if progress is not None:
+            progress(frame_num, total)
+
+
+def _encode_ffmpeg(ffmpeg, frames, filename, width, height, fps):
+    """Encode les images brutes RGB reçues sur l'entrée standard de ffmpeg."""
+    command = [ffmpeg, '-y', '-loglevel', 'error',
+               '-f', 'rawvideo', '-pix_fmt', 'rgb24', '-s', f'{width}x{height}',
+               '-r', str(fps), '-i', '-']
+    if not filename.lower().endswith('.gif'):
+        # Format lu par la plupart des lecteurs vidéo
+        command += ['-pix_fmt', 'yuv420p']
+    command.append(filename)
+
+    process = subprocess.Popen(command, stdin=subprocess.PIPE, stderr=subprocess.PIPE)
+    try:
+        for frame in frames:
+            process.stdin.write(frame)
+    except BrokenPipeError:
+        pass  # ffmpeg s'est arrêté : son message d'erreur est lu ci-dessous
+    except BaseException:
+        # Rendu interrompu (annulation...) : le fichier partiel est abandonné
+        process.kill()
+        process.wait()
+        raise
+    finally:
+        try:
+            process.stdin.close()
+        except BrokenPipeError:
+            pass
+    error = process.stderr.read().decode(errors='replace')
+    process.stderr.close()
+    if process.wait() != 0:
+        raise OSError(f"Échec de l'encodage avec ffmpeg: {error.strip()}")
+
+
+def _frame_image(frame, width, height):
+    from PIL import Image
+    return Image.frombytes('RGB', (width, height), frame)
+
+
+def _write_gif(frames, filename, width, height, fps):
+    """Écrit un GIF animé avec Pillow (sans ffmpeg)."""
+    images = [_frame_image(frame, width, height) for frame in frames]
+    images[0].save(filename, save_all=True, append_images=images[1:],
+                   duration=int(1000 / fps), loop=0)
+
+
+def _write_png_sequence(frames, filename, width, height):
+    """Écrit une image PNG par étape dans le répertoire <fichier>_frames."""
+    directory = os.path.splitext(filename)[0] + "_frames"
+    os.makedirs(directory, exist_ok=True)
+    for frame_num, frame in enumerate(frames):
+        _frame_image(frame, width, height).save(
+            os.path.join(directory, f"frame_{frame_num:05d}.png"))
+    return directory
@@ -0,0 +1,220 @@
+import os
+import time
+from multiprocessing import Pool, shared_memory
+
+import numpy as np
+
+from compiled_graph import CompiledGraph
+from algorithms import BestFirstSearch
+
+
+# Tableaux CSR placés en mémoire partagée
+SHARED_ARRAYS = ('indptr', 'indices', 'weights', 'heuristics')
+
+# Tableaux partagés seulement s'ils existent (voir CompiledGraph.positions)
+OPTIONAL_SHARED_ARRAYS = ('positions',)
+
+
+class SharedCompiledGraph:
+    """
+    Copie d'un CompiledGraph dans des blocs de mémoire partagée.
+
+    Les processus de calcul s'attachent à ces blocs par leur nom : les
+    tableaux CSR ne sont ni copiés ni sérialisés, quel que soit le nombre de
+    requêtes. Le propriétaire doit appeler close() (ou utiliser l'objet comme
+    gestionnaire de contexte) pour libérer la mémoire.
+    """
+    def __init__(self, compiled):
+        """
+        Copie les tableaux d'un graphe compilé en mémoire partagée.
+
+        Args:
+            compiled: Instance de CompiledGraph à partager
+        """
+        self.node_ids = list(compiled.node_ids)
+        self._blocks = []
+        self.descriptor = {}
+        for name in SHARED_ARRAYS + OPTIONAL_SHARED_ARRAYS:
+            array = getattr(compiled, name)
+            if array is None:
+                continue
+            block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+            np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[:] = array
+            self._blocks.append(block)
+            self.descriptor[name] = (block.name, array.shape, array.dtype.str)
+
+    def close(self):
+        """Détache et détruit les blocs de mémoire partagée."""
+        for block in self._blocks:
+            block.close()
+            block.unlink()
+        self._blocks = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def attach_compiled_graph(descriptor, node_ids):
+    """
+    Reconstruit un CompiledGraph en lecture seule sur des blocs partagés.
+
+    Args:
+        descriptor: Descripteur produit par SharedCompiledGraph
+        node_ids: Identifiants des nœuds
+
+    Returns:
+        tuple: (CompiledGraph, blocs) ; les blocs doivent rester référencés
+            aussi longtemps que le graphe est utilisé
+    """
+    blocks = []
+    arrays = {}
+    for name in SHARED_ARRAYS + OPTIONAL_SHARED_ARRAYS:
+        if name not in descriptor:
+            continue
+        block_name, shape, dtype = descriptor[name]
+        block = _attach_block(block_name)
+        array = np.ndarray(shape, dtype=np.dtype(dtype), buffer=block.buf)
+        array.flags.writeable = False
+        blocks.append(block)
+        arrays[name] = array
+
+    positions = arrays.pop('positions', None)
+    compiled = CompiledGraph(node_ids, zero_copy=True, **arrays)
+    compiled.positions = positions
+    return compiled, blocks
+
+
+def _attach_block(name):
+    """S'attache à un bloc existant sans en transférer la propriété."""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Python < 3.13 : les processus fils partagent le resource_tracker du
+        # parent, l'enregistrement en double est sans effet
+        return shared_memory.SharedMemory(name=name)
+
+
+# État de chaque processus de calcul, initialisé une seule fois par _init_worker
+_worker_state = {}
+
+
+def _init_worker(descriptor, node_ids, search_options):
+    compiled, blocks = attach_compiled_graph(descriptor, node_ids)
+    _worker_state['blocks'] = blocks
+    _worker_state['search'] = BestFirstSearch(compiled, trace='none', **search_options)
+
+
+def _init_worker_binary(filename, search_options):
+    compiled = CompiledGraph.open_binary(filename)
+    _worker_state['search'] = BestFirstSearch(compiled, trace='none', **search_options)
+
+
+def _solve_query(task):
+    index, start, goal = task
+    return _run_query(_worker_state['search'], index, start, goal)
+
+
+def _run_query(search, index, start, goal):
+    """Exécute une requête et renvoie un résultat sérialisable."""
+    result = {'index': index, 'start': start, 'goal': goal}
+    try:
+        path, _, _ = search.search(start, goal)
+    except ValueError as error:
+        result['error'] = str(error)
+        return result
+    result['path'] = path
+    result['path_cost'] = search.path_cost
+    result['expansions'] = search.expansions
+    return result
+
+
+def solve_batch(graph, queries, processes=None, chunksize=16, **search_options):
+    """
+    Résout un lot de requêtes (départ, arrivée) en parallèle.
+
+    Le graphe est compilé une fois puis partagé en mémoire entre les
+    processus ; le graphe d'origine n'est pas modifié (aucun appel à
+    set_start_node / set_goal_node). Avec un fichier binaire (voir
+    graph_io), chaque processus projette directement le fichier : les pages
+    sont partagées par le système et rien n'est copié. Les résultats sont produits au fur et à
+    mesure qu'ils sont calculés, donc pas forcément dans l'ordre des requêtes.
+
+    Args:
+        graph: Instance de Graph ou de CompiledGraph, ou chemin d'un
+            fichier de graphe binaire
+        queries: Itérable de couples (départ, arrivée)
+        processes: Nombre de processus (par défaut le nombre de cœurs) ;
+            1 exécute les requêtes dans le processus courant
+        chunksize: Nombre de requêtes envoyées ensemble à un processus
+        **search_options: Options transmises à BestFirstSearch
+            (priority, epsilon, open_list, heuristic)
+
+    Yields:
+        dict: Résultat d'une requête avec les clés 'index', 'start', 'goal'
+            puis 'path', 'path_cost' et 'expansions', ou 'error'
+    """
+    tasks = [(index, start, goal) for index, (start, goal) in enumerate(queries)]
+
+    if isinstance(graph, str):
+        if processes != 1:
+            initargs = (graph, search_options)
+            with Pool(processes, initializer=_init_worker_binary, initargs=initargs) as pool:
+                yield from pool.imap_unordered(_solve_query, tasks, chunksize)
+            return
+        graph = CompiledGraph.open_binary(graph)
+
+    compiled = graph.compile()
+    if processes == 1:
+        search = BestFirstSearch(compiled, trace='none', **search_options)
+        for task in tasks:
+            yield _run_query(search, *task)
+        return
+
+    with SharedCompiledGraph(compiled) as shared:
+        initargs = (shared.descriptor, shared.node_ids, search_options)
+        with Pool(processes, initializer=_init_worker, initargs=initargs) as pool:
+            yield from pool.imap_unordered(_solve_query, tasks, chunksize)
+
+
+def measure_scaling(graph, queries, process_counts=None, **search_options):
+    """
+    Mesure le débit de solve_batch en fonction du nombre de processus.
+
+    Args:
+        graph: Instance de Graph ou de CompiledGraph, ou chemin d'un
+            fichier de graphe binaire
+        queries: Liste de couples (départ, arrivée)
+        process_counts: Nombres de processus à tester (par défaut 1, 2, 4...
+            jusqu'au nombre de cœurs)
+        **search_options: Options transmises à BestFirstSearch
+
+    Returns:
+        list: Un dictionnaire par nombre de processus avec le temps, le débit
+            (requêtes/s) et l'accélération par rapport au premier
+    """
+    if process_counts is None:
+        cores = os.cpu_count() or 1
+        process_counts = [1]
+        while process_counts[-1] * 2 <= cores:
+            process_counts.append(process_counts[-1] * 2)
+        if process_counts[-1] != cores:
+            process_counts.append(cores)
+
+    if not isinstance(graph, str):
+        graph.compile()
+    results = []
+    for processes in process_counts:
+        t0 = time.perf_counter()
+        for _ in solve_batch(graph, queries, processes=processes, **search_options):
+            pass
+        seconds = time.perf_counter() - t0
+        results.append({
+            'processes': processes,
+            'seconds': seconds,
+            'queries_per_second': len(queries) / seconds,
+            'speedup': results[0]['seconds'] / seconds if results else 1.0
+        })
+    return results
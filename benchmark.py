@@ -0,0 +1,528 @@
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+from graph import Graph
+from compiled_graph import CompiledGraph
+from algorithms import BestFirstSearch, BidirectionalSearch, TRACE_LEVELS
+from open_lists import OPEN_LISTS
+from batch import measure_scaling
+from generators import GENERATORS, generate
+
+try:
+    import resource
+except ImportError:  # Windows : pas de mesure de la mémoire résidente
+    resource = None
+
+
+def make_random_graph(num_nodes, degree=4, seed=0):
+    """
+    Crée un graphe synthétique aléatoire pour les mesures de performance.
+
+    Une chaîne 0 -> 1 -> ... -> n-1 garantit que le but est atteignable, et
+    chaque nœud reçoit en plus `degree` arêtes vers des nœuds tirés au hasard.
+    Les heuristiques sont aléatoires pour forcer une exploration importante.
+
+    Args:
+        num_nodes: Nombre de nœuds du graphe
+        degree: Nombre d'arêtes aléatoires sortantes par nœud
+        seed: Graine du générateur aléatoire
+
+    Returns:
+        Graph: Graphe avec nœud de départ 'n0' et nœud objectif 'n{n-1}'
+    """
+    rng = random.Random(seed)
+    graph = Graph()
+
+    for i in range(num_nodes):
+        graph.add_node(f"n{i}", rng.randint(1, num_nodes))
+
+    for i in range(num_nodes - 1):
+        graph.add_edge(f"n{i}", f"n{i + 1}", rng.randint(1, 10))
+        for _ in range(degree):
+            graph.add_edge(f"n{i}", f"n{rng.randrange(num_nodes)}", rng.randint(1, 10))
+
+    graph.set_start_node("n0")
+    graph.set_goal_node(f"n{num_nodes - 1}")
+    return graph
+
+
+# Au-delà de cette taille, la trace 'full' (O(expansions × frontière)) épuise la mémoire
+FULL_TRACE_MAX_NODES = 20000
+
+
+def benchmark_trace_levels(sizes, levels=TRACE_LEVELS, repeat=3, seed=0):
+    """
+    Mesure le coût par expansion de BestFirstSearch pour chaque niveau de trace.
+
+    Args:
+        sizes: Tailles de graphes (nombre de nœuds) à mesurer
+        levels: Niveaux de trace à comparer ('full' est ignoré au-delà de
+            FULL_TRACE_MAX_NODES nœuds)
+        repeat: Nombre de répétitions, le meilleur temps est conservé
+        seed: Graine des graphes synthétiques
+
+    Returns:
+        list: Un dictionnaire par couple (taille, niveau)
+    """
+    results = []
+    for size in sizes:
+        graph = make_random_graph(size, seed=seed)
+        graph.compile()  # La compilation n'est pas comptée dans le coût par expansion
+        for level in levels:
+            if level == 'full' and size > FULL_TRACE_MAX_NODES:
+                continue
+            best = float('inf')
+            for _ in range(repeat):
+                bfs = BestFirstSearch(graph, trace=level)
+                t0 = time.perf_counter()
+                bfs.search()
+                best = min(best, time.perf_counter() - t0)
+            results.append({
+                'nodes': size,
+                'trace': level,
+                'expansions': bfs.expansions,
+                'seconds': best,
+                'us_per_expansion': best / max(bfs.expansions, 1) * 1e6
+            })
+    return results
+
+
+def benchmark_open_lists(sizes, backends=tuple(OPEN_LISTS), degree=16, repeat=3, seed=0):
+    """
+    Compare les implémentations de liste ouverte sur les mêmes graphes.
+
+    Les graphes sont plus denses que pour benchmark_trace_levels afin que
+    les redécouvertes de nœuds (entrées obsolètes du tas paresseux) pèsent.
+
+    Args:
+        sizes: Tailles de graphes (nombre de nœuds) à mesurer
+        backends: Noms des listes ouvertes à comparer (voir OPEN_LISTS)
+        degree: Nombre d'arêtes aléatoires sortantes par nœud
+        repeat: Nombre de répétitions, le meilleur temps est conservé
+        seed: Graine des graphes synthétiques
+
+    Returns:
+        list: Un dictionnaire par couple (taille, liste ouverte)
+    """
+    results = []
+    for size in sizes:
+        graph = make_random_graph(size, degree=degree, seed=seed)
+        graph.compile()
+        for backend in backends:
+            best = float('inf')
+            for _ in range(repeat):
+                bfs = BestFirstSearch(graph, trace='none', open_list=backend)
+                t0 = time.perf_counter()
+                bfs.search()
+                best = min(best, time.perf_counter() - t0)
+            results.append({
+                'nodes': size,
+                'open_list': backend,
+                'expansions': bfs.expansions,
+                'open_entries_left': len(bfs._open_set),
+                'seconds': best,
+                'us_per_expansion': best / max(bfs.expansions, 1) * 1e6
+            })
+    return results
+
+
+def benchmark_batch(size, num_queries=200, process_counts=None, seed=0):
+    """
+    Mesure le débit du solveur par lots en fonction du nombre de processus.
+
+    Args:
+        size: Nombre de nœuds du graphe synthétique
+        num_queries: Nombre de requêtes (départ, arrivée) aléatoires
+        process_counts: Nombres de processus à tester (voir measure_scaling)
+        seed: Graine du graphe et des requêtes
+
+    Returns:
+        list: Un dictionnaire par nombre de processus
+    """
+    graph = make_random_graph(size, seed=seed)
+    rng = random.Random(seed)
+    queries = [(f"n{rng.randrange(size)}", f"n{rng.randrange(size)}")
+               for _ in range(num_queries)]
+    return measure_scaling(graph, queries, process_counts, priority='astar')
+
+
+def benchmark_bidirectional(sizes, modes=('greedy', 'astar', 'ucs'), num_queries=20, seed=0):
+    """
+    Compare les expansions de la recherche bidirectionnelle et de la recherche simple.
+
+    Args:
+        sizes: Tailles de graphes (nombre de nœuds) à mesurer
+        modes: Modes de recherche à comparer
+        num_queries: Nombre de requêtes (départ, arrivée) aléatoires par graphe
+        seed: Graine du graphe et des requêtes
+
+    Returns:
+        list: Un dictionnaire par couple (taille, mode), expansions cumulées
+            sur toutes les requêtes
+    """
+    results = []
+    for size in sizes:
+        graph = make_random_graph(size, seed=seed)
+        graph.compile()
+        rng = random.Random(seed)
+        queries = [(f"n{rng.randrange(size)}", f"n{rng.randrange(size)}")
+                   for _ in range(num_queries)]
+        for mode in modes:
+            search = BidirectionalSearch(graph, trace='none', priority=mode)
+            totals = {'unidirectional_expansions': 0, 'bidirectional_expansions': 0}
+            for start, goal in queries:
+                comparison = search.compare_with_unidirectional(start, goal)
+                for key in totals:
+                    totals[key] += comparison[key]
+            results.append({
+                'nodes': size,
+                'mode': mode,
+                **totals,
+                'expansions_saved': totals['unidirectional_expansions'] - totals['bidirectional_expansions']
+            })
+    return results
+
+
+# Commandes de démarrage à froid comparées par benchmark_startup
+STARTUP_COMMANDS = {
+    'cli': ['cli.py', os.path.join('example_graphs', 'graph1.json'), '-o', os.devnull],
+    'import cli': ['-c', 'import cli'],
+    'import main (Tk)': ['-c', 'import main'],
+}
+
+# Modules lourds qui ne doivent pas être chargés par la ligne de commande
+HEAVY_MODULES = ('tkinter', 'matplotlib', 'networkx')
+
+
+def benchmark_startup(repeat=5):
+    """
+    Mesure le temps de démarrage à froid de la ligne de commande.
+
+    Chaque commande est lancée dans un nouveau processus Python depuis le
+    répertoire du projet ; le meilleur temps est conservé. La liste des
+    modules lourds chargés par `import cli` est aussi vérifiée.
+
+    Args:
+        repeat: Nombre de lancements par commande
+
+    Returns:
+        dict: Temps en millisecondes par commande, et modules lourds chargés
+    """
+    root = os.path.dirname(os.path.abspath(__file__))
+    timings = {}
+    for name, args in STARTUP_COMMANDS.items():
+        best = float('inf')
+        for _ in range(repeat):
+            t0 = time.perf_counter()
+            subprocess.run([sys.executable] + args, cwd=root, check=True,
+                           stdout=subprocess.DEVNULL)
+            best = min(best, time.perf_counter() - t0)
+        timings[name] = best * 1e3
+
+    probe = ("import sys, cli; print(','.join(m for m in %r if m in sys.modules))"
+             % (HEAVY_MODULES,))
+    loaded = subprocess.run([sys.executable, '-c', probe], cwd=root, check=True,
+                            capture_output=True, text=True).stdout.strip()
+    return {'ms': timings, 'heavy_modules_loaded_by_cli': loaded.split(',') if loaded else []}
+
+
+# Au-delà de cette taille, les rendus matplotlib ne sont pas mesurés par défaut
+RENDER_MAX_NODES = 100000
+
+# Version du format des rapports JSON écrits par --json
+REPORT_VERSION = 1
+
+
+def peak_rss_mb():
+    """Pic de mémoire résidente du processus en Mo (None si non mesurable)."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Octets sous macOS, kilo-octets sous Linux
+    return peak / 2 ** 20 if sys.platform == 'darwin' else peak / 2 ** 10
+
+
+def benchmark_generated(sizes, kinds=GENERATORS, repeat=3, seed=0, render_max_nodes=RENDER_MAX_NODES):
+    """
+    Mesure le chargement, la recherche et le rendu sur les graphes générés.
+
+    Chaque couple (type, taille) est mesuré dans un nouveau processus, pour
+    que le pic de mémoire résidente ne dépende que de ce graphe.
+
+    Args:
+        sizes: Tailles de graphes (nombre de nœuds) à mesurer
+        kinds: Types de graphes (voir generators.GENERATORS)
+        repeat: Nombre de répétitions, le meilleur temps est conservé
+        seed: Graine des graphes générés
+        render_max_nodes: Taille au-delà de laquelle les rendus ne sont pas mesurés
+
+    Returns:
+        list: Un dictionnaire par couple (type, taille)
+    """
+    context = multiprocessing.get_context('spawn')
+    results = []
+    for kind in kinds:
+        for size in sizes:
+            with context.Pool(1) as pool:
+                results.append(pool.apply(_measure_generated,
+                                          (kind, size, repeat, seed, size <= render_max_nodes)))
+    return results
+
+
+def _best_time(function, repeat):
+    """Meilleur temps d'exécution de function sur repeat appels, et son dernier résultat."""
+    best = float('inf')
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - t0)
+    return best, result
+
+
+def _measure_generated(kind, size, repeat, seed, render):
+    """Mesures d'un graphe généré (exécuté dans un processus dédié)."""
+    row = {'kind': kind, 'nodes': size, 'baseline_rss_mb': peak_rss_mb()}
+    t0 = time.perf_counter()
+    graph = generate(kind, size, seed)
+    row['generate_seconds'] = time.perf_counter() - t0
+    start, goal = graph.start_node, graph.goal_node  # Absents du fichier JSON
+    compiled = graph.compile()
+    row['nodes'] = compiled.num_nodes
+    row['edges'] = compiled.num_edges
+
+    with tempfile.TemporaryDirectory() as directory:
+        filename = os.path.join(directory, 'graph.json')
+        graph.save_to_file(filename)
+        row['file_mb'] = os.path.getsize(filename) / 2 ** 20
+        del graph, compiled
+        row['load_seconds'], graph = _best_time(lambda: Graph.load_from_file(filename), repeat)
+        row['compiled_load_seconds'], _ = _best_time(
+            lambda: CompiledGraph.load_from_file(filename), repeat)
+    graph.compile()
+    row['load_rss_mb'] = peak_rss_mb()
+
+    search = BestFirstSearch(graph, trace='none', priority='astar')
+    row['search_seconds'], (path, _, _) = _best_time(lambda: search.search(start, goal), repeat)
+    row['expansions'] = search.expansions
+    row['expansions_per_second'] = search.expansions / max(row['search_seconds'], 1e-9)
+    row['path_cost'] = search.path_cost
+    row['search_rss_mb'] = peak_rss_mb()
+
+    if render:
+        row.update(_measure_render(graph, path, search.expanded_nodes))
+    return row
+
+
+def _measure_render(graph, path, visited):
+    """Temps des rendus de GraphVisualizer (backend Agg, positions du générateur)."""
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    from visualization import GraphVisualizer
+
+    def generated_positions(graph_nx):
+        return {node: data['pos'] for node, data in graph_nx.nodes(data=True)}
+
+    visualizer = GraphVisualizer(graph, layout=generated_positions)
+    row = {}
+    t0 = time.perf_counter()
+    visualizer.draw_graph()
+    row['draw_seconds'] = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    visualizer.visualize_path(path, visited=visited)
+    row['path_seconds'] = time.perf_counter() - t0
+    with tempfile.TemporaryDirectory() as directory:
+        t0 = time.perf_counter()
+        visualizer.save_figure(os.path.join(directory, 'graph.png'))
+        row['save_figure_seconds'] = time.perf_counter() - t0
+    plt.close('all')
+    row['render_rss_mb'] = peak_rss_mb()
+    return row
+
+
+def environment():
+    """Description de la machine et des versions, enregistrée avec les mesures."""
+    import networkx
+    import numpy
+    root = os.path.dirname(os.path.abspath(__file__))
+    try:
+        commit = subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=root, capture_output=True,
+                                text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpus': os.cpu_count(),
+        'numpy': numpy.__version__,
+        'networkx': networkx.__version__,
+        'commit': commit
+    }
+
+
+def write_report(filename, suite, parameters, results):
+    """
+    Enregistre les mesures d'une suite dans un fichier JSON.
+
+    Args:
+        filename: Fichier à écrire
+        suite: Nom de la suite mesurée
+        parameters: Paramètres de la ligne de commande
+        results: Résultats renvoyés par la fonction de la suite
+    """
+    report = {
+        'version': REPORT_VERSION,
+        'suite': suite,
+        'date': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'environment': environment(),
+        'parameters': parameters,
+        'results': results
+    }
+    with open(filename, 'w') as file:
+        json.dump(report, file, indent=2)
+
+
+def compare_reports(old_filename, new_filename):
+    """
+    Compare les temps de deux rapports JSON d'une même suite.
+
+    Les lignes sont appariées par leurs champs non mesurés (type, taille,
+    mode...) ; chaque champ en secondes donne le rapport nouveau / ancien.
+
+    Args:
+        old_filename: Rapport de référence
+        new_filename: Rapport à comparer
+
+    Returns:
+        list: Un dictionnaire (clé de ligne, champ, ancien, nouveau, rapport)
+            par temps présent dans les deux rapports
+    """
+    reports = []
+    for filename in (old_filename, new_filename):
+        with open(filename, 'r') as file:
+            reports.append(json.load(file))
+    old, new = reports
+    if old['suite'] != new['suite']:
+        raise ValueError(f"Suites différentes: {old['suite']} et {new['suite']}")
+    if not isinstance(new['results'], list):
+        raise ValueError(f"La suite {new['suite']} ne produit pas de lignes comparables")
+
+    def row_key(row):
+        return tuple((field, value) for field, value in sorted(row.items())
+                     if isinstance(value, str) or field == 'nodes')
+
+    old_rows = {row_key(row): row for row in old['results']}
+    comparison = []
+    for row in new['results']:
+        previous = old_rows.get(row_key(row))
+        if previous is None:
+            continue
+        for field, value in row.items():
+            if field.endswith('seconds') and previous.get(field):
+                comparison.append({'row': dict(row_key(row)), 'field': field,
+                                   'old': previous[field], 'new': value,
+                                   'ratio': value / previous[field]})
+    return comparison
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mesures de performance de Best-First Search")
+    parser.add_argument('--suite', choices=['trace', 'open-list', 'batch', 'startup',
+                                            'bidirectional', 'generated'],
+                        default='trace',
+                        help="Niveaux de trace, listes ouvertes, requêtes par lots, "
+                             "démarrage à froid, recherche bidirectionnelle ou "
+                             "chargement/recherche/rendu sur graphes générés")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000],
+                        help="Tailles de graphes (ex: 1000 10000 100000 1000000)")
+    parser.add_argument('--levels', nargs='+', default=list(TRACE_LEVELS), choices=TRACE_LEVELS)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--queries', type=int, default=200,
+                        help="Nombre de requêtes pour les suites batch et bidirectional")
+    parser.add_argument('--processes', type=int, nargs='+',
+                        help="Nombres de processus pour la suite batch")
+    parser.add_argument('--kinds', nargs='+', default=list(GENERATORS), choices=GENERATORS,
+                        help="Types de graphes pour la suite generated")
+    parser.add_argument('--render-max-nodes', type=int, default=RENDER_MAX_NODES,
+                        help="Taille au-delà de laquelle les rendus ne sont pas mesurés")
+    parser.add_argument('--json', metavar='FICHIER',
+                        help="Enregistre les mesures et l'environnement dans un fichier JSON")
+    parser.add_argument('--compare', metavar='REFERENCE',
+                        help="Compare les temps mesurés à un rapport JSON de référence")
+    args = parser.parse_args()
+
+    if args.suite == 'startup':
+        results = benchmark_startup(args.repeat)
+        for name, ms in results['ms'].items():
+            print(f"{name:>20} {ms:>8.1f} ms")
+        print(f"Modules lourds chargés par cli: {results['heavy_modules_loaded_by_cli'] or 'aucun'}")
+
+    elif args.suite == 'bidirectional':
+        results = benchmark_bidirectional(args.sizes, num_queries=args.queries, seed=args.seed)
+        print(f"{'nœuds':>10} {'mode':>15} {'simple':>11} {'bidirect.':>11} {'économisées':>12}")
+        for row in results:
+            print(f"{row['nodes']:>10} {row['mode']:>15} {row['unidirectional_expansions']:>11} "
+                  f"{row['bidirectional_expansions']:>11} {row['expansions_saved']:>12}")
+
+    elif args.suite == 'batch':
+        results = []
+        print(f"{'nœuds':>10} {'processus':>10} {'temps (s)':>10} {'requêtes/s':>11} {'accélération':>13}")
+        for size in args.sizes:
+            for row in benchmark_batch(size, args.queries, args.processes, args.seed):
+                results.append({'nodes': size, **row})
+                print(f"{size:>10} {row['processes']:>10} {row['seconds']:>10.3f} "
+                      f"{row['queries_per_second']:>11.1f} {row['speedup']:>13.2f}")
+
+    elif args.suite == 'open-list':
+        results = benchmark_open_lists(args.sizes, repeat=args.repeat, seed=args.seed)
+        print(f"{'nœuds':>10} {'liste':>8} {'expansions':>11} {'restantes':>10} "
+              f"{'temps (s)':>10} {'µs/expansion':>13}")
+        for row in results:
+            print(f"{row['nodes']:>10} {row['open_list']:>8} {row['expansions']:>11} "
+                  f"{row['open_entries_left']:>10} {row['seconds']:>10.4f} "
+                  f"{row['us_per_expansion']:>13.2f}")
+
+    elif args.suite == 'generated':
+        results = benchmark_generated(args.sizes, args.kinds, args.repeat, args.seed,
+                                      args.render_max_nodes)
+        print(f"{'type':>12} {'nœuds':>9} {'arêtes':>9} {'chargement':>11} {'compilé':>8} "
+              f"{'recherche':>10} {'exp./s':>10} {'dessin':>8} {'pic (Mo)':>9}")
+        for row in results:
+            draw = f"{row['draw_seconds']:>8.2f}" if 'draw_seconds' in row else f"{'-':>8}"
+            peak = row.get('render_rss_mb', row['search_rss_mb'])
+            peak_text = '-' if peak is None else str(round(peak))  # None sans module resource
+            print(f"{row['kind']:>12} {row['nodes']:>9} {row['edges']:>9} "
+                  f"{row['load_seconds']:>11.3f} {row['compiled_load_seconds']:>8.3f} "
+                  f"{row['search_seconds']:>10.4f} {row['expansions_per_second']:>10.0f} "
+                  f"{draw} {peak_text:>9}")
+
+    else:
+        results = benchmark_trace_levels(args.sizes, args.levels, args.repeat, args.seed)
+        print(f"{'nœuds':>10} {'trace':>11} {'expansions':>11} {'temps (s)':>10} {'µs/expansion':>13}")
+        for row in results:
+            print(f"{row['nodes']:>10} {row['trace']:>11} {row['expansions']:>11} "
+                  f"{row['seconds']:>10.4f} {row['us_per_expansion']:>13.2f}")
+
+    if args.json:
+        write_report(args.json, args.suite, vars(args), results)
+    if args.compare:
+        if not args.json:
+            parser.error("--compare nécessite --json (rapport de la mesure courante)")
+        print(f"\nComparaison avec {args.compare} (rapport > 1 : plus lent)")
+        for row in compare_reports(args.compare, args.json):
+            label = ' '.join(str(value) for value in row['row'].values())
+            print(f"{label:>30} {row['field']:>22} {row['old']:>10.4f} {row['new']:>10.4f} "
+                  f"{row['ratio']:>7.2f}")
+
+
+if __name__ == "__main__":
+    main()
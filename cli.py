@@ -0,0 +1,206 @@
+import argparse
+import json
+import sys
+
+from compiled_graph import CompiledGraph
+from algorithms import (BestFirstSearch, BidirectionalSearch, BeamSearch, MemoryBoundedSearch,
+                        SEARCH_MODES)
+from graph_io import BINARY_EXTENSION
+from heuristics import METRICS
+from observers import MetricsCollector
+from open_lists import OPEN_LISTS
+
+
+def load_search_graph(filename, progress=None):
+    """
+    Charge un fichier de graphe sous forme compilée, sans networkx.
+
+    Args:
+        filename: Fichier JSON ou binaire (.bfsg)
+        progress: Fonction appelée avec (octets_lus, octets_totaux) pour JSON
+
+    Returns:
+        CompiledGraph: Instantané prêt pour la recherche
+    """
+    if filename.endswith(BINARY_EXTENSION):
+        return CompiledGraph.open_binary(filename)
+    return CompiledGraph.load_from_file(filename, progress)
+
+
+def run_search(graph_file, start=None, goal=None, mode='greedy', epsilon=1.0,
+               open_list='heap', image=None, bidirectional=False, beam_width=None,
+               node_budget=None, heuristic=None, landmarks=False, cache=None, metrics=False,
+               goals=None, max_expansions=None):
+    """
+    Charge un graphe, exécute la recherche et renvoie les résultats.
+
+    Point d'entrée utilisable comme bibliothèque : ni tkinter ni matplotlib
+    ne sont importés, sauf si une image est demandée.
+
+    Args:
+        graph_file: Fichier de graphe JSON ou binaire
+        start: Nœud de départ (par défaut celui du fichier)
+        goal: Nœud objectif (par défaut celui du fichier)
+        mode: Mode de recherche parmi SEARCH_MODES
+        epsilon: Poids de l'heuristique pour 'weighted_astar'
+        open_list: Implémentation de la liste ouverte (voir OPEN_LISTS)
+        image: Fichier image du chemin à produire (optionnel)
+        bidirectional: Si True, utilise BidirectionalSearch
+        beam_width: Si indiqué, utilise BeamSearch avec cette largeur
+        node_budget: Si indiqué, utilise MemoryBoundedSearch avec ce budget
+        heuristic: Distance parmi METRICS calculée depuis les coordonnées
+            des nœuds, au lieu des heuristiques stockées
+        landmarks: Si True, utilise l'heuristique ALT ; les tables de
+            repères sont lues à côté du graphe, ou calculées et enregistrées
+        cache: Fichier JSON du cache de requêtes (voir query_cache), lu
+            avant la recherche et réécrit après
+        metrics: Si True, ajoute aux résultats les compteurs de
+            observers.MetricsCollector (absents si le cache répond)
+        goals: Si indiqué, liste de buts atteints par une seule exploration
+            (BestFirstSearch.search_many) ; goal et les variantes sont ignorés
+        max_expansions: Budget d'expansions de l'exploration vers goals
+
+    Returns:
+        dict: Résultats au format de BestFirstSearch.results_data
+    """
+    compiled = load_search_graph(graph_file)
+    start = _resolve_node(compiled, start)
+    if goals is not None:
+        search = BestFirstSearch(compiled, trace='none')
+        tree = search.search_many(start, [_resolve_node(compiled, node) for node in goals],
+                                  max_expansions)
+        return tree.results_data()
+    goal = _resolve_node(compiled, goal)
+    if landmarks:
+        from landmarks import LandmarkIndex, landmarks_filename
+        heuristic = LandmarkIndex.load_or_build(compiled, landmarks_filename(graph_file)).heuristic()
+    options = dict(trace='expansions', open_list=open_list, priority=mode, epsilon=epsilon,
+                   heuristic=heuristic)
+    if beam_width is not None:
+        search = BeamSearch(compiled, beam_width, **options)
+    elif node_budget is not None:
+        search = MemoryBoundedSearch(compiled, node_budget, **options)
+    elif bidirectional:
+        search = BidirectionalSearch(compiled, **options)
+    else:
+        search = BestFirstSearch(compiled, **options)
+    if metrics:
+        search.add_observer(MetricsCollector())
+    if cache:
+        from query_cache import QueryCache
+        query_cache = QueryCache(filename=cache)
+        path, expanded_nodes, _ = query_cache.search(search, start, goal)
+        query_cache.save()
+    else:
+        path, expanded_nodes, _ = search.search(start, goal)
+    results = search.results_data(path, expanded_nodes)
+    if cache:
+        results['cache'] = query_cache.stats()
+
+    if image and path:
+        render_path_image(graph_file, path, image)
+
+    return results
+
+
+def _resolve_node(compiled, node):
+    """Interprète un identifiant lu en ligne de commande (ex: '12' -> 12)."""
+    if node is None or node in compiled.index:
+        return node
+    try:
+        value = json.loads(node)
+    except ValueError:
+        return node
+    return value if value in compiled.index else node
+
+
+def render_path_image(graph_file, path, filename):
+    """
+    Enregistre une image du graphe avec le chemin trouvé.
+
+    matplotlib et networkx ne sont importés qu'ici, avec un backend sans
+    affichage.
+
+    Args:
+        graph_file: Fichier de graphe JSON ou binaire
+        path: Chemin à mettre en évidence
+        filename: Fichier image à écrire
+    """
+    import matplotlib
+    matplotlib.use('Agg')
+    from graph import Graph
+    from visualization import GraphVisualizer
+
+    if graph_file.endswith(BINARY_EXTENSION):
+        graph = Graph.load_binary(graph_file)
+    else:
+        graph = Graph.load_from_file(graph_file)
+    visualizer = GraphVisualizer(graph)
+    visualizer.visualize_path(path)
+    visualizer.save_figure(filename)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Exécute Best-First Search sur un fichier de graphe, sans interface graphique"
+    )
+    parser.add_argument('graph', help="Fichier de graphe JSON ou binaire (.bfsg)")
+    parser.add_argument('--start', help="Nœud de départ (par défaut celui du fichier)")
+    parser.add_argument('--goal', help="Nœud objectif (par défaut celui du fichier)")
+    parser.add_argument('--mode', choices=SEARCH_MODES, default='greedy')
+    parser.add_argument('--epsilon', type=float, default=1.0,
+                        help="Poids de l'heuristique pour weighted_astar")
+    parser.add_argument('--open-list', choices=list(OPEN_LISTS), default='heap')
+    heuristics = parser.add_mutually_exclusive_group()
+    heuristics.add_argument('--heuristic', choices=METRICS,
+                            help="Heuristique calculée depuis les coordonnées (pos) des nœuds")
+    heuristics.add_argument('--landmarks', action='store_true',
+                            help="Heuristique ALT (tables de repères à côté du graphe, "
+                                 "calculées au premier usage)")
+    variants = parser.add_mutually_exclusive_group()
+    variants.add_argument('--bidirectional', action='store_true',
+                          help="Recherche depuis le départ et l'arrivée à la fois")
+    variants.add_argument('--beam-width', type=int,
+                          help="Recherche en faisceau de cette largeur (ni complète ni optimale)")
+    variants.add_argument('--node-budget', type=int,
+                          help="Borne la frontière à ce nombre d'entrées (mémoire bornée)")
+    variants.add_argument('--goals', nargs='+', metavar='NŒUD',
+                          help="Chemins vers plusieurs buts en une seule exploration")
+    parser.add_argument('--max-expansions', type=int,
+                        help="Budget d'expansions de l'exploration vers --goals")
+    parser.add_argument('--cache', help="Fichier de cache des requêtes (créé s'il n'existe pas)")
+    parser.add_argument('--metrics', action='store_true',
+                        help="Ajoute les compteurs de la recherche (insertions, entrées "
+                             "obsolètes, frontière maximale, temps) aux résultats")
+    parser.add_argument('-o', '--output', help="Fichier JSON des résultats (par défaut la sortie standard)")
+    parser.add_argument('--image', help="Image du chemin trouvé (charge matplotlib)")
+    args = parser.parse_args(argv)
+
+    try:
+        results = run_search(args.graph, args.start, args.goal, args.mode, args.epsilon,
+                             args.open_list, args.image, args.bidirectional,
+                             args.beam_width, args.node_budget, args.heuristic,
+                             args.landmarks, args.cache, args.metrics, args.goals,
+                             args.max_expansions)
+    except (OSError, ValueError) as error:
+        print(f"Erreur: {error}", file=sys.stderr)
+        return 1
+
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump(results, file, indent=4)
+    else:
+        json.dump(results, sys.stdout, indent=4)
+        print()
+
+    if results.get('unreached_goals'):
+        print(f"Buts non atteints depuis {results['start_node']}: "
+              f"{', '.join(str(node) for node in results['unreached_goals'])}", file=sys.stderr)
+    elif 'routes' not in results and not results['path']:
+        print(f"Aucun chemin trouvé de {results['start_node']} à {results['goal_node']}",
+              file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,441 @@
+import hashlib
+import json
+
+import numpy as np
+
+from graph_io import iter_json_graph, read_binary_graph, write_binary_graph, NodeIdIndex
+
+
+class CompiledGraph:
+    """
+    Instantané figé d'un Graph sous forme CSR (Compressed Sparse Row).
+
+    Les nœuds sont numérotés de 0 à n-1 ; les successeurs du nœud i sont
+    indices[indptr[i]:indptr[i+1]] avec les poids correspondants dans weights.
+    La numérotation suit l'ordre trié des identifiants lorsqu'ils sont
+    comparables, de sorte que départager deux nœuds par leur indice donne le
+    même résultat que par leur identifiant.
+
+    Les nœuds de départ et d'arrivée ne font pas partie de l'instantané : ils
+    sont passés à BestFirstSearch.search pour chaque requête. Les attributs
+    start_node et goal_node ne servent que de valeurs par défaut lorsque
+    l'instantané est chargé directement depuis un fichier.
+
+    positions contient les coordonnées des nœuds (tableau nœuds × dimensions,
+    voir Graph.add_node) lorsque tous les nœuds en ont, sinon None.
+    """
+    start_node = None
+    goal_node = None
+    positions = None
+
+    def __init__(self, node_ids, indptr, indices, weights, heuristics, zero_copy=False,
+                 index=None):
+        """
+        Initialise l'instantané à partir de ses tableaux.
+
+        Args:
+            node_ids: Liste des identifiants, node_ids[i] est le nœud d'indice i
+            indptr: Tableau NumPy (n+1) des débuts de ligne
+            indices: Tableau NumPy des successeurs
+            weights: Tableau NumPy des poids des arêtes
+            heuristics: Tableau NumPy des valeurs heuristiques
+            zero_copy: Si True, adjacency_lists() renvoie des vues sur les
+                tableaux au lieu de listes, pour ne pas dupliquer des tableaux
+                partagés entre processus (mémoire partagée, fichier mappé)
+            index: Correspondance identifiant -> indice ; construite à la
+                première utilisation si elle n'est pas fournie
+        """
+        self.node_ids = node_ids
+        self._index = index
+        self.indptr = indptr
+        self.indices = indices
+        self.weights = weights
+        self.heuristics = heuristics
+        self.zero_copy = zero_copy
+        self._lists = None
+        self._reverse = None
+        self._reverse_lists = None
+        self._content_hash = None
+
+    @property
+    def index(self):
+        """Correspondance identifiant -> indice des nœuds."""
+        if self._index is None:
+            self._index = {node: i for i, node in enumerate(self.node_ids)}
+        return self._index
+
+    @property
+    def num_nodes(self):
+        """Nombre de nœuds de l'instantané."""
+        return len(self.node_ids)
+
+    @property
+    def num_edges(self):
+        """Nombre d'arêtes de l'instantané."""
+        return len(self.indices)
+
+    def compile(self):
+        """Un instantané est déjà compilé."""
+        return self
+
+    def adjacency_lists(self):
+        """
+        Renvoie les tableaux CSR convertis en listes Python.
+
+        L'accès élément par élément à une liste est bien plus rapide qu'à un
+        tableau NumPy dans une boucle Python ; la conversion est faite une
+        seule fois puis mise en cache. En mode zero_copy, des memoryview sur
+        les tableaux sont renvoyées à la place : un peu plus lentes, mais sans
+        copie.
+
+        Returns:
+            tuple: (indptr, indices, weights, heuristics) sous forme de listes
+        """
+        if self._lists is None:
+            arrays = (self.indptr, self.indices, self.weights, self.heuristics)
+            if self.zero_copy:
+                self._lists = tuple(memoryview(array) for array in arrays)
+            else:
+                self._lists = tuple(array.tolist() for array in arrays)
+        return self._lists
+
+    def reverse_adjacency(self):
+        """
+        Renvoie l'index inverse (prédécesseurs) au format CSR.
+
+        Les prédécesseurs du nœud i sont rindices[rindptr[i]:rindptr[i+1]],
+        avec les poids des arêtes correspondantes ; l'index est construit une
+        seule fois par tri stable des arêtes selon leur cible.
+
+        Returns:
+            tuple: Tableaux NumPy (rindptr, rindices, rweights)
+        """
+        if self._reverse is None:
+            indptr = np.asarray(self.indptr)
+            indices = np.asarray(self.indices)
+            sources = np.repeat(np.arange(self.num_nodes, dtype=indices.dtype), np.diff(indptr))
+            order = np.argsort(indices, kind='stable')
+            rindptr = np.zeros(self.num_nodes + 1, dtype=np.int64)
+            np.cumsum(np.bincount(indices, minlength=self.num_nodes), out=rindptr[1:])
+            self._reverse = (rindptr, sources[order], np.asarray(self.weights)[order])
+        return self._reverse
+
+    def reverse_adjacency_lists(self):
+        """
+        Renvoie l'index inverse converti en listes Python (voir adjacency_lists).
+
+        Returns:
+            tuple: (rindptr, rindices, rweights) sous forme de listes
+        """
+        if self._reverse_lists is None:
+            self._reverse_lists = tuple(array.tolist() for array in self.reverse_adjacency())
+        return self._reverse_lists
+
+    def content_hash(self):
+        """
+        Empreinte SHA-1 du contenu (nœuds, heuristiques, arêtes, poids et
+        coordonnées éventuelles).
+
+        Contrairement à Graph.version, l'empreinte est identique d'un
+        processus à l'autre : elle identifie un graphe dans les fichiers
+        associés (positions des nœuds, caches...).
+
+        Returns:
+            str: Empreinte hexadécimale
+        """
+        if self._content_hash is None:
+            digest = hashlib.sha1()
+            digest.update(json.dumps(list(self.node_ids), default=str).encode('utf-8'))
+            for array, dtype in ((self.indptr, np.int64), (self.indices, np.int64),
+                                 (self.weights, np.float64), (self.heuristics, np.float64)):
+                digest.update(np.ascontiguousarray(array, dtype=dtype).tobytes())
+            if self.positions is not None:
+                digest.update(np.ascontiguousarray(self.positions, dtype=np.float64).tobytes())
+            self._content_hash = digest.hexdigest()
+        return self._content_hash
+
+    def get_neighbors(self, index):
+        """Récupère les indices des successeurs d'un nœud."""
+        return self.indices[self.indptr[index]:self.indptr[index + 1]]
+
+    def get_predecessors(self, index):
+        """Récupère les indices des prédécesseurs d'un nœud."""
+        rindptr, rindices, _ = self.reverse_adjacency()
+        return rindices[rindptr[index]:rindptr[index + 1]]
+
+    @classmethod
+    def from_edges(cls, node_ids, heuristics, sources, targets, weights, positions=None):
+        """
+        Construit un instantané directement depuis des listes d'arêtes.
+
+        Les successeurs de chaque nœud gardent l'ordre des arêtes ; une arête
+        répétée garde sa première position et son dernier poids, comme
+        Graph.add_edge.
+
+        Args:
+            node_ids: Identifiants des nœuds
+            heuristics: Valeurs heuristiques, dans l'ordre de node_ids
+            sources: Identifiants des nœuds de départ des arêtes
+            targets: Identifiants des nœuds d'arrivée des arêtes
+            weights: Poids des arêtes
+            positions: Coordonnées des nœuds dans l'ordre de node_ids (optionnel)
+
+        Returns:
+            CompiledGraph: Instantané construit sans passer par networkx
+        """
+        node_ids = list(node_ids)
+        heuristics = np.asarray(heuristics, dtype=np.float64)
+        order = list(range(len(node_ids)))
+        try:
+            order.sort(key=node_ids.__getitem__)
+        except TypeError:
+            pass  # Identifiants non comparables : ordre d'insertion
+        node_ids = [node_ids[i] for i in order]
+        heuristics = heuristics[order] if len(order) else heuristics
+        if positions is not None:
+            positions = np.asarray(positions, dtype=np.float64)[order]
+        index = {node: i for i, node in enumerate(node_ids)}
+        if len(index) != len(node_ids):
+            raise ValueError("Identifiants de nœuds en double")
+
+        try:
+            src = np.fromiter((index[node] for node in sources), dtype=np.int64)
+            dst = np.fromiter((index[node] for node in targets), dtype=np.int64)
+        except KeyError as error:
+            raise ValueError(f"Le nœud {error.args[0]} n'existe pas dans le graphe") from None
+        weights = np.asarray(weights, dtype=np.float64)
+
+        src, dst, weights = _dedupe_edges(src, dst, weights, len(node_ids))
+
+        rows = np.argsort(src, kind='stable')
+        indptr = np.zeros(len(node_ids) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(src, minlength=len(node_ids)), out=indptr[1:])
+        compiled = cls(node_ids, indptr, dst[rows], weights[rows], heuristics)
+        compiled.positions = positions
+        return compiled
+
+    @classmethod
+    def from_arrays(cls, node_ids, heuristics=None, sources=(), targets=(), weights=None,
+                    positions=None):
+        """
+        Construit un instantané depuis des tableaux NumPy, sans boucle par élément.
+
+        Les identifiants (nombres ou chaînes) sont triés une fois, puis les
+        extrémités des arêtes sont retrouvées par recherche dichotomique
+        vectorisée. Les données sont validées en bloc : identifiants en
+        double, arête vers un nœud inconnu, longueurs incohérentes, valeurs
+        NaN. Une arête répétée garde sa première position et son dernier
+        poids, comme avec Graph.add_edge, de sorte que l'instantané est
+        identique à celui d'un Graph construit élément par élément.
+
+        Args:
+            node_ids: Tableau 1-D des identifiants (identifiants de types
+                mélangés : correspondance par dictionnaire, plus lente)
+            heuristics: Valeurs heuristiques dans l'ordre de node_ids (0 par défaut)
+            sources: Identifiants des nœuds de départ des arêtes
+            targets: Identifiants des nœuds d'arrivée des arêtes
+            weights: Poids des arêtes (1 par défaut)
+            positions: Coordonnées (nœuds × dimensions) dans l'ordre de node_ids
+
+        Returns:
+            CompiledGraph: Instantané construit sans passer par networkx
+        """
+        node_ids = np.asarray(node_ids)
+        sources = np.asarray(sources)
+        targets = np.asarray(targets)
+        num_nodes = len(node_ids)
+        if node_ids.ndim != 1:
+            raise ValueError("Les identifiants de nœuds doivent former un tableau à une dimension")
+        if sources.shape != targets.shape or sources.ndim != 1:
+            raise ValueError("Les tableaux sources et targets doivent avoir la même longueur")
+        heuristics = (np.zeros(num_nodes) if heuristics is None
+                      else np.asarray(heuristics, dtype=np.float64))
+        weights = (np.ones(len(sources)) if weights is None
+                   else np.asarray(weights, dtype=np.float64))
+        if heuristics.shape != (num_nodes,):
+            raise ValueError("Il faut une valeur heuristique par nœud")
+        if weights.shape != sources.shape:
+            raise ValueError("Il faut un poids par arête")
+        if np.isnan(heuristics).any() or np.isnan(weights).any():
+            raise ValueError("Les heuristiques et les poids ne doivent pas contenir NaN")
+        if positions is not None:
+            positions = np.asarray(positions, dtype=np.float64)
+            if positions.ndim != 2 or len(positions) != num_nodes:
+                raise ValueError("Il faut une ligne de coordonnées par nœud")
+
+        if node_ids.dtype == object:
+            node_list, order, src, dst = _map_objects(node_ids.tolist(), sources, targets)
+        else:
+            if (node_ids[1:] > node_ids[:-1]).all():
+                order = np.arange(num_nodes)  # Déjà triés, sans doublon
+            else:
+                order = np.argsort(node_ids, kind='stable')
+            sorted_ids = node_ids[order]
+            duplicates = np.flatnonzero(sorted_ids[1:] == sorted_ids[:-1])
+            if len(duplicates):
+                raise ValueError(f"Identifiant de nœud en double: {sorted_ids[duplicates[0]]}")
+            src = _lookup(sorted_ids, sources)
+            dst = _lookup(sorted_ids, targets)
+            node_list = sorted_ids.tolist()
+        heuristics = heuristics[order]
+        if positions is not None:
+            positions = positions[order]
+
+        src, dst, weights = _dedupe_edges(src, dst, weights, num_nodes)
+
+        rows = np.argsort(src, kind='stable')
+        indptr = np.zeros(num_nodes + 1, dtype=np.int64)
+        np.cumsum(np.bincount(src, minlength=num_nodes), out=indptr[1:])
+        compiled = cls(node_list, indptr, dst[rows], weights[rows], heuristics)
+        compiled.positions = positions
+        return compiled
+
+    @classmethod
+    def load_from_file(cls, filename, progress=None):
+        """
+        Charge un fichier de graphe JSON directement sous forme compilée.
+
+        Le fichier est lu en flux et aucun graphe networkx n'est construit :
+        c'est le chargement le plus rapide et le plus économe en mémoire
+        lorsque le graphe ne sert qu'à la recherche.
+
+        Args:
+            filename: Chemin du fichier JSON (format de Graph.save_to_file)
+            progress: Fonction appelée avec (octets_lus, octets_totaux)
+
+        Returns:
+            CompiledGraph: Instantané du graphe, avec start_node et goal_node
+        """
+        node_ids, heuristics, positions = [], [], []
+        sources, targets, weights = [], [], []
+        fields = {}
+        for key, value in iter_json_graph(filename, progress):
+            if key == 'nodes':
+                node_ids.append(value['id'])
+                heuristics.append(value['heuristic'])
+                positions.append(value.get('pos'))
+            elif key == 'edges':
+                sources.append(value['from'])
+                targets.append(value['to'])
+                weights.append(value['weight'])
+            else:
+                fields[key] = value
+
+        if not positions or None in positions:
+            positions = None  # Coordonnées absentes ou partielles : ignorées
+        compiled = cls.from_edges(node_ids, heuristics, sources, targets, weights, positions)
+        compiled.start_node = fields.get('start_node')
+        compiled.goal_node = fields.get('goal_node')
+        return compiled
+
+    def save_binary(self, filename, start_node=None, goal_node=None):
+        """
+        Enregistre l'instantané au format binaire (voir graph_io).
+
+        Args:
+            filename: Chemin du fichier à écrire
+            start_node: Nœud de départ (par défaut self.start_node)
+            goal_node: Nœud objectif (par défaut self.goal_node)
+        """
+        write_binary_graph(
+            filename, self.node_ids, self.indptr, self.indices, self.weights,
+            self.heuristics,
+            start_node if start_node is not None else self.start_node,
+            goal_node if goal_node is not None else self.goal_node,
+            self.positions
+        )
+
+    @classmethod
+    def open_binary(cls, filename):
+        """
+        Ouvre un fichier de graphe binaire par projection mémoire.
+
+        L'ouverture ne lit que l'en-tête : les tableaux restent dans le
+        fichier projeté, en lecture seule et partagés entre les processus
+        qui l'ouvrent, et les identifiants sont décodés à la demande.
+
+        Args:
+            filename: Chemin du fichier binaire
+
+        Returns:
+            CompiledGraph: Instantané en mode zero_copy
+        """
+        data = read_binary_graph(filename)
+        node_ids = data['node_ids']
+        compiled = cls(node_ids, data['indptr'], data['indices'], data['weights'],
+                       data['heuristics'], zero_copy=True, index=NodeIdIndex(node_ids))
+        compiled.positions = data['positions']
+        compiled.start_node = data['start_node']
+        compiled.goal_node = data['goal_node']
+        return compiled
+
+
+def _dedupe_edges(src, dst, weights, num_nodes):
+    """
+    Retire les arêtes répétées comme networkx : chaque arête garde la
+    position de sa première occurrence et le poids de la dernière.
+
+    Returns:
+        tuple: (sources, cibles, poids) sans doublon
+    """
+    keys = src * max(num_nodes, 1) + dst
+    unique_keys, first = np.unique(keys, return_index=True)
+    if len(unique_keys) == len(keys):
+        return src, dst, weights
+    _, last = np.unique(keys[::-1], return_index=True)
+    last = len(keys) - 1 - last
+    by_position = np.argsort(first)
+    first, last = first[by_position], last[by_position]
+    return src[first], dst[first], weights[last]
+
+
+def _lookup(sorted_ids, values):
+    """Indices dans sorted_ids des identifiants values, tous supposés présents."""
+    if not len(values):
+        return np.zeros(0, dtype=np.int64)
+    if not len(sorted_ids):
+        raise ValueError(f"Le nœud {values[0]} n'existe pas dans le graphe")
+    if (sorted_ids.dtype.kind in 'iu' and values.dtype.kind in 'iu'
+            and sorted_ids[-1] - sorted_ids[0] == len(sorted_ids) - 1):
+        # Entiers consécutifs (cas courant 0..n-1) : indice par soustraction
+        positions = values.astype(np.int64) - int(sorted_ids[0])
+        missing = (positions < 0) | (positions >= len(sorted_ids))
+        clipped = positions
+    else:
+        try:
+            positions = np.searchsorted(sorted_ids, values)
+        except TypeError:
+            raise ValueError("Les extrémités des arêtes n'ont pas le type des identifiants "
+                             "de nœuds") from None
+        clipped = np.minimum(positions, len(sorted_ids) - 1)
+        missing = (positions >= len(sorted_ids)) | (sorted_ids[clipped] != values)
+    if missing.any():
+        raise ValueError(f"Le nœud {values[np.argmax(missing)]} n'existe pas dans le graphe")
+    return clipped.astype(np.int64, copy=False)
+
+
+def _map_objects(node_ids, sources, targets):
+    """
+    Correspondance par dictionnaire pour des identifiants de types mélangés.
+
+    Returns:
+        tuple: (identifiants dans l'ordre de l'instantané, permutation depuis
+            l'ordre d'origine, indices des sources, indices des cibles)
+    """
+    order = list(range(len(node_ids)))
+    try:
+        order.sort(key=node_ids.__getitem__)
+    except TypeError:
+        pass  # Identifiants non comparables : ordre d'insertion
+    node_list = [node_ids[i] for i in order]
+    index = {node: i for i, node in enumerate(node_list)}
+    if len(index) != len(node_list):
+        raise ValueError("Identifiants de nœuds en double")
+    try:
+        src = np.fromiter((index[node] for node in sources.tolist()), dtype=np.int64,
+                          count=len(sources))
+        dst = np.fromiter((index[node] for node in targets.tolist()), dtype=np.int64,
+                          count=len(targets))
+    except KeyError as error:
+        raise ValueError(f"Le nœud {error.args[0]} n'existe pas dans le graphe") from None
+    return node_list, np.array(order, dtype=np.int64), src, dst
@@ -0,0 +1,248 @@
+import math
+import random
+
+import numpy as np
+
+from compiled_graph import CompiledGraph
+from graph import Graph
+
+
+# Générateurs disponibles par nom (voir generate)
+GENERATORS = ('grid', 'geometric', 'scale_free', 'layered_dag')
+
+
+def grid_graph(width, height, seed=0, diagonal=False, compiled=False):
+    """
+    Grille de width × height nœuds reliés à leurs voisins.
+
+    Chaque case est reliée dans les deux sens à ses 4 voisines (8 avec
+    diagonal), avec un poids tiré entre une et deux fois la longueur de
+    l'arête. Le départ est le coin (0, 0) et l'objectif le coin opposé.
+
+    Args:
+        width: Nombre de colonnes
+        height: Nombre de lignes
+        seed: Graine du générateur
+        diagonal: Si True, relie aussi les cases en diagonale
+        compiled: Si True, renvoie un CompiledGraph sans passer par networkx
+
+    Returns:
+        Graph ou CompiledGraph: Nœuds numérotés ligne par ligne
+    """
+    if width < 1 or height < 1:
+        raise ValueError("La grille doit avoir au moins une ligne et une colonne")
+    rng = np.random.default_rng(seed)
+    rows, cols = np.divmod(np.arange(width * height), width)
+    positions = np.column_stack((cols, rows)).astype(np.float64)
+
+    offsets = [(1, 0), (0, 1)]
+    if diagonal:
+        offsets += [(1, 1), (1, -1)]
+    sources, targets = [], []
+    for dx, dy in offsets:
+        valid = ((cols + dx >= 0) & (cols + dx < width)
+                 & (rows + dy >= 0) & (rows + dy < height))
+        source = np.flatnonzero(valid)
+        target = source + dy * width + dx
+        sources += [source, target]
+        targets += [target, source]
+    return _finish(positions, np.concatenate(sources), np.concatenate(targets), rng,
+                   0, width * height - 1, compiled)
+
+
+def random_geometric_graph(num_nodes, degree=8, seed=0, compiled=False):
+    """
+    Graphe géométrique aléatoire : points uniformes reliés à moins d'un rayon.
+
+    Les points sont tirés dans un carré de côté √n ; le rayon est choisi pour
+    obtenir en moyenne `degree` voisins par nœud. Les paires proches sont
+    trouvées par cases de la taille du rayon, sans comparer tous les
+    couples. Le départ et l'objectif sont les points les plus proches de
+    deux coins opposés (ils peuvent être dans des composantes distinctes si
+    le degré est faible).
+
+    Args:
+        num_nodes: Nombre de nœuds
+        degree: Degré moyen visé
+        seed: Graine du générateur
+        compiled: Si True, renvoie un CompiledGraph sans passer par networkx
+
+    Returns:
+        Graph ou CompiledGraph: Graphe dont chaque arête existe dans les deux sens
+    """
+    if num_nodes < 2:
+        raise ValueError("Le graphe doit avoir au moins deux nœuds")
+    rng = np.random.default_rng(seed)
+    side = math.sqrt(num_nodes)
+    positions = rng.uniform(0.0, side, size=(num_nodes, 2))
+    radius = math.sqrt(degree / math.pi)
+
+    # Tri des points par case : les voisins d'un point sont dans sa case ou
+    # dans l'une des 8 cases adjacentes
+    cells_per_side = max(int(side / radius), 1)
+    cell_xy = np.minimum((positions / side * cells_per_side).astype(np.int64), cells_per_side - 1)
+    cell = cell_xy[:, 1] * cells_per_side + cell_xy[:, 0]
+    order = np.argsort(cell, kind='stable')
+    counts = np.bincount(cell, minlength=cells_per_side ** 2)
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+
+    sources, targets = [], []
+    # Cases voisines dans une seule direction : chaque paire n'est vue qu'une fois
+    for dx, dy in ((0, 0), (1, 0), (-1, 1), (0, 1), (1, 1)):
+        nx_, ny_ = cell_xy[:, 0] + dx, cell_xy[:, 1] + dy
+        valid = (nx_ >= 0) & (nx_ < cells_per_side) & (ny_ < cells_per_side)
+        points = np.flatnonzero(valid)
+        other = ny_[points] * cells_per_side + nx_[points]
+        sizes = counts[other]
+        first = np.repeat(points, sizes)
+        # Position de chaque candidat dans la case voisine : 0, 1, ..., taille-1
+        within = np.arange(sizes.sum()) - np.repeat(np.cumsum(sizes) - sizes, sizes)
+        second = order[np.repeat(starts[other], sizes) + within]
+        keep = np.linalg.norm(positions[first] - positions[second], axis=1) <= radius
+        if dx == 0 and dy == 0:
+            keep &= first < second
+        first, second = first[keep], second[keep]
+        sources += [first, second]
+        targets += [second, first]
+
+    start = int(np.argmin(np.linalg.norm(positions, axis=1)))
+    goal = int(np.argmin(np.linalg.norm(positions - side, axis=1)))
+    return _finish(positions, np.concatenate(sources), np.concatenate(targets), rng,
+                   start, goal, compiled)
+
+
+def scale_free_graph(num_nodes, edges_per_node=3, seed=0, compiled=False):
+    """
+    Graphe sans échelle par attachement préférentiel (Barabási-Albert).
+
+    Chaque nouveau nœud se relie à edges_per_node nœuds existants choisis
+    avec une probabilité proportionnelle à leur degré, ce qui crée quelques
+    nœuds de très fort degré. Les nœuds reçoivent des positions aléatoires
+    pour que l'heuristique euclidienne reste cohérente. Le départ est le
+    dernier nœud ajouté et l'objectif le premier.
+
+    Args:
+        num_nodes: Nombre de nœuds (au moins edges_per_node + 1)
+        edges_per_node: Nombre d'arêtes ajoutées avec chaque nœud
+        seed: Graine du générateur
+        compiled: Si True, renvoie un CompiledGraph sans passer par networkx
+
+    Returns:
+        Graph ou CompiledGraph: Graphe dont chaque arête existe dans les deux sens
+    """
+    if edges_per_node < 1 or num_nodes <= edges_per_node:
+        raise ValueError("Il faut au moins edges_per_node + 1 nœuds et une arête par nœud")
+    rng = np.random.default_rng(seed)
+    choice = random.Random(seed).choice
+    positions = rng.uniform(0.0, math.sqrt(num_nodes), size=(num_nodes, 2))
+
+    # Chaque nœud apparaît dans `ends` autant de fois que son degré
+    ends = list(range(edges_per_node))
+    sources, targets = [], []
+    for node in range(edges_per_node, num_nodes):
+        chosen = set()
+        while len(chosen) < edges_per_node:
+            chosen.add(choice(ends))
+        for other in chosen:
+            sources.append(node)
+            targets.append(other)
+        ends.extend(chosen)
+        ends.extend([node] * edges_per_node)
+
+    sources = np.array(sources, dtype=np.int64)
+    targets = np.array(targets, dtype=np.int64)
+    return _finish(positions, np.concatenate((sources, targets)),
+                   np.concatenate((targets, sources)), rng, num_nodes - 1, 0, compiled)
+
+
+def layered_dag(num_layers, layer_width, degree=3, seed=0, compiled=False):
+    """
+    Graphe orienté acyclique en couches.
+
+    Chaque nœud est relié à `degree` nœuds tirés au hasard dans la couche
+    suivante, plus une arête vers la colonne suivante qui garantit un chemin
+    du départ (première couche, colonne 0) à l'objectif (dernière couche).
+
+    Args:
+        num_layers: Nombre de couches
+        layer_width: Nombre de nœuds par couche
+        degree: Nombre d'arêtes aléatoires par nœud
+        seed: Graine du générateur
+        compiled: Si True, renvoie un CompiledGraph sans passer par networkx
+
+    Returns:
+        Graph ou CompiledGraph: Nœud couche × layer_width + colonne
+    """
+    if num_layers < 2 or layer_width < 1:
+        raise ValueError("Il faut au moins deux couches non vides")
+    rng = np.random.default_rng(seed)
+    num_nodes = num_layers * layer_width
+    layers, columns = np.divmod(np.arange(num_nodes), layer_width)
+    positions = np.column_stack((layers * 2.0, columns)).astype(np.float64)
+
+    source = np.arange(num_nodes - layer_width)
+    next_layer = (layers[source] + 1) * layer_width
+    random_targets = next_layer[:, None] + rng.integers(0, layer_width, size=(len(source), degree))
+    chain_targets = next_layer + (columns[source] + 1) % layer_width
+    sources = np.concatenate((np.repeat(source, degree), source))
+    targets = np.concatenate((random_targets.ravel(), chain_targets))
+
+    goal = (num_layers - 1) * layer_width + (num_layers - 1) % layer_width
+    return _finish(positions, sources, targets, rng, 0, goal, compiled)
+
+
+def generate(kind, num_nodes, seed=0, compiled=False):
+    """
+    Génère un graphe d'environ num_nodes nœuds avec les réglages par défaut.
+
+    Args:
+        kind: Type de graphe parmi GENERATORS
+        num_nodes: Nombre de nœuds visé
+        seed: Graine du générateur
+        compiled: Si True, renvoie un CompiledGraph sans passer par networkx
+
+    Returns:
+        Graph ou CompiledGraph: Graphe avec nœuds de départ et d'arrivée
+    """
+    if kind == 'grid':
+        side = max(int(round(math.sqrt(num_nodes))), 1)
+        return grid_graph(side, side, seed, compiled=compiled)
+    if kind == 'geometric':
+        return random_geometric_graph(num_nodes, seed=seed, compiled=compiled)
+    if kind == 'scale_free':
+        return scale_free_graph(num_nodes, seed=seed, compiled=compiled)
+    if kind == 'layered_dag':
+        num_layers = max(int(round(math.sqrt(num_nodes))), 2)
+        return layered_dag(num_layers, max(num_nodes // num_layers, 1), seed=seed,
+                           compiled=compiled)
+    raise ValueError(f"Générateur inconnu: {kind}")
+
+
+def _finish(positions, sources, targets, rng, start, goal, compiled):
+    """
+    Tire les poids, calcule les heuristiques et construit le graphe.
+
+    Le poids d'une arête est sa longueur multipliée par un facteur tiré
+    dans [1, 2) : avec h(n) = distance euclidienne au but, h(u) <= w(u, v) +
+    h(v) pour toute arête, l'heuristique est donc cohérente (et admissible).
+    Une arête tirée deux fois n'est gardée qu'une fois, pour que Graph et
+    CompiledGraph aient le même contenu.
+    """
+    keys = sources * len(positions) + targets
+    _, first = np.unique(keys, return_index=True)
+    if len(first) != len(keys):
+        first.sort()
+        sources, targets = sources[first], targets[first]
+    lengths = np.linalg.norm(positions[sources] - positions[targets], axis=1)
+    weights = lengths * rng.uniform(1.0, 2.0, size=len(lengths))
+    heuristics = np.linalg.norm(positions - positions[goal], axis=1)
+    node_ids = np.arange(len(positions))
+
+    if compiled:
+        graph = CompiledGraph.from_arrays(node_ids, heuristics, sources, targets, weights,
+                                          positions)
+        graph.start_node = start
+        graph.goal_node = goal
+        return graph
+    return Graph.from_arrays(node_ids, heuristics, sources, targets, weights, positions,
+                             start=start, goal=goal)
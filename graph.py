@@ -1,6 +1,9 @@
 import json
 import networkx as nx
+import numpy as np
 
+from compiled_graph import CompiledGraph
+from graph_io import load_json_graph
 
 
 class Graph:
@@ -8,19 +11,105 @@ class Graph:
     Classe représentant un graphe pour l'algorithme Best-First Search.
     """
     def __init__(self):
-        self.graph = nx.DiGraph()
+        self._graph = nx.DiGraph()  # None tant qu'un graphe from_arrays n'est pas matérialisé
         self.start_node = None
         self.goal_node = None
+        self.version = 0  # Incrémenté à chaque modification du graphe
+        self.heuristic = None  # Heuristique calculée utilisée par défaut (voir set_heuristic)
+        self._compiled = None
+        self._listeners = []  # Fonctions prévenues des modifications (voir add_listener)
         
-    def add_node(self, node_id, heuristic=0):
+    @property
+    def graph(self):
+        """
+        Graphe networkx (nx.DiGraph) des nœuds et arêtes.
+        
+        Pour un graphe construit par from_arrays, il n'est créé qu'au premier
+        accès (modification, visualisation...) : la recherche, compile() et
+        save_to_file n'en ont pas besoin.
+        """
+        if self._graph is None:
+            self._graph = self._networkx_from_compiled(self._compiled)
+        return self._graph
+    
+    @classmethod
+    def from_arrays(cls, node_ids, heuristics=None, sources=(), targets=(), weights=None,
+                    positions=None, start=None, goal=None):
+        """
+        Construit un graphe depuis des tableaux, en une seule passe vectorisée.
+        
+        Les tableaux sont validés en bloc et l'instantané CSR est construit
+        directement (voir CompiledGraph.from_arrays), sans insérer les
+        éléments un par un dans networkx. Le résultat est le même qu'avec
+        add_nodes et add_edges.
+        
+        Args:
+            node_ids: Tableau 1-D des identifiants (nombres ou chaînes)
+            heuristics: Valeurs heuristiques dans l'ordre de node_ids (0 par défaut)
+            sources: Identifiants des nœuds de départ des arêtes
+            targets: Identifiants des nœuds d'arrivée des arêtes
+            weights: Poids des arêtes (1 par défaut)
+            positions: Coordonnées (nœuds × dimensions) dans l'ordre de node_ids
+            start: Nœud de départ (optionnel)
+            goal: Nœud objectif (optionnel)
+            
+        Returns:
+            Graph: Graphe prêt pour la recherche
+        """
+        compiled = CompiledGraph.from_arrays(node_ids, heuristics, sources, targets, weights,
+                                             positions)
+        graph = cls._from_compiled(compiled)
+        if start is not None:
+            graph.set_start_node(start)
+        if goal is not None:
+            graph.set_goal_node(goal)
+        return graph
+    
+    @classmethod
+    def _from_compiled(cls, compiled):
+        """Graphe dont le contenu est l'instantané donné ; networkx est construit à la demande."""
+        graph = cls()
+        graph._graph = None
+        graph._compiled = compiled
+        return graph
+    
+    @staticmethod
+    def _networkx_from_compiled(compiled):
+        """Reconstruit le graphe networkx d'un instantané."""
+        graph_nx = nx.DiGraph()
+        node_ids = list(compiled.node_ids)
+        heuristics = np.asarray(compiled.heuristics).tolist()
+        if compiled.positions is None:
+            graph_nx.add_nodes_from((node, {'heuristic': heuristic})
+                                    for node, heuristic in zip(node_ids, heuristics))
+        else:
+            graph_nx.add_nodes_from((node, {'heuristic': heuristic, 'pos': tuple(pos)})
+                                    for node, heuristic, pos in
+                                    zip(node_ids, heuristics, compiled.positions.tolist()))
+        indptr = np.asarray(compiled.indptr)
+        sources = np.repeat(np.arange(len(node_ids)), np.diff(indptr))
+        graph_nx.add_edges_from((node_ids[u], node_ids[v], {'weight': w}) for u, v, w in
+                                zip(sources.tolist(), np.asarray(compiled.indices).tolist(),
+                                    np.asarray(compiled.weights).tolist()))
+        return graph_nx
+    
+    def add_node(self, node_id, heuristic=0, pos=None):
         """
         Ajoute un nœud au graphe avec sa valeur heuristique.
         
         Args:
             node_id: Identifiant unique du nœud
             heuristic: Valeur heuristique du nœud (estimation du coût pour atteindre le but)
+            pos: Coordonnées du nœud, par exemple (x, y), utilisées par les
+                heuristiques calculées (voir heuristics.CoordinateHeuristic)
         """
-        self.graph.add_node(node_id, heuristic=heuristic)
+        if pos is None:
+            self.graph.add_node(node_id, heuristic=heuristic)
+        else:
+            self.graph.add_node(node_id, heuristic=heuristic, pos=tuple(pos))
+        self._invalidate()
+        if self._listeners:
+            self._notify('nodes', [node_id])
     
     def add_edge(self, from_node, to_node, weight=1):
         """
@@ -32,17 +121,149 @@ class Graph:
             weight: Poids/coût de l'arête
         """
         self.graph.add_edge(from_node, to_node, weight=weight)
+        self._invalidate()
+        if self._listeners:
+            self._notify('edges', [(from_node, to_node, weight)])
+    
+    def add_nodes(self, nodes):
+        """
+        Ajoute plusieurs nœuds en une seule insertion groupée.
+        
+        Args:
+            nodes: Itérable de couples (node_id, heuristic) ou de triplets
+                (node_id, heuristic, pos)
+        """
+        if self._listeners:
+            nodes = list(nodes)  # Parcourus deux fois : insertion puis notification
+        self.graph.add_nodes_from(
+            (node[0], {'heuristic': node[1]} if len(node) < 3 or node[2] is None
+             else {'heuristic': node[1], 'pos': tuple(node[2])})
+            for node in nodes
+        )
+        self._invalidate()
+        if self._listeners:
+            self._notify('nodes', [node[0] for node in nodes])
+    
+    def add_edges(self, edges):
+        """
+        Ajoute plusieurs arêtes orientées en une seule insertion groupée.
+        
+        Args:
+            edges: Itérable de triplets (from_node, to_node, weight)
+        """
+        if self._listeners:
+            edges = list(edges)
+        self.graph.add_edges_from((from_node, to_node, {'weight': weight})
+                                  for from_node, to_node, weight in edges)
+        self._invalidate()
+        if self._listeners:
+            self._notify('edges', edges)
+    
+    def set_heuristic(self, heuristic):
+        """
+        Définit l'heuristique calculée utilisée par défaut par les recherches.
+        
+        Args:
+            heuristic: Instance de heuristics.Heuristic, nom de distance
+                ('euclidean', 'manhattan', 'chebyshev') ou fonction
+                h(node_id, goal_id) ; None revient aux valeurs stockées
+        """
+        from heuristics import make_heuristic
+        self.heuristic = make_heuristic(heuristic)
+    
+    def get_position(self, node_id):
+        """Récupère les coordonnées d'un nœud (None s'il n'en a pas)."""
+        return self.graph.nodes[node_id].get('pos')
+    
+    def add_listener(self, listener):
+        """
+        Enregistre une fonction prévenue de chaque modification du graphe.
+        
+        Args:
+            listener: Fonction (kind, items) appelée après la modification ;
+                kind vaut 'nodes' (items : identifiants des nœuds ajoutés ou
+                modifiés) ou 'edges' (items : triplets (from_node, to_node,
+                weight) des arêtes ajoutées ou repondérées)
+        """
+        self._listeners.append(listener)
+    
+    def remove_listener(self, listener):
+        """Retire une fonction enregistrée par add_listener."""
+        self._listeners.remove(listener)
+    
+    def _notify(self, kind, items):
+        for listener in list(self._listeners):
+            listener(kind, items)
+    
+    def _invalidate(self):
+        """Signale une modification : l'instantané compilé n'est plus valide."""
+        if self._graph is None:
+            self._graph = self._networkx_from_compiled(self._compiled)
+        self.version += 1
+        self._compiled = None
+    
+    def compile(self):
+        """
+        Fige le graphe sous forme CSR indexée par des entiers.
+
+        L'instantané est mis en cache jusqu'à la prochaine modification par
+        add_node ou add_edge.
+
+        Returns:
+            CompiledGraph: Instantané du graphe
+        """
+        if self._compiled is not None:
+            return self._compiled
+        
+        node_ids = list(self.graph.nodes)
+        try:
+            node_ids.sort()
+        except TypeError:
+            pass  # Identifiants non comparables : ordre d'insertion
+        index = {node: i for i, node in enumerate(node_ids)}
+        
+        adjacency = self.graph.adj
+        indptr = np.zeros(len(node_ids) + 1, dtype=np.int64)
+        indices = []
+        weights = []
+        for i, node in enumerate(node_ids):
+            for neighbor, data in adjacency[node].items():
+                indices.append(index[neighbor])
+                weights.append(data['weight'])
+            indptr[i + 1] = len(indices)
+        
+        self._compiled = CompiledGraph(
+            node_ids,
+            indptr,
+            np.array(indices, dtype=np.int64),
+            np.array(weights, dtype=np.float64),
+            np.array([self.graph.nodes[node].get('heuristic', 0) for node in node_ids],
+                     dtype=np.float64)
+        )
+        positions = [self.graph.nodes[node].get('pos') for node in node_ids]
+        if positions and None not in positions:
+            self._compiled.positions = np.array(positions, dtype=np.float64)
+        return self._compiled
+    
+    def content_hash(self):
+        """Empreinte du contenu du graphe, stable entre processus (voir CompiledGraph)."""
+        return self.compile().content_hash()
+    
+    def __contains__(self, node_id):
+        if self._graph is None:
+            return node_id in self._compiled.index
+        return node_id in self._graph
     
     def set_start_node(self, node_id):
         """Définit le nœud de départ de la recherche."""
-        if node_id in self.graph.nodes:
+        if node_id in self:
             self.start_node = node_id
         else:
             raise ValueError(f"Le nœud {node_id} n'existe pas dans le graphe")
     
     def set_goal_node(self, node_id):
         """Définit le nœud objectif de la recherche."""
-        if node_id in self.graph.nodes:
+        if node_id in self:
             self.goal_node = node_id
         else:
             raise ValueError(f"Le nœud {node_id} n'existe pas dans le graphe")
@@ -55,6 +276,10 @@ class Graph:
         """Récupère tous les voisins d'un nœud."""
         return list(self.graph.successors(node_id))
     
+    def get_predecessors(self, node_id):
+        """Récupère tous les prédécesseurs d'un nœud."""
+        return list(self.graph.predecessors(node_id))
+    
     def get_edge_weight(self, from_node_id, to_node_id):
         """Récupère le poids d'une arête entre deux nœuds."""
         return self.graph[from_node_id][to_node_id]['weight']
@@ -66,22 +291,30 @@ class Graph:
         Args:
             filename: Chemin du fichier pour sauvegarder le graphe
         """
-        graph_data = {
-            'nodes': [
+        if self._graph is None:
+            # Graphe construit par from_arrays : écrit depuis l'instantané,
+            # sans matérialiser le graphe networkx
+            nodes, edges = self._records_from_compiled(self._compiled)
+        else:
+            nodes = [
                 {
                     'id': node,
-                    'heuristic': self.graph.nodes[node]['heuristic']
+                    'heuristic': data['heuristic'],
+                    **({'pos': list(data['pos'])} if 'pos' in data else {})
                 } 
-                for node in self.graph.nodes
-            ],
-            'edges': [
+                for node, data in self.graph.nodes(data=True)
+            ]
+            edges = [
                 {
                     'from': edge[0],
                     'to': edge[1],
                     'weight': self.graph.edges[edge]['weight']
                 }
                 for edge in self.graph.edges
-            ],
+            ]
+        graph_data = {
+            'nodes': nodes,
+            'edges': edges,
             'start_node': self.start_node,
             'goal_node': self.goal_node
         }
@@ -89,35 +322,96 @@ class Graph:
         with open(filename, 'w') as file:
             json.dump(graph_data, file, indent=4)
     
+    @staticmethod
+    def _records_from_compiled(compiled):
+        """Nœuds et arêtes d'un instantané au format de save_to_file."""
+        node_ids = list(compiled.node_ids)
+        heuristics = np.asarray(compiled.heuristics).tolist()
+        if compiled.positions is None:
+            nodes = [{'id': node, 'heuristic': heuristic}
+                     for node, heuristic in zip(node_ids, heuristics)]
+        else:
+            nodes = [{'id': node, 'heuristic': heuristic, 'pos': pos}
+                     for node, heuristic, pos in
+                     zip(node_ids, heuristics, compiled.positions.tolist())]
+        indptr = np.asarray(compiled.indptr)
+        sources = np.repeat(np.arange(len(node_ids)), np.diff(indptr))
+        edges = [{'from': node_ids[u], 'to': node_ids[v], 'weight': w} for u, v, w in
+                 zip(sources.tolist(), np.asarray(compiled.indices).tolist(),
+                     np.asarray(compiled.weights).tolist())]
+        return nodes, edges
+    
+    def save_binary(self, filename):
+        """
+        Sauvegarde le graphe au format binaire compact (voir graph_io).
+        
+        Args:
+            filename: Chemin du fichier binaire à écrire
+        """
+        self.compile().save_binary(filename, self.start_node, self.goal_node)
+    
     @classmethod
-    def load_from_file(cls, filename):
+    def load_binary(cls, filename):
         """
-        Charge un graphe depuis un fichier JSON.
+        Charge un graphe depuis un fichier binaire.
+        
+        Le graphe networkx est reconstruit ; pour la recherche seule,
+        CompiledGraph.open_binary évite cette reconstruction.
         
         Args:
-            filename: Chemin du fichier à charger
+            filename: Chemin du fichier binaire
             
         Returns:
             Graph: Une instance de graphe chargée depuis le fichier
         """
-        with open(filename, 'r') as file:
-            graph_data = json.load(file)
+        compiled = CompiledGraph.open_binary(filename)
+        node_ids = list(compiled.node_ids)
         
         graph = cls()
+        if compiled.positions is None:
+            graph.add_nodes(zip(node_ids, compiled.heuristics.tolist()))
+        else:
+            graph.add_nodes(zip(node_ids, compiled.heuristics.tolist(),
+                                compiled.positions.tolist()))
+        sources = np.repeat(np.arange(len(node_ids)), np.diff(compiled.indptr))
+        graph.add_edges((node_ids[u], node_ids[v], w) for u, v, w in
+                        zip(sources.tolist(), compiled.indices.tolist(),
+                            compiled.weights.tolist()))
         
-        # Ajouter les nœuds
-        for node_data in graph_data['nodes']:
-            graph.add_node(node_data['id'], node_data['heuristic'])
+        if compiled.start_node is not None:
+            graph.set_start_node(compiled.start_node)
+        if compiled.goal_node is not None:
+            graph.set_goal_node(compiled.goal_node)
+        
+        return graph
+    
+    @classmethod
+    def load_from_file(cls, filename, progress=None, chunk_size=10000):
+        """
+        Charge un graphe depuis un fichier JSON.
+        
+        Le fichier est lu en flux (voir graph_io.load_json_graph) : les nœuds
+        et arêtes sont insérés par paquets sans charger le document entier.
+        
+        Args:
+            filename: Chemin du fichier à charger
+            progress: Fonction appelée avec (octets_lus, octets_totaux)
+                pendant le chargement
+            chunk_size: Nombre d'éléments par insertion groupée
+            
+        Returns:
+            Graph: Une instance de graphe chargée depuis le fichier
+        """
+        graph = cls()
         
-        # Ajouter les arêtes
-        for edge_data in graph_data['edges']:
-            graph.add_edge(edge_data['from'], edge_data['to'], edge_data['weight'])
+        # Ajouter les nœuds et les arêtes au fil de la lecture
+        graph_data = load_json_graph(graph, filename, chunk_size, progress)
         
         # Définir les nœuds de départ et d'arrivée
-        if graph_data.get('start_node'):
+        if graph_data.get('start_node') is not None:
             graph.set_start_node(graph_data['start_node'])
         
-        if graph_data.get('goal_node'):
+        if graph_data.get('goal_node') is not None:
             graph.set_goal_node(graph_data['goal_node'])
         
         return graph
@@ -0,0 +1,445 @@
+import argparse
+import codecs
+import json
+import mmap
+import os
+import re
+import struct
+
+import numpy as np
+
+
+# Taille des blocs lus dans le fichier (octets)
+READ_SIZE = 1 << 20
+
+# Tableaux du format JSON lus élément par élément
+STREAMED_ARRAYS = ('nodes', 'edges')
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+_ITEM_END = re.compile(r'[ \t\n\r]*([,\]])[ \t\n\r]*')
+
+
+class _JSONStream:
+    """
+    Lecteur JSON incrémental sur un fichier binaire UTF-8.
+
+    Seule une fenêtre du texte est conservée en mémoire ; les valeurs sont
+    décodées une à une avec json.JSONDecoder.raw_decode.
+    """
+    def __init__(self, file, total_bytes=None, progress=None):
+        self.file = file
+        self.total_bytes = total_bytes
+        self.progress = progress
+        self.bytes_read = 0
+        self.buffer = ''
+        self.pos = 0
+        self.eof = False
+        self._decoder = codecs.getincrementaldecoder('utf-8')()
+        self._json = json.JSONDecoder()
+
+    def _fill(self):
+        """Lit le bloc suivant ; renvoie False en fin de fichier."""
+        if self.eof:
+            return False
+        data = self.file.read(READ_SIZE)
+        self.bytes_read += len(data)
+        if not data:
+            self.eof = True
+            self.buffer = self.buffer[self.pos:] + self._decoder.decode(b'', final=True)
+        else:
+            self.buffer = self.buffer[self.pos:] + self._decoder.decode(data)
+        self.pos = 0
+        if self.progress is not None:
+            self.progress(self.bytes_read, self.total_bytes)
+        return True
+
+    def peek(self):
+        """Renvoie le prochain caractère significatif sans le consommer."""
+        while True:
+            self.pos = _WHITESPACE.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._fill():
+                raise ValueError("Fin de fichier JSON inattendue")
+
+    def expect(self, char):
+        """Consomme le caractère attendu."""
+        if self.peek() != char:
+            raise ValueError(f"Caractère '{char}' attendu à l'octet ~{self.bytes_read}")
+        self.pos += 1
+
+    def value(self):
+        """Décode la prochaine valeur JSON complète."""
+        self.peek()
+        while True:
+            try:
+                value, end = self._json.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # Un nombre en fin de fenêtre peut être tronqué : relire pour s'en assurer
+            if end == len(self.buffer) and self._fill():
+                continue
+            self.pos = end
+            return value
+
+    def array_items(self):
+        """Produit un à un les éléments du tableau JSON qui commence ici."""
+        self.expect('[')
+        if self.peek() == ']':
+            self.pos += 1
+            return
+        decode = self._json.raw_decode
+        item_end = _ITEM_END.match
+        while True:
+            try:
+                value, end = decode(self.buffer, self.pos)
+                separator = item_end(self.buffer, end)
+            except json.JSONDecodeError:
+                separator = None
+            # Élément ou séparateur coupé par la fin de la fenêtre : relire
+            if separator is None:
+                if not self._fill():
+                    raise ValueError("Tableau JSON incomplet")
+                self.pos = _WHITESPACE.match(self.buffer, self.pos).end()
+                continue
+            self.pos = separator.end()
+            yield value
+            if separator.group(1) == ']':
+                return
+
+
+def iter_json_graph(filename, progress=None):
+    """
+    Parcourt un fichier de graphe JSON sans le charger entièrement.
+
+    Les éléments des tableaux 'nodes' et 'edges' sont produits un par un ;
+    les autres champs (start_node, goal_node...) sont produits une fois lus.
+    Le format est celui écrit par Graph.save_to_file.
+
+    Args:
+        filename: Chemin du fichier JSON
+        progress: Fonction appelée avec (octets_lus, octets_totaux) après
+            chaque bloc lu
+
+    Yields:
+        tuple: (clé, valeur) où clé vaut 'nodes' ou 'edges' pour chaque
+            élément de ces tableaux, ou le nom du champ pour les autres
+    """
+    with open(filename, 'rb') as file:
+        stream = _JSONStream(file, os.fstat(file.fileno()).st_size, progress)
+        stream.expect('{')
+        if stream.peek() == '}':
+            return
+        while True:
+            key = stream.value()
+            stream.expect(':')
+            if key in STREAMED_ARRAYS and stream.peek() == '[':
+                for item in stream.array_items():
+                    yield key, item
+            else:
+                yield key, stream.value()
+            if stream.peek() != ',':
+                break
+            stream.expect(',')
+        stream.expect('}')
+
+
+def load_json_graph(graph, filename, chunk_size=10000, progress=None):
+    """
+    Remplit un graphe depuis un fichier JSON lu en flux.
+
+    Les nœuds et arêtes sont insérés par paquets de chunk_size éléments avec
+    Graph.add_nodes / Graph.add_edges : la mémoire de pointe reste proche de
+    celle du graphe construit, sans copie intermédiaire du document.
+
+    Args:
+        graph: Instance de Graph à remplir
+        filename: Chemin du fichier JSON
+        chunk_size: Nombre d'éléments par insertion groupée
+        progress: Fonction appelée avec (octets_lus, octets_totaux)
+
+    Returns:
+        dict: Champs hors 'nodes' et 'edges' (start_node, goal_node...)
+    """
+    fields = {}
+    nodes = []
+    edges = []
+    for key, value in iter_json_graph(filename, progress):
+        if key == 'nodes':
+            nodes.append((value['id'], value['heuristic'], value.get('pos')))
+            if len(nodes) >= chunk_size:
+                graph.add_nodes(nodes)
+                nodes = []
+        elif key == 'edges':
+            edges.append((value['from'], value['to'], value['weight']))
+            if len(edges) >= chunk_size:
+                graph.add_edges(edges)
+                edges = []
+        else:
+            fields[key] = value
+    graph.add_nodes(nodes)
+    graph.add_edges(edges)
+    return fields
+
+
+# --- Format binaire -------------------------------------------------------
+#
+# En-tête de 16 octets : signature, version et longueur des métadonnées.
+# Les métadonnées (JSON UTF-8) donnent le nœud de départ, le nœud objectif,
+# le type des identifiants et l'emplacement de chaque section. Les sections
+# (table des identifiants, tableaux CSR, heuristiques) sont alignées sur
+# 8 octets pour être projetées en mémoire sans copie. La section facultative
+# 'positions' (float64, nœuds × dimensions, à plat) n'est présente que si le
+# champ 'position_dims' des métadonnées est renseigné.
+
+BINARY_MAGIC = b'BFSGRAPH'
+BINARY_VERSION = 1
+BINARY_EXTENSION = '.bfsg'
+_BINARY_HEADER = struct.Struct('<8sII')
+_ALIGNMENT = 8
+
+
+class NodeIdTable:
+    """
+    Table des identifiants de nœuds lue dans un fichier binaire projeté.
+
+    Se comporte comme une liste en lecture seule : chaque identifiant est
+    décodé à la demande, rien n'est chargé à l'ouverture. Pour les tables
+    d'entiers ou de chaînes, triées par construction, la recherche d'un
+    identifiant se fait par dichotomie.
+    """
+    def __init__(self, kind, values=None, offsets=None, blob=None):
+        """
+        Args:
+            kind: 'int', 'str' ou 'json' (types mixtes)
+            values: Tableau int64 des identifiants ('int')
+            offsets: Tableau int64 (n+1) des débuts d'identifiants dans blob
+            blob: Tableau uint8 des identifiants encodés ('str' et 'json')
+        """
+        self.kind = kind
+        self._values = values
+        self._offsets = offsets
+        self._blob = blob
+        self._index = None
+
+    def __len__(self):
+        if self.kind == 'int':
+            return len(self._values)
+        return len(self._offsets) - 1
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        if self.kind == 'int':
+            return int(self._values[i])
+        if i < 0:
+            i += len(self)
+        text = bytes(self._blob[self._offsets[i]:self._offsets[i + 1]]).decode('utf-8')
+        return text if self.kind == 'str' else json.loads(text)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def index_of(self, node):
+        """
+        Renvoie l'indice d'un identifiant, ou lève KeyError.
+
+        Args:
+            node: Identifiant recherché
+        """
+        if self.kind == 'json':
+            if self._index is None:
+                self._index = {value: i for i, value in enumerate(self)}
+            return self._index[node]
+
+        expected = int if self.kind == 'int' else str
+        if type(node) is not expected:
+            raise KeyError(node)
+        low, high = 0, len(self)
+        while low < high:
+            middle = (low + high) // 2
+            if self[middle] < node:
+                low = middle + 1
+            else:
+                high = middle
+        if low < len(self) and self[low] == node:
+            return low
+        raise KeyError(node)
+
+
+class NodeIdIndex:
+    """Correspondance identifiant -> indice s'appuyant sur une NodeIdTable."""
+    def __init__(self, table):
+        self.table = table
+
+    def __getitem__(self, node):
+        return self.table.index_of(node)
+
+    def __contains__(self, node):
+        try:
+            self.table.index_of(node)
+        except (KeyError, TypeError):
+            return False
+        return True
+
+    def __len__(self):
+        return len(self.table)
+
+
+def _encode_node_ids(node_ids):
+    """Choisit l'encodage de la table des identifiants."""
+    if all(type(node) is int for node in node_ids):
+        return 'int', {'id_values': np.array(node_ids, dtype=np.int64)}
+
+    if all(type(node) is str for node in node_ids):
+        kind, encoded = 'str', [node.encode('utf-8') for node in node_ids]
+    else:
+        kind, encoded = 'json', [json.dumps(node).encode('utf-8') for node in node_ids]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(item) for item in encoded], out=offsets[1:])
+    blob = np.frombuffer(b''.join(encoded), dtype=np.uint8)
+    return kind, {'id_offsets': offsets, 'id_blob': blob}
+
+
+def write_binary_graph(filename, node_ids, indptr, indices, weights, heuristics,
+                       start_node=None, goal_node=None, positions=None):
+    """
+    Écrit un graphe compilé au format binaire.
+
+    Args:
+        filename: Chemin du fichier à écrire
+        node_ids: Identifiants des nœuds, dans l'ordre des indices
+        indptr, indices, weights, heuristics: Tableaux CSR du graphe
+        start_node: Nœud de départ enregistré dans le fichier
+        goal_node: Nœud objectif enregistré dans le fichier
+        positions: Coordonnées des nœuds (nœuds × dimensions), ou None
+    """
+    node_ids = list(node_ids)
+    kind, sections = _encode_node_ids(node_ids)
+    index_dtype = np.int32 if len(node_ids) < 2 ** 31 else np.int64
+    sections['indptr'] = np.asarray(indptr, dtype=np.int64)
+    sections['indices'] = np.asarray(indices, dtype=index_dtype)
+    sections['weights'] = np.asarray(weights, dtype=np.float64)
+    sections['heuristics'] = np.asarray(heuristics, dtype=np.float64)
+    position_dims = None
+    if positions is not None:
+        positions = np.asarray(positions, dtype=np.float64)
+        position_dims = positions.shape[1]
+        sections['positions'] = positions.reshape(-1)
+
+    # Emplacements relatifs au début de la zone de données
+    layout = {}
+    offset = 0
+    for name, array in sections.items():
+        layout[name] = [offset, array.dtype.str, len(array)]
+        offset = _align(offset + array.nbytes)
+
+    meta = json.dumps({
+        'id_kind': kind,
+        'start_node': start_node,
+        'goal_node': goal_node,
+        'position_dims': position_dims,
+        'sections': layout
+    }).encode('utf-8')
+    data_offset = _align(_BINARY_HEADER.size + len(meta))
+
+    with open(filename, 'wb') as file:
+        file.write(_BINARY_HEADER.pack(BINARY_MAGIC, BINARY_VERSION, len(meta)))
+        file.write(meta)
+        for name, array in sections.items():
+            file.seek(data_offset + layout[name][0])
+            file.write(np.ascontiguousarray(array).tobytes())
+
+
+def read_binary_graph(filename):
+    """
+    Projette un fichier de graphe binaire en mémoire, en lecture seule.
+
+    Les tableaux renvoyés sont des vues sur la projection : aucune donnée
+    n'est copiée, et plusieurs processus ouvrant le même fichier partagent
+    les mêmes pages mémoire.
+
+    Args:
+        filename: Chemin du fichier binaire
+
+    Returns:
+        dict: 'node_ids' (NodeIdTable), 'indptr', 'indices', 'weights',
+            'heuristics', 'positions' (tableau nœuds × dimensions, ou None),
+            'start_node' et 'goal_node'
+    """
+    with open(filename, 'rb') as file:
+        mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    magic, version, meta_length = _BINARY_HEADER.unpack_from(mapping, 0)
+    if magic != BINARY_MAGIC:
+        raise ValueError(f"{filename} n'est pas un fichier de graphe binaire")
+    if version != BINARY_VERSION:
+        raise ValueError(f"Version de format binaire non supportée: {version}")
+    start = _BINARY_HEADER.size
+    meta = json.loads(bytes(mapping[start:start + meta_length]).decode('utf-8'))
+    data_offset = _align(start + meta_length)
+
+    arrays = {}
+    for name, (offset, dtype, count) in meta['sections'].items():
+        arrays[name] = np.frombuffer(mapping, dtype=np.dtype(dtype), count=count,
+                                     offset=data_offset + offset)
+
+    positions = None
+    position_dims = meta.get('position_dims')
+    if position_dims:
+        positions = arrays['positions'].reshape(-1, position_dims)
+
+    return {
+        'node_ids': NodeIdTable(meta['id_kind'], arrays.get('id_values'),
+                                arrays.get('id_offsets'), arrays.get('id_blob')),
+        'indptr': arrays['indptr'],
+        'indices': arrays['indices'],
+        'weights': arrays['weights'],
+        'heuristics': arrays['heuristics'],
+        'positions': positions,
+        'start_node': meta['start_node'],
+        'goal_node': meta['goal_node']
+    }
+
+
+def convert_json_to_binary(json_filename, binary_filename, progress=None):
+    """
+    Convertit un fichier de graphe JSON au format binaire.
+
+    La conversion passe par CompiledGraph.load_from_file : le fichier JSON
+    est lu en flux, sans construire de graphe networkx.
+
+    Args:
+        json_filename: Fichier JSON source (format de Graph.save_to_file)
+        binary_filename: Fichier binaire à écrire
+        progress: Fonction appelée avec (octets_lus, octets_totaux)
+    """
+    # Import local : compiled_graph importe ce module
+    from compiled_graph import CompiledGraph
+    compiled = CompiledGraph.load_from_file(json_filename, progress)
+    compiled.save_binary(binary_filename)
+
+
+def _align(offset):
+    return (offset + _ALIGNMENT - 1) // _ALIGNMENT * _ALIGNMENT
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Convertit des graphes JSON au format binaire")
+    parser.add_argument('inputs', nargs='+', help="Fichiers JSON (ex: example_graphs/*.json)")
+    parser.add_argument('--output-dir', help="Répertoire de sortie (par défaut celui du fichier source)")
+    args = parser.parse_args()
+
+    for json_filename in args.inputs:
+        base = os.path.splitext(os.path.basename(json_filename))[0] + BINARY_EXTENSION
+        directory = args.output_dir or os.path.dirname(json_filename)
+        binary_filename = os.path.join(directory, base)
+        convert_json_to_binary(json_filename, binary_filename)
+        print(f"{json_filename} -> {binary_filename}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,310 @@
+import hashlib
+import json
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+
+# Nombre de buts dont les valeurs heuristiques restent mémorisées
+DEFAULT_CACHE_SIZE = 8
+
+# Distances disponibles pour CoordinateHeuristic
+METRICS = ('euclidean', 'manhattan', 'chebyshev')
+
+
+class HeuristicMemo(dict):
+    """
+    Valeurs heuristiques d'un but, calculées à la demande et mémorisées.
+
+    Le mémo s'indexe comme la liste heuristics de
+    CompiledGraph.adjacency_lists : heuristics[nœud] renvoie la valeur du
+    nœud, calculée au premier accès. Une valeur déjà calculée est lue au
+    prix d'une recherche dans un dictionnaire.
+    """
+    def __init__(self, evaluate):
+        """
+        Args:
+            evaluate: Fonction (tableau d'indices) -> tableau de valeurs
+        """
+        super().__init__()
+        self.evaluate = evaluate
+        self.evaluations = 0  # Nombre de nœuds évalués
+        self.seconds = 0.0  # Temps passé dans evaluate
+
+    def __missing__(self, node):
+        t0 = time.perf_counter()
+        value = float(self.evaluate(np.array([node], dtype=np.int64))[0])
+        self.seconds += time.perf_counter() - t0
+        self[node] = value
+        self.evaluations += 1
+        return value
+
+    def prefetch(self, nodes):
+        """
+        Évalue en un seul appel tous les nœuds pas encore mémorisés.
+
+        Appelée avec les successeurs d'un nœud développé, elle remplace une
+        évaluation par voisin par une seule évaluation vectorisée ; rien
+        n'est calculé si tous les nœuds sont déjà connus.
+
+        Args:
+            nodes: Indices de nœuds (liste ou tranche de la liste CSR)
+        """
+        todo = [node for node in nodes if node not in self]
+        if todo:
+            t0 = time.perf_counter()
+            values = self.evaluate(np.array(todo, dtype=np.int64)).tolist()
+            self.seconds += time.perf_counter() - t0
+            self.update(zip(todo, values))
+            self.evaluations += len(todo)
+
+
+class Heuristic:
+    """
+    Heuristique calculée pendant la recherche plutôt que stockée par nœud.
+
+    Les valeurs dépendent du but de la requête : elles sont calculées à la
+    demande et mémorisées dans un HeuristicMemo par couple (contenu du
+    graphe, but). Les mémos des cache_size derniers buts sont conservés
+    (LRU) ; une modification du graphe change son empreinte et invalide
+    donc naturellement les valeurs mémorisées.
+
+    Une sous-classe définit evaluator(). Si elle est vectorisée (vectorized
+    vaut True), la recherche évalue tous les successeurs d'un nœud
+    développé en un seul appel (voir HeuristicMemo.prefetch).
+    """
+    vectorized = False
+
+    def __init__(self, cache_size=DEFAULT_CACHE_SIZE):
+        """
+        Args:
+            cache_size: Nombre de buts dont les valeurs restent mémorisées
+        """
+        if cache_size < 1:
+            raise ValueError("La taille du cache doit être au moins 1")
+        self.cache_size = cache_size
+        self.hits = 0  # Requêtes servies par un mémo existant
+        self.misses = 0  # Requêtes ayant créé un mémo
+        self._memos = OrderedDict()
+
+    @property
+    def name(self):
+        """Nom de l'heuristique dans les résultats."""
+        return type(self).__name__
+
+    def signature(self):
+        """
+        Identifiant des valeurs de l'heuristique, utilisé dans la clé du
+        cache de requêtes (voir BestFirstSearch.signature).
+
+        Il doit couvrir tous les paramètres dont dépendent les valeurs. None
+        signale une heuristique sans identité stable (fonction Python par
+        exemple) : les recherches qui l'utilisent ne sont pas mises en cache.
+
+        Returns:
+            str: Identifiant sérialisable en JSON, ou None
+        """
+        return None
+
+    def bind(self, compiled, goal):
+        """
+        Renvoie le mémo des valeurs heuristiques pour un but.
+
+        Args:
+            compiled: CompiledGraph de la recherche
+            goal: Indice du nœud objectif
+
+        Returns:
+            HeuristicMemo: Valeurs indexées par indice de nœud
+        """
+        key = (compiled.content_hash(), goal)
+        memo = self._memos.get(key)
+        if memo is not None:
+            self._memos.move_to_end(key)
+            self.hits += 1
+            return memo
+
+        self.misses += 1
+        memo = HeuristicMemo(self.evaluator(compiled, goal))
+        self._memos[key] = memo
+        if len(self._memos) > self.cache_size:
+            self._memos.popitem(last=False)
+        return memo
+
+    def evaluator(self, compiled, goal):
+        """
+        Construit la fonction d'évaluation pour un but.
+
+        Args:
+            compiled: CompiledGraph de la recherche
+            goal: Indice du nœud objectif
+
+        Returns:
+            function: (tableau d'indices) -> tableau NumPy de valeurs
+        """
+        raise NotImplementedError
+
+    def cache_info(self):
+        """Statistiques du cache : succès, échecs et nombre de buts mémorisés."""
+        return {'hits': self.hits, 'misses': self.misses, 'goals': len(self._memos),
+                'cache_size': self.cache_size}
+
+    def clear_cache(self):
+        """Oublie toutes les valeurs mémorisées."""
+        self._memos.clear()
+
+    def __getstate__(self):
+        # Les mémos ne sont pas transmis aux processus de calcul (voir batch)
+        state = self.__dict__.copy()
+        state['_memos'] = OrderedDict()
+        return state
+
+
+class FunctionHeuristic(Heuristic):
+    """
+    Heuristique définie par une fonction Python h(nœud, but).
+
+    La fonction reçoit les identifiants des nœuds (pas leurs indices) et
+    n'est appelée qu'une fois par nœud et par but mémorisé.
+    """
+    def __init__(self, function, cache_size=DEFAULT_CACHE_SIZE):
+        """
+        Args:
+            function: Fonction (node_id, goal_id) -> estimation du coût restant
+            cache_size: Nombre de buts dont les valeurs restent mémorisées
+        """
+        super().__init__(cache_size)
+        self.function = function
+
+    @property
+    def name(self):
+        return getattr(self.function, '__name__', type(self).__name__)
+
+    def evaluator(self, compiled, goal):
+        function = self.function
+        node_ids = compiled.node_ids
+        goal_id = node_ids[goal]
+
+        def evaluate(nodes):
+            return np.fromiter((function(node_ids[node], goal_id) for node in nodes.tolist()),
+                               dtype=np.float64, count=len(nodes))
+        return evaluate
+
+
+class CoordinateHeuristic(Heuristic):
+    """
+    Distance entre les coordonnées d'un nœud et celles du but.
+
+    Les coordonnées sont celles passées à Graph.add_node(..., pos=(x, y))
+    (CompiledGraph.positions) ou une correspondance explicite
+    identifiant -> coordonnées. L'évaluation est vectorisée avec NumPy.
+
+    La distance est multipliée par scale : l'heuristique est admissible si
+    scale × distance(u, v) ne dépasse jamais le coût d'un chemin de u à v,
+    par exemple avec scale égal au plus petit coût par unité de distance.
+    """
+    vectorized = True
+
+    def __init__(self, coords=None, metric='euclidean', scale=1.0,
+                 cache_size=DEFAULT_CACHE_SIZE):
+        """
+        Args:
+            coords: Correspondance node_id -> coordonnées, ou None pour
+                utiliser les positions enregistrées dans le graphe
+            metric: Distance parmi METRICS
+            scale: Facteur appliqué à la distance
+            cache_size: Nombre de buts dont les valeurs restent mémorisées
+        """
+        if metric not in METRICS:
+            raise ValueError(f"Distance inconnue: {metric}")
+        super().__init__(cache_size)
+        self.coords = coords
+        self.metric = metric
+        self.scale = scale
+        self._aligned = (None, None)  # (empreinte du graphe, coordonnées par indice)
+
+    @property
+    def name(self):
+        return self.metric
+
+    def signature(self):
+        # Positions du graphe : déjà couvertes par l'empreinte du graphe
+        coords = 'graph' if self.coords is None else _coords_hash(self.coords)
+        return f"{self.metric}(scale={float(self.scale)!r}, coords={coords})"
+
+    def positions(self, compiled):
+        """
+        Coordonnées des nœuds dans l'ordre des indices du graphe compilé.
+
+        Returns:
+            numpy.ndarray: Tableau (nœuds × dimensions)
+        """
+        if self.coords is None:
+            if compiled.positions is None:
+                raise ValueError("Les nœuds du graphe n'ont pas tous des coordonnées (pos)")
+            return compiled.positions
+
+        key = compiled.content_hash()
+        if self._aligned[0] != key:
+            try:
+                positions = np.array([self.coords[node] for node in compiled.node_ids],
+                                     dtype=np.float64)
+            except KeyError as error:
+                raise ValueError(f"Coordonnées manquantes pour le nœud {error.args[0]}") from None
+            self._aligned = (key, positions)
+        return self._aligned[1]
+
+    def evaluator(self, compiled, goal):
+        positions = self.positions(compiled)
+        target = positions[goal]
+        scale = self.scale
+        metric = self.metric
+
+        # Opérations en place : sur quelques voisins, le coût d'un appel
+        # NumPy dépend surtout du nombre d'opérations, pas de leur taille
+        def evaluate(nodes):
+            delta = positions.take(nodes, axis=0)
+            delta -= target
+            if metric == 'euclidean':
+                delta *= delta
+                distance = np.sqrt(delta.sum(axis=1))
+            elif metric == 'manhattan':
+                distance = np.abs(delta, out=delta).sum(axis=1)
+            else:
+                distance = np.abs(delta, out=delta).max(axis=1)
+            if scale != 1.0:
+                distance *= scale
+            return distance
+        return evaluate
+
+    def __getstate__(self):
+        state = super().__getstate__()
+        state['_aligned'] = (None, None)
+        return state
+
+
+def _coords_hash(coords):
+    """Empreinte SHA-1 d'une correspondance identifiant -> coordonnées."""
+    items = [[node, [float(value) for value in position]] for node, position in coords.items()]
+    return hashlib.sha1(json.dumps(items, default=str).encode('utf-8')).hexdigest()
+
+
+def make_heuristic(heuristic):
+    """
+    Normalise l'heuristique passée à une recherche.
+
+    Args:
+        heuristic: None, instance de Heuristic, nom de distance parmi
+            METRICS (coordonnées du graphe) ou fonction h(nœud, but)
+
+    Returns:
+        Heuristic: Heuristique calculée, ou None pour les valeurs stockées
+    """
+    if heuristic is None or isinstance(heuristic, Heuristic):
+        return heuristic
+    if isinstance(heuristic, str):
+        return CoordinateHeuristic(metric=heuristic)
+    if callable(heuristic):
+        return FunctionHeuristic(heuristic)
+    raise ValueError(f"Heuristique invalide: {heuristic!r}")
@@ -0,0 +1,138 @@
+import random
+
+
+class ImplicitGraph:
+    """
+    Espace d'états généré à la demande, utilisable à la place d'un Graph.
+
+    Aucun nœud n'est stocké : la recherche (BestFirstSearch.search) demande
+    les successeurs d'un état quand elle le développe. Un état est
+    n'importe quel objet hachable (tuple, chaîne, frozenset...).
+
+    Une sous-classe redéfinit successors(), et si besoin heuristic(),
+    is_goal() et fingerprint() ; on peut aussi passer ces fonctions au
+    constructeur. Les états développés ne sont mémorisés que par leur
+    empreinte (fingerprint, par défaut hash(state)) : la recherche garde un
+    entier par état visité, et le chemin final est retrouvé en régénérant
+    les successeurs le long de la chaîne des empreintes. successors() doit
+    donc être déterministe.
+
+    Avec l'empreinte par défaut, deux états distincts de même hash sont
+    confondus (probabilité de l'ordre de n² / 2^65 pour n états visités) ;
+    renvoyer l'état lui-même dans fingerprint() supprime ce risque au prix
+    de la mémoire.
+    """
+    implicit = True
+
+    def __init__(self, successors=None, heuristic=None, start=None, goal=None, is_goal=None,
+                 fingerprint=None):
+        """
+        Args:
+            successors: Fonction state -> itérable de couples (état_suivant, coût)
+            heuristic: Fonction state -> estimation du coût restant (0 par défaut)
+            start: État de départ par défaut des recherches
+            goal: État objectif par défaut des recherches
+            is_goal: Fonction state -> bool, pour un objectif défini par une
+                condition plutôt que par un état
+            fingerprint: Fonction state -> entier hachable identifiant l'état
+        """
+        if successors is not None:
+            self.successors = successors
+        if heuristic is not None:
+            self.heuristic = heuristic
+        if is_goal is not None:
+            self.is_goal = is_goal
+        if fingerprint is not None:
+            self.fingerprint = fingerprint
+        self.start_node = start
+        self.goal_node = goal
+
+    def successors(self, state):
+        """
+        Successeurs d'un état.
+
+        Args:
+            state: État développé
+
+        Returns:
+            itérable: Couples (état_suivant, coût de la transition)
+        """
+        raise NotImplementedError
+
+    def heuristic(self, state):
+        """Estimation du coût restant depuis state (0 par défaut)."""
+        return 0.0
+
+    def is_goal(self, state):
+        """Indique si state est un état objectif (par défaut : égal à goal_node)."""
+        return state == self.goal_node
+
+    def fingerprint(self, state):
+        """Empreinte compacte de l'état, mémorisée à la place de l'état visité."""
+        return hash(state)
+
+    def compile(self):
+        raise ValueError("Un graphe implicite ne peut pas être compilé : seule "
+                         "BestFirstSearch.search l'explore")
+
+
+class SlidingPuzzle(ImplicitGraph):
+    """
+    Taquin de taille side × side (8-puzzle pour side = 3).
+
+    Un état est le tuple des cases ligne par ligne, 0 désignant la case
+    vide ; chaque déplacement coûte 1. L'heuristique est la somme des
+    distances de Manhattan des pièces à leur place finale (admissible et
+    cohérente). L'état résolu est (1, 2, ..., n-1, 0). Le taquin 5 × 5
+    compte environ 10^25 états : il ne peut être exploré que de cette façon.
+    """
+    def __init__(self, side=3, start=None):
+        """
+        Args:
+            side: Nombre de cases par côté
+            start: État de départ (tuple de side² valeurs)
+        """
+        goal = tuple(range(1, side * side)) + (0,)
+        super().__init__(start=start, goal=goal)
+        self.side = side
+        # Coordonnées finales de chaque pièce
+        self._targets = {tile: divmod(position, side) for position, tile in enumerate(goal)}
+
+    def successors(self, state):
+        side = self.side
+        blank = state.index(0)
+        row, col = divmod(blank, side)
+        for d_row, d_col in ((-1, 0), (1, 0), (0, -1), (0, 1)):
+            r, c = row + d_row, col + d_col
+            if 0 <= r < side and 0 <= c < side:
+                tiles = list(state)
+                tiles[blank], tiles[r * side + c] = tiles[r * side + c], 0
+                yield tuple(tiles), 1
+
+    def heuristic(self, state):
+        side = self.side
+        targets = self._targets
+        total = 0
+        for position, tile in enumerate(state):
+            if tile:
+                row, col = divmod(position, side)
+                target_row, target_col = targets[tile]
+                total += abs(row - target_row) + abs(col - target_col)
+        return total
+
+    def scrambled(self, moves, seed=0):
+        """
+        État obtenu en jouant des coups aléatoires depuis l'état résolu.
+
+        Args:
+            moves: Nombre de coups
+            seed: Graine du tirage
+
+        Returns:
+            tuple: État toujours soluble
+        """
+        rng = random.Random(seed)
+        state = self.goal_node
+        for _ in range(moves):
+            state = rng.choice([next_state for next_state, _ in self.successors(state)])
+        return state
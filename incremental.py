@@ -0,0 +1,269 @@
+import heapq
+from itertools import count
+
+from algorithms import BestFirstSearch
+from heuristics import make_heuristic
+
+
+INFINITY = float('inf')
+
+
+class IncrementalSearch:
+    """
+    Replanification incrémentale d'un plus court chemin (LPA*).
+
+    La recherche garde son état entre deux appels à search() : pour chaque
+    nœud, g (coût établi depuis le départ) et rhs (meilleur coût proposé par
+    ses prédécesseurs). Elle s'abonne aux modifications du graphe
+    (Graph.add_listener) : une arête ajoutée ou repondérée ne fait que
+    signaler son nœud d'arrivée, et l'appel suivant à search() ne
+    redéveloppe que les nœuds dont le coût a réellement changé, au lieu de
+    relancer la recherche depuis le départ.
+
+    Les nœuds de départ et d'arrivée sont fixes ; en changer relance une
+    recherche complète. En mode 'astar', l'heuristique doit être cohérente
+    pour que le chemin soit optimal ; 'ucs' l'ignore. Elle est choisie comme
+    par BestFirstSearch : heuristique passée au constructeur, sinon celle
+    du graphe (Graph.set_heuristic), sinon les valeurs stockées des nœuds ;
+    en changer relance une recherche complète. La recherche travaille
+    directement sur le Graph (networkx), pas sur l'instantané compilé, qui
+    est invalidé à chaque modification : une heuristique calculée est liée
+    à l'instantané du lancement, et à nouveau après chaque ajout de nœuds
+    (ses valeurs ne doivent pas dépendre des arêtes).
+    """
+    def __init__(self, graph, start=None, goal=None, priority='astar', heuristic=None):
+        """
+        Args:
+            graph: Instance de Graph, observée jusqu'à l'appel de close()
+            start: Nœud de départ (par défaut graph.start_node)
+            goal: Nœud objectif (par défaut graph.goal_node)
+            priority: 'astar' ou 'ucs'
+            heuristic: Heuristique calculée (voir heuristics.make_heuristic) ;
+                par défaut celle du graphe (Graph.set_heuristic), sinon les
+                valeurs stockées des nœuds
+        """
+        if priority not in ('astar', 'ucs'):
+            raise ValueError(f"Mode non disponible en recherche incrémentale: {priority}")
+        self.graph = graph
+        self.mode = priority
+        self.start_node = start if start is not None else graph.start_node
+        self.goal_node = goal if goal is not None else graph.goal_node
+        self.path_cost = None
+        self.expansions = 0  # Nœuds développés par le dernier appel à search()
+        self.total_expansions = 0  # Nœuds développés depuis la première recherche
+        self.searches = 0  # Nombre d'appels à search()
+        self.heuristic = make_heuristic(heuristic)
+        self._bound_heuristic = None  # Heuristique calculée utilisée par l'état actuel
+        self._heuristic_memo = None  # Valeurs de cette heuristique, par indice de nœud
+        self._heuristic_index = None  # Identifiant -> indice dans l'instantané lié
+        self._nodes_changed = False  # Nœuds ajoutés depuis la liaison de l'heuristique
+        self._reset()
+        graph.add_listener(self._on_change)
+
+    def close(self):
+        """Cesse d'observer les modifications du graphe."""
+        self.graph.remove_listener(self._on_change)
+
+    def _reset(self):
+        """Oublie l'état de la recherche : le prochain search() repart de zéro."""
+        self._g = {}
+        self._rhs = {}
+        self._queue = []  # Tas d'entrées (k1, k2, ordre, nœud), à suppression paresseuse
+        self._keys = {}  # Clé actuelle de chaque nœud de la file
+        self._order = count()
+        self._pending = set()  # Nœuds dont les arêtes entrantes ont changé
+        self._started = False
+
+    def _on_change(self, kind, items):
+        if kind == 'edges':
+            self._pending.update(to_node for _, to_node, _ in items)
+        else:
+            # Une heuristique modifiée change la clé du nœud dans la file
+            self._pending.update(items)
+            self._nodes_changed = True
+
+    def search(self, start=None, goal=None):
+        """
+        Calcule ou répare le plus court chemin.
+
+        Args:
+            start: Nœud de départ (par défaut celui de la recherche) ; un
+                autre départ relance une recherche complète
+            goal: Nœud objectif (même règle que start)
+
+        Returns:
+            tuple: (chemin, nœuds_développés, steps) comme BestFirstSearch.search ;
+                nœuds_développés ne contient que les nœuds développés par cet
+                appel (un nœud peut y figurer deux fois) et steps est vide
+        """
+        if start is not None and start != self.start_node:
+            self.start_node = start
+            self._started = False
+        if goal is not None and goal != self.goal_node:
+            self.goal_node = goal
+            self._started = False
+        for node in (self.start_node, self.goal_node):
+            if node is None:
+                raise ValueError("Les nœuds de départ et d'arrivée doivent être définis")
+            if node not in self.graph.graph:
+                raise ValueError(f"Le nœud {node} n'existe pas dans le graphe")
+        self._bind_heuristic()
+
+        if not self._started:
+            self._reset()
+            self._started = True
+            self._rhs[self.start_node] = 0.0
+            self._push(self.start_node)
+        else:
+            pending, self._pending = self._pending, set()
+            for node in pending:
+                if node in self.graph.graph:
+                    self._update_node(node)
+
+        expanded_nodes = self._compute_shortest_path()
+        self.expansions = len(expanded_nodes)
+        self.total_expansions += self.expansions
+        self.searches += 1
+        path = self._extract_path()
+        self.path_cost = self._g.get(self.goal_node, INFINITY) if path else None
+        return path, expanded_nodes, []
+
+    def _bind_heuristic(self):
+        """Choisit l'heuristique de la requête et lie ses valeurs au graphe actuel."""
+        heuristic = None
+        if self.mode != 'ucs':
+            heuristic = self.heuristic
+            if heuristic is None:
+                heuristic = getattr(self.graph, 'heuristic', None)
+        if heuristic is not self._bound_heuristic:
+            # Les clés de la file dépendent de l'heuristique
+            self._bound_heuristic = heuristic
+            self._started = False
+        if heuristic is None:
+            self._heuristic_memo = self._heuristic_index = None
+        elif not self._started or self._nodes_changed:
+            compiled = self.graph.compile()
+            self._heuristic_index = compiled.index
+            self._heuristic_memo = heuristic.bind(compiled, compiled.index[self.goal_node])
+        self._nodes_changed = False
+
+    def _heuristic(self, node):
+        if self.mode == 'ucs':
+            return 0.0
+        memo = self._heuristic_memo
+        if memo is None:
+            return self.graph.graph.nodes[node].get('heuristic', 0)
+        return memo[self._heuristic_index[node]]
+
+    def _key(self, node):
+        best = min(self._g.get(node, INFINITY), self._rhs.get(node, INFINITY))
+        return (best + self._heuristic(node), best)
+
+    def _push(self, node):
+        key = self._key(node)
+        self._keys[node] = key
+        heapq.heappush(self._queue, (key[0], key[1], next(self._order), node))
+
+    def _top_key(self):
+        """Plus petite clé de la file, en retirant les entrées obsolètes."""
+        queue = self._queue
+        while queue:
+            k1, k2, _, node = queue[0]
+            if self._keys.get(node) == (k1, k2):
+                return (k1, k2)
+            heapq.heappop(queue)
+        return (INFINITY, INFINITY)
+
+    def _update_node(self, node):
+        """Recalcule rhs(node) depuis ses prédécesseurs et le replace dans la file."""
+        g = self._g
+        if node != self.start_node:
+            self._rhs[node] = min((g.get(predecessor, INFINITY) + data['weight']
+                                   for predecessor, data in self.graph.graph.pred[node].items()),
+                                  default=INFINITY)
+        self._keys.pop(node, None)
+        if g.get(node, INFINITY) != self._rhs.get(node, INFINITY):
+            self._push(node)
+
+    def _compute_shortest_path(self):
+        """Développe les nœuds incohérents jusqu'à ce que le coût du but soit établi."""
+        g = self._g
+        rhs = self._rhs
+        goal = self.goal_node
+        successors = self.graph.graph.succ
+        expanded_nodes = []
+        while (self._top_key() < self._key(goal)
+               or rhs.get(goal, INFINITY) != g.get(goal, INFINITY)):
+            _, _, _, node = heapq.heappop(self._queue)
+            del self._keys[node]
+            expanded_nodes.append(node)
+            if g.get(node, INFINITY) > rhs.get(node, INFINITY):
+                # Coût amélioré : il devient définitif
+                g[node] = rhs[node]
+                for successor, data in successors[node].items():
+                    candidate = g[node] + data['weight']
+                    if candidate < rhs.get(successor, INFINITY):
+                        rhs[successor] = candidate
+                        self._keys.pop(successor, None)
+                        if g.get(successor, INFINITY) != candidate:
+                            self._push(successor)
+            else:
+                # Coût dégradé : le nœud et ses successeurs sont réévalués
+                g[node] = INFINITY
+                self._update_node(node)
+                for successor in successors[node]:
+                    self._update_node(successor)
+        return expanded_nodes
+
+    def _extract_path(self):
+        """Remonte du but vers le départ par les prédécesseurs qui réalisent g."""
+        g = self._g
+        node = self.goal_node
+        if g.get(node, INFINITY) == INFINITY:
+            return None
+        path = [node]
+        seen = {node}
+        predecessors = self.graph.graph.pred
+        while node != self.start_node:
+            node = min(predecessors[node].items(),
+                       key=lambda item: g.get(item[0], INFINITY) + item[1]['weight'])[0]
+            if node in seen:
+                return None  # Cycle de poids nul : pas de chemin reconstruit
+            seen.add(node)
+            path.append(node)
+        return path[::-1]
+
+    def compare_with_full_search(self):
+        """
+        Compare le dernier appel à search() avec une recherche complète.
+
+        Returns:
+            dict: Expansions et coûts de la réparation et de BestFirstSearch
+                relancée de zéro dans le même mode
+        """
+        full = BestFirstSearch(self.graph, trace='none', priority=self.mode,
+                               heuristic=self.heuristic)
+        full.search(self.start_node, self.goal_node)
+        return {
+            'mode': self.mode,
+            'incremental_expansions': self.expansions,
+            'full_expansions': full.expansions,
+            'expansions_saved': full.expansions - self.expansions,
+            'incremental_cost': self.path_cost,
+            'full_cost': full.path_cost
+        }
+
+    def results_data(self, path, expanded_nodes):
+        """Résultats au format de BestFirstSearch.results_data, avec les compteurs incrémentaux."""
+        return {
+            "algorithm": "Incremental Search (LPA*)",
+            "mode": self.mode,
+            "start_node": self.start_node,
+            "goal_node": self.goal_node,
+            "path": path if path else [],
+            "path_cost": self.path_cost,
+            "expanded_nodes": expanded_nodes,
+            "steps_count": self.expansions,
+            "searches": self.searches,
+            "total_expansions": self.total_expansions
+        }
@@ -0,0 +1,283 @@
+import argparse
+import hashlib
+import heapq
+import os
+import random
+
+import numpy as np
+
+from heuristics import Heuristic, DEFAULT_CACHE_SIZE
+
+
+# Nombre de repères par défaut : 16 tables float32 de n valeurs par direction
+DEFAULT_LANDMARKS = 16
+
+# Erreur relative d'arrondi des distances stockées en float32, retranchée
+# des bornes pour que l'heuristique reste admissible
+FLOAT32_SLACK = 2.0 ** -22
+
+
+def landmarks_filename(graph_filename):
+    """Nom du fichier de repères associé à un fichier de graphe."""
+    return os.path.splitext(graph_filename)[0] + ".landmarks.npz"
+
+
+def shortest_distances(indptr, indices, weights, source):
+    """
+    Distances les plus courtes depuis un nœud (Dijkstra sur un graphe CSR).
+
+    Args:
+        indptr, indices, weights: Listes CSR (voir CompiledGraph.adjacency_lists
+            ou reverse_adjacency_lists pour les distances vers le nœud)
+        source: Indice du nœud de départ
+
+    Returns:
+        numpy.ndarray: Distance de chaque nœud (inf s'il est inaccessible)
+    """
+    distances = [float('inf')] * (len(indptr) - 1)
+    distances[source] = 0.0
+    heap = [(0.0, source)]
+    pop = heapq.heappop
+    push = heapq.heappush
+    while heap:
+        distance, node = pop(heap)
+        if distance > distances[node]:
+            continue  # Entrée obsolète
+        for k in range(indptr[node], indptr[node + 1]):
+            neighbor = indices[k]
+            candidate = distance + weights[k]
+            if candidate < distances[neighbor]:
+                distances[neighbor] = candidate
+                push(heap, (candidate, neighbor))
+    return np.array(distances, dtype=np.float64)
+
+
+class LandmarkIndex:
+    """
+    Tables de distances vers et depuis des nœuds repères (méthode ALT).
+
+    Pour chaque repère L, les tables donnent d(L, v) et d(v, L) pour tout
+    nœud v. Par l'inégalité triangulaire, pour tout but t :
+
+        d(v, t) >= d(L, t) - d(L, v)    et    d(v, t) >= d(v, L) - d(t, L)
+
+    ce qui fournit une heuristique admissible pour n'importe quel couple
+    (départ, arrivée) sans valeurs heuristiques dans le fichier de graphe
+    (voir LandmarkHeuristic). Les tables sont stockées en float32, une ligne
+    par nœud, et enregistrées à côté du graphe avec son empreinte.
+    """
+    def __init__(self, landmarks, from_landmarks, to_landmarks, graph_hash):
+        """
+        Args:
+            landmarks: Indices des nœuds repères
+            from_landmarks: Tableau float32 (nœuds × repères) de d(L, v)
+            to_landmarks: Tableau float32 (nœuds × repères) de d(v, L)
+            graph_hash: Empreinte du graphe (CompiledGraph.content_hash)
+        """
+        self.landmarks = np.asarray(landmarks, dtype=np.int64)
+        self.from_landmarks = from_landmarks
+        self.to_landmarks = to_landmarks
+        self.graph_hash = graph_hash
+        self._content_hash = None
+
+    @property
+    def num_landmarks(self):
+        """Nombre de repères."""
+        return len(self.landmarks)
+
+    @classmethod
+    def build(cls, graph, num_landmarks=DEFAULT_LANDMARKS, seed=0, progress=None):
+        """
+        Choisit les repères et calcule les tables de distances.
+
+        Les repères sont choisis au plus loin : chaque nouveau repère est le
+        nœud le plus éloigné (dans un sens ou dans l'autre) des repères déjà
+        choisis, en commençant par les nœuds qu'aucun repère n'atteint. Le
+        calcul fait deux Dijkstra par repère, sur le graphe et sur l'index
+        inverse.
+
+        Args:
+            graph: Graph ou CompiledGraph
+            num_landmarks: Nombre de repères (au plus le nombre de nœuds)
+            seed: Graine du choix du nœud initial
+            progress: Fonction appelée avec (repères_calculés, repères_totaux)
+
+        Returns:
+            LandmarkIndex: Index prêt à être enregistré ou utilisé
+        """
+        compiled = graph.compile()
+        num_nodes = compiled.num_nodes
+        if num_nodes == 0:
+            raise ValueError("Le graphe est vide")
+        if num_landmarks < 1:
+            raise ValueError("Le nombre de repères doit être au moins 1")
+        num_landmarks = min(num_landmarks, num_nodes)
+
+        forward = compiled.adjacency_lists()[:3]
+        backward = compiled.reverse_adjacency_lists()
+        from_landmarks = np.empty((num_nodes, num_landmarks), dtype=np.float32)
+        to_landmarks = np.empty((num_nodes, num_landmarks), dtype=np.float32)
+        landmarks = []
+
+        # Distance de chaque nœud au repère le plus proche, dans un sens ou l'autre
+        nearest = np.full(num_nodes, np.inf)
+        candidate = random.Random(seed).randrange(num_nodes)
+        for i in range(num_landmarks):
+            landmarks.append(candidate)
+            from_distances = shortest_distances(*forward, candidate)
+            to_distances = shortest_distances(*backward, candidate)
+            from_landmarks[:, i] = from_distances
+            to_landmarks[:, i] = to_distances
+            if progress is not None:
+                progress(i + 1, num_landmarks)
+
+            np.minimum(nearest, np.minimum(from_distances, to_distances), out=nearest)
+            nearest[landmarks] = -1.0  # Un repère n'est jamais choisi deux fois
+            candidate = int(np.argmax(nearest))
+
+        return cls(landmarks, from_landmarks, to_landmarks, compiled.content_hash())
+
+    def save(self, filename):
+        """
+        Enregistre les tables dans un fichier .npz.
+
+        Args:
+            filename: Fichier à écrire (voir landmarks_filename)
+        """
+        with open(filename, 'wb') as file:
+            np.savez(file, landmarks=self.landmarks, from_landmarks=self.from_landmarks,
+                     to_landmarks=self.to_landmarks, graph_hash=np.array(self.graph_hash))
+
+    @classmethod
+    def load(cls, filename, graph=None):
+        """
+        Charge des tables enregistrées par save.
+
+        Args:
+            filename: Fichier .npz
+            graph: Si indiqué, Graph ou CompiledGraph auquel les tables
+                doivent correspondre
+
+        Returns:
+            LandmarkIndex: Index chargé
+        """
+        with np.load(filename) as data:
+            index = cls(data['landmarks'], data['from_landmarks'], data['to_landmarks'],
+                        str(data['graph_hash']))
+        if graph is not None and not index.matches(graph):
+            raise ValueError(f"Les repères de {filename} ne correspondent pas au graphe")
+        return index
+
+    @classmethod
+    def load_or_build(cls, graph, filename, num_landmarks=DEFAULT_LANDMARKS, progress=None):
+        """
+        Charge les tables d'un graphe, ou les calcule et les enregistre.
+
+        Les tables sont recalculées si le fichier est absent, illisible ou
+        correspond à une autre version du graphe.
+
+        Args:
+            graph: Graph ou CompiledGraph
+            filename: Fichier de repères (voir landmarks_filename)
+            num_landmarks: Nombre de repères si le calcul est nécessaire
+            progress: Fonction de progression transmise à build
+
+        Returns:
+            LandmarkIndex: Index correspondant au graphe
+        """
+        try:
+            return cls.load(filename, graph)
+        except (OSError, ValueError, KeyError):
+            pass
+        index = cls.build(graph, num_landmarks, progress=progress)
+        index.save(filename)
+        return index
+
+    def matches(self, graph):
+        """Indique si les tables ont été calculées pour ce graphe."""
+        return self.graph_hash == graph.compile().content_hash()
+
+    def content_hash(self):
+        """Empreinte SHA-1 des repères et des tables (calculée une fois)."""
+        if self._content_hash is None:
+            digest = hashlib.sha1(self.graph_hash.encode('utf-8'))
+            for array in (self.landmarks, self.from_landmarks, self.to_landmarks):
+                digest.update(np.ascontiguousarray(array).tobytes())
+            self._content_hash = digest.hexdigest()
+        return self._content_hash
+
+    def heuristic(self, cache_size=DEFAULT_CACHE_SIZE):
+        """Heuristique ALT fondée sur ces tables (voir LandmarkHeuristic)."""
+        return LandmarkHeuristic(self, cache_size)
+
+
+class LandmarkHeuristic(Heuristic):
+    """
+    Heuristique ALT : meilleure borne inférieure donnée par les repères.
+
+    h(v) = max sur les repères L de d(L, t) - d(L, v) et d(v, L) - d(t, L),
+    et au moins 0. Elle est admissible et cohérente, donc A* reste optimal.
+    Un nœud qui ne peut pas atteindre le but reçoit une valeur infinie.
+    L'évaluation est vectorisée sur les successeurs d'un nœud développé.
+    """
+    vectorized = True
+
+    def __init__(self, index, cache_size=DEFAULT_CACHE_SIZE):
+        """
+        Args:
+            index: LandmarkIndex du graphe
+            cache_size: Nombre de buts dont les valeurs restent mémorisées
+        """
+        super().__init__(cache_size)
+        self.index = index
+
+    @property
+    def name(self):
+        return f"landmarks({self.index.num_landmarks})"
+
+    def signature(self):
+        return f"landmarks({self.index.content_hash()})"
+
+    def evaluator(self, compiled, goal):
+        if compiled.content_hash() != self.index.graph_hash:
+            raise ValueError("Les repères ne correspondent pas au graphe (recalculer l'index)")
+        from_landmarks = self.index.from_landmarks
+        to_landmarks = self.index.to_landmarks
+        # Marge d'arrondi float32 reportée sur les termes constants du but :
+        # d(L, t)·(1 - 2ε) - d(L, v) et d(v, L)·(1 - ε) - d(t, L)·(1 + ε)
+        goal_from = from_landmarks[goal].astype(np.float64) * (1.0 - 2.0 * FLOAT32_SLACK)
+        goal_to = to_landmarks[goal].astype(np.float64) * (1.0 + FLOAT32_SLACK)
+
+        def evaluate(nodes):
+            with np.errstate(invalid='ignore'):
+                # inf - inf (repère sans lien avec les deux nœuds) donne nan,
+                # ignoré par fmax ; une borne infinie signale un but inaccessible
+                bound = goal_from - from_landmarks.take(nodes, axis=0)
+                backward = to_landmarks.take(nodes, axis=0) * (1.0 - FLOAT32_SLACK)
+                backward -= goal_to
+                np.fmax(bound, backward, out=bound)
+                bound = np.fmax.reduce(bound, axis=1)
+            return np.fmax(bound, 0.0, out=bound)
+        return evaluate
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Précalcule les tables de repères (heuristique ALT) de graphes")
+    parser.add_argument('inputs', nargs='+', help="Fichiers de graphe JSON ou binaires")
+    parser.add_argument('--count', type=int, default=DEFAULT_LANDMARKS, help="Nombre de repères")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    # Import local : cli n'est nécessaire que pour charger les fichiers
+    from cli import load_search_graph
+    for graph_filename in args.inputs:
+        compiled = load_search_graph(graph_filename)
+        index = LandmarkIndex.build(compiled, args.count, args.seed)
+        filename = landmarks_filename(graph_filename)
+        index.save(filename)
+        print(f"{graph_filename} -> {filename} ({index.num_landmarks} repères)")
+
+
+if __name__ == "__main__":
+    main()
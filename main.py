@@ -1,14 +1,20 @@
 import os
+import queue
 import sys
-import matplotlib.pyplot as plt
+import threading
 from graph import Graph
-from algorithms import BestFirstSearch
-from visualization import GraphVisualizer
+from algorithms import BestFirstSearch, SEARCH_MODES, SearchCancelled
+from visualization import GraphVisualizer, layout_filename
+from animation_export import export_animation
+from observers import MetricsCollector
 import json
 import tkinter as tk
 from tkinter import filedialog, messagebox, simpledialog
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
 
+# Intervalle (ms) entre deux relèves des messages d'une tâche de fond
+POLL_INTERVAL = 100
+
 class BestFirstSearchApp:
     """
     Application principale pour exécuter et visualiser l'algorithme Best-First Search.
@@ -22,6 +28,9 @@ class BestFirstSearchApp:
         self.graph = None
         self.visualizer = None
         self.results = None
+        self.search = None  # Instance de recherche ayant produit les résultats
+        self._job = None  # Tâche de fond en cours (voir _start_job)
+        self._messages = queue.Queue()  # Messages des tâches de fond pour le thread de Tk
         
         # Création du répertoire pour les exemples s'il n'existe pas
         os.makedirs("example_graphs", exist_ok=True)
@@ -39,13 +48,22 @@ class BestFirstSearchApp:
         button_frame = tk.Frame(main_frame)
         button_frame.pack(side=tk.TOP, fill=tk.X, pady=5)
         
-        # Boutons
-        tk.Button(button_frame, text="Charger un graphe", command=self.load_graph).pack(side=tk.LEFT, padx=5)
-        tk.Button(button_frame, text="Créer un exemple 1", command=self.create_example_1).pack(side=tk.LEFT, padx=5)
-        tk.Button(button_frame, text="Créer un exemple 2", command=self.create_example_2).pack(side=tk.LEFT, padx=5)
-        tk.Button(button_frame, text="Exécuter Best-First Search", command=self.run_bfs).pack(side=tk.LEFT, padx=5)
-        tk.Button(button_frame, text="Sauvegarder résultats", command=self.save_results).pack(side=tk.LEFT, padx=5)
-        tk.Button(button_frame, text="Créer Animation", command=self.create_animation).pack(side=tk.LEFT, padx=5)
+        # Boutons (désactivés pendant une tâche de fond, sauf Annuler)
+        self.mode_var = tk.StringVar(value='greedy')
+        self._action_widgets = [
+            tk.Button(button_frame, text="Charger un graphe", command=self.load_graph),
+            tk.Button(button_frame, text="Créer un exemple 1", command=self.create_example_1),
+            tk.Button(button_frame, text="Créer un exemple 2", command=self.create_example_2),
+            tk.Button(button_frame, text="Exécuter Best-First Search", command=self.run_bfs),
+            tk.OptionMenu(button_frame, self.mode_var, *SEARCH_MODES),
+            tk.Button(button_frame, text="Sauvegarder résultats", command=self.save_results),
+            tk.Button(button_frame, text="Créer Animation", command=self.create_animation),
+        ]
+        for widget in self._action_widgets:
+            widget.pack(side=tk.LEFT, padx=5)
+        self.cancel_button = tk.Button(button_frame, text="Annuler", command=self.cancel_job,
+                                       state=tk.DISABLED)
+        self.cancel_button.pack(side=tk.LEFT, padx=5)
         
         # Frame pour le graphe
         self.graph_frame = tk.Frame(main_frame)
@@ -64,6 +82,79 @@ class BestFirstSearchApp:
         self.info_text.delete(1.0, tk.END)
         self.info_text.insert(tk.END, message)
     
+    def _start_job(self, description, work, on_done, cancel, error_message):
+        """
+        Exécute un travail long dans un thread sans bloquer l'interface.
+        
+        Le thread ne touche jamais aux widgets : il dépose ses messages dans
+        une file relevée par root.after depuis le thread de Tk.
+        
+        Args:
+            description: Texte affiché au lancement du travail
+            work: Fonction work(report) exécutée dans le thread ; report(message)
+                affiche une progression dans la zone d'information
+            on_done: Fonction appelée dans le thread de Tk avec le résultat de work
+            cancel: Fonction demandant l'arrêt coopératif du travail
+            error_message: Début du message affiché si le travail échoue
+        """
+        self._job = (on_done, cancel, error_message)
+        for widget in self._action_widgets:
+            widget.config(state=tk.DISABLED)
+        self.cancel_button.config(state=tk.NORMAL)
+        self.update_info(description)
+        messages = self._messages
+        
+        def report(message):
+            messages.put(('progress', message))
+        
+        def run():
+            try:
+                messages.put(('done', work(report)))
+            except Exception as e:
+                messages.put(('error', e))
+        
+        threading.Thread(target=run, daemon=True).start()
+        self.root.after(POLL_INTERVAL, self._poll_job)
+    
+    def _poll_job(self):
+        """Relève les messages de la tâche de fond (dans le thread de Tk)."""
+        progress = None
+        while True:
+            try:
+                kind, value = self._messages.get_nowait()
+            except queue.Empty:
+                break
+            if kind == 'progress':
+                progress = value  # Seul le dernier message est affiché
+                continue
+            
+            on_done, _, error_message = self._job
+            self._job = None
+            for widget in self._action_widgets:
+                widget.config(state=tk.NORMAL)
+            self.cancel_button.config(state=tk.DISABLED)
+            
+            if kind == 'error' and isinstance(value, SearchCancelled):
+                self.update_info(str(value))
+                return
+            try:
+                if kind == 'error':
+                    raise value
+                on_done(value)
+            except Exception as e:
+                messagebox.showerror("Erreur", f"{error_message}: {str(e)}")
+            return
+        
+        if progress is not None:
+            self.update_info(progress)
+        self.root.after(POLL_INTERVAL, self._poll_job)
+    
+    def cancel_job(self):
+        """Demande l'arrêt de la tâche de fond en cours."""
+        if self._job is not None:
+            self._job[1]()
+            self.update_info("Annulation en cours...")
+    
     def load_graph(self):
         """Charge un graphe depuis un fichier JSON."""
         try:
@@ -78,6 +169,15 @@ class BestFirstSearchApp:
             self.graph = Graph.load_from_file(filename)
             self.visualizer = GraphVisualizer(self.graph)
             
+            # Réutiliser les positions enregistrées à côté du graphe, sinon
+            # les calculer une fois et les enregistrer pour les prochaines fois
+            positions_file = layout_filename(filename)
+            if not self.visualizer.load_layout(positions_file):
+                try:
+                    self.visualizer.save_layout(positions_file)
+                except OSError:
+                    pass  # Répertoire en lecture seule : positions non conservées
+            
             self.display_graph()
             self.update_info(f"Graphe chargé depuis {filename}\n"
                            f"Nœud de départ: {self.graph.start_node}\n"
@@ -132,47 +232,71 @@ class BestFirstSearchApp:
             canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
     
     def run_bfs(self):
-        """Exécute l'algorithme Best-First Search et affiche les résultats."""
+        """Exécute l'algorithme Best-First Search en arrière-plan et affiche les résultats."""
         if not self.graph:
             messagebox.showerror("Erreur", "Veuillez d'abord charger ou créer un graphe.")
             return
         
         try:
-            # Exécuter l'algorithme
-            bfs = BestFirstSearch(self.graph)
-            path, expanded_nodes, steps = bfs.search()
-            self.results = (path, expanded_nodes, steps)
-            
-            # Afficher le chemin trouvé
-            for widget in self.graph_frame.winfo_children():
-                widget.destroy()
+            mode = self.mode_var.get()
+            epsilon = 1.0
+            if mode == 'weighted_astar':
+                epsilon = simpledialog.askfloat(
+                    "A* pondéré", "Poids epsilon de l'heuristique:",
+                    initialvalue=1.5, minvalue=1.0
+                ) or 1.5
             
-            if path:
-                fig, ax = self.visualizer.visualize_path(path, "Chemin trouvé par Best-First Search")
-                
-                # Intégrer la figure matplotlib dans tkinter
-                canvas = FigureCanvasTkAgg(fig, master=self.graph_frame)
-                canvas.draw()
-                canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-                
-                # Ajouter une barre d'outils pour naviguer dans le graphique
-                toolbar = NavigationToolbar2Tk(canvas, self.graph_frame)
-                toolbar.update()
-                canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-                
-                # Mise à jour des informations
-                path_str = " -> ".join(path)
-                expanded_str = " -> ".join(expanded_nodes)
-                
-                self.update_info(f"Chemin trouvé: {path_str}\n"
-                              f"Nœuds explorés: {expanded_str}\n"
-                              f"Longueur du chemin: {len(path)-1} arêtes")
-            else:
-                self.update_info("Aucun chemin trouvé de {} à {}".format(
-                    self.graph.start_node, self.graph.goal_node))
-                
+            # Exécuter l'algorithme (trace compacte, rejouée par l'animation)
+            bfs = BestFirstSearch(self.graph, trace='delta', priority=mode, epsilon=epsilon)
+            bfs.add_observer(MetricsCollector())  # Compteurs joints aux résultats sauvegardés
         except Exception as e:
             messagebox.showerror("Erreur", f"Erreur lors de l'exécution de Best-First Search: {str(e)}")
+            return
+        
+        def work(report):
+            bfs.progress = lambda expansions: report(
+                f"Recherche en cours ({bfs.mode})...\nNœuds explorés: {expansions}")
+            return bfs.search()
+        
+        self._start_job(f"Recherche en cours ({bfs.mode})...", work,
+                        lambda results: self._show_search_results(bfs, results), bfs.cancel,
+                        "Erreur lors de l'exécution de Best-First Search")
+    
+    def _show_search_results(self, bfs, results):
+        """Affiche le chemin trouvé par une recherche terminée."""
+        path, expanded_nodes, steps = results
+        self.results = results
+        self.search = bfs
+        
+        # Afficher le chemin trouvé
+        for widget in self.graph_frame.winfo_children():
+            widget.destroy()
+        
+        if path:
+            fig, ax = self.visualizer.visualize_path(path, "Chemin trouvé par Best-First Search",
+                                                     visited=bfs.visited)
+            
+            # Intégrer la figure matplotlib dans tkinter
+            canvas = FigureCanvasTkAgg(fig, master=self.graph_frame)
+            canvas.draw()
+            canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+            
+            # Ajouter une barre d'outils pour naviguer dans le graphique
+            toolbar = NavigationToolbar2Tk(canvas, self.graph_frame)
+            toolbar.update()
+            canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+            
+            # Mise à jour des informations
+            path_str = " -> ".join(path)
+            expanded_str = " -> ".join(expanded_nodes)
+            
+            self.update_info(f"Chemin trouvé ({bfs.mode}): {path_str}\n"
+                          f"Nœuds explorés: {expanded_str}\n"
+                          f"Longueur du chemin: {len(path)-1} arêtes\n"
+                          f"Coût du chemin: {bfs.path_cost:g}")
+        else:
+            self.update_info("Aucun chemin trouvé de {} à {}".format(
+                self.graph.start_node, self.graph.goal_node))
     
     def save_results(self):
         """Sauvegarde les résultats dans un fichier."""
@@ -194,14 +318,7 @@ class BestFirstSearchApp:
                 return
             
             # Préparer les données à sauvegarder
-            results_data = {
-                "algorithm": "Best-First Search",
-                "start_node": self.graph.start_node,
-                "goal_node": self.graph.goal_node,
-                "path": path if path else [],
-                "expanded_nodes": expanded_nodes,
-                "steps_count": len(steps)
-            }
+            results_data = self.search.results_data(path, expanded_nodes)
             
             # Sauvegarder au format JSON
             with open(filename, 'w') as file:
@@ -210,9 +327,9 @@ class BestFirstSearchApp:
             # Sauvegarder aussi une image du graphe avec le chemin
             if path:
                 image_filename = os.path.splitext(filename)[0] + ".png"
-                fig, ax = self.visualizer.visualize_path(path)
-                plt.savefig(image_filename, bbox_inches='tight')
-                plt.close(fig)
+                # Même dessin que celui affiché : chemin et nœuds visités
+                self.visualizer.visualize_path(path, visited=self.search.visited)
+                self.visualizer.save_figure(image_filename)
                 
                 self.update_info(f"Résultats sauvegardés dans {filename}\n"
                               f"Image sauvegardée dans {image_filename}")
@@ -235,7 +352,8 @@ class BestFirstSearchApp:
             filename = filedialog.asksaveasfilename(
                 title="Sauvegarder l'animation",
                 defaultextension=".mp4",
-                filetypes=[("Fichiers MP4", "*.mp4"), ("Tous les fichiers", "*.*")]
+                filetypes=[("Fichiers MP4", "*.mp4"), ("Fichiers GIF", "*.gif"),
+                           ("Tous les fichiers", "*.*")]
             )
             
             if not filename:  # L'utilisateur a annulé
@@ -250,15 +368,18 @@ class BestFirstSearchApp:
             if not interval:  # L'utilisateur a annulé
                 interval = 1000
             
-            # Mettre à jour les informations
-            self.update_info("Création de l'animation en cours...\nCela peut prendre un moment.")
-            self.root.update()
+            # Créer l'animation en arrière-plan (sans ffmpeg : GIF ou séquence d'images PNG)
+            cancel = threading.Event()
             
-            # Créer l'animation
-            self.visualizer.animate_search(steps, path, interval=interval, 
-                                         save_animation=True, filename=filename)
+            def work(report):
+                return export_animation(
+                    self.visualizer, steps, filename, fps=1000 / interval, cancel=cancel,
+                    progress=lambda done, total: report(
+                        f"Création de l'animation en cours...\nImage {done}/{total}"))
             
-            self.update_info(f"Animation sauvegardée dans {filename}")
+            self._start_job("Création de l'animation en cours...\nCela peut prendre un moment.",
+                            work, lambda output: self.update_info(f"Animation sauvegardée dans {output}"),
+                            cancel.set, "Erreur lors de la création de l'animation")
             
         except Exception as e:
             messagebox.showerror("Erreur", f"Erreur lors de la création de l'animation: {str(e)}")
@@ -0,0 +1,184 @@
+import time
+
+
+class SearchObserver:
+    """
+    Observateur des événements d'une recherche (voir BestFirstSearch.add_observer).
+
+    Les méthodes ne font rien par défaut : une sous-classe ne redéfinit que
+    les événements qui l'intéressent. Les nœuds sont désignés par leurs
+    identifiants. Pour chaque nœud développé, les événements arrivent dans
+    l'ordre on_pop puis, si c'est le but, on_goal ; sinon on_push pour
+    chaque successeur ajouté à la frontière, puis on_expand.
+
+    Sans observateur, la recherche ne paie qu'un test par événement.
+    """
+    def on_start(self, search, start, goal):
+        """Début d'une requête (search est la recherche observée)."""
+
+    def on_push(self, node, parent, priority, g):
+        """Entrée ajoutée à la frontière."""
+
+    def on_pop(self, node, stale):
+        """Entrée retirée de la frontière ; stale si son nœud était déjà développé."""
+
+    def on_expand(self, node, g, frontier, seconds):
+        """
+        Nœud développé.
+
+        Args:
+            node: Nœud développé
+            g: Coût du chemin jusqu'au nœud
+            frontier: Taille de la frontière après l'ajout de ses successeurs
+            seconds: Temps de génération des successeurs (lecture des
+                voisins, heuristiques et insertions dans la frontière)
+        """
+
+    def on_goal(self, node, cost):
+        """But atteint avec le coût cost."""
+
+    def on_finish(self, search, path):
+        """Fin d'une requête ; path vaut None si aucun chemin n'a été trouvé."""
+
+
+class ObserverGroup(SearchObserver):
+    """Transmet chaque événement à plusieurs observateurs, dans l'ordre."""
+    def __init__(self, observers):
+        self.observers = list(observers)
+
+    def on_start(self, search, start, goal):
+        for observer in self.observers:
+            observer.on_start(search, start, goal)
+
+    def on_push(self, node, parent, priority, g):
+        for observer in self.observers:
+            observer.on_push(node, parent, priority, g)
+
+    def on_pop(self, node, stale):
+        for observer in self.observers:
+            observer.on_pop(node, stale)
+
+    def on_expand(self, node, g, frontier, seconds):
+        for observer in self.observers:
+            observer.on_expand(node, g, frontier, seconds)
+
+    def on_goal(self, node, cost):
+        for observer in self.observers:
+            observer.on_goal(node, cost)
+
+    def on_finish(self, search, path):
+        for observer in self.observers:
+            observer.on_finish(search, path)
+
+
+def combine_observers(observers):
+    """
+    Réunit des observateurs en un seul.
+
+    Returns:
+        None sans observateur, l'observateur lui-même s'il est seul, sinon
+        un ObserverGroup
+    """
+    if not observers:
+        return None
+    if len(observers) == 1:
+        return observers[0]
+    return ObserverGroup(observers)
+
+
+class MetricsCollector(SearchObserver):
+    """
+    Compteurs de la dernière requête observée.
+
+    Ajouté à une recherche, il compte les insertions et retraits de la
+    frontière (dont les entrées obsolètes), suit la taille maximale de la
+    frontière et mesure le temps de génération des successeurs et
+    d'évaluation des heuristiques calculées. Son résumé est ajouté aux
+    résultats de la recherche (champ "metrics" de results_data).
+
+        metrics = MetricsCollector()
+        search.add_observer(metrics)
+        search.search()
+        metrics.summary()
+    """
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """Remet les compteurs à zéro."""
+        self.pushes = 0
+        self.pops = 0
+        self.stale_pops = 0
+        self.expansions = 0
+        self.max_frontier = 0
+        self.successor_seconds = 0.0
+        self.heuristic_seconds = None  # None : valeurs stockées, lues sans calcul
+        self.heuristic_evaluations = None
+        self.search_seconds = 0.0
+        self.goal_reached = False
+        self.finished = False  # Vrai une fois une requête observée jusqu'au bout
+        self._memo = None
+        self._started = None
+
+    def on_start(self, search, start, goal):
+        self.reset()
+        # Le mémo d'un but peut servir à plusieurs requêtes : seuls les
+        # écarts pendant celle-ci sont comptés
+        self._memo = memo = search._heuristic_memo
+        if memo is not None:
+            self.heuristic_seconds = -memo.seconds
+            self.heuristic_evaluations = -memo.evaluations
+        self._started = time.perf_counter()
+
+    def on_push(self, node, parent, priority, g):
+        self.pushes += 1
+
+    def on_pop(self, node, stale):
+        self.pops += 1
+        if stale:
+            self.stale_pops += 1
+        else:
+            self.expansions += 1
+
+    def on_expand(self, node, g, frontier, seconds):
+        self.successor_seconds += seconds
+        if frontier > self.max_frontier:
+            self.max_frontier = frontier
+
+    def on_goal(self, node, cost):
+        self.goal_reached = True
+
+    def on_finish(self, search, path):
+        self.search_seconds = time.perf_counter() - self._started
+        self.finished = True
+        memo = self._memo
+        if memo is not None:
+            self.heuristic_seconds += memo.seconds
+            self.heuristic_evaluations += memo.evaluations
+            self._memo = None
+
+    def summary(self):
+        """
+        Résumé sérialisable en JSON de la dernière requête.
+
+        Les temps sont mesurés avec l'observateur en place : ils incluent le
+        coût des notifications et servent à comparer des réglages entre
+        eux, pas à chiffrer une recherche sans observateur.
+
+        Returns:
+            dict: Compteurs, temps et débit d'expansions
+        """
+        return {
+            'pushes': self.pushes,
+            'pops': self.pops,
+            'stale_pops': self.stale_pops,
+            'expansions': self.expansions,
+            'max_frontier': self.max_frontier,
+            'goal_reached': self.goal_reached,
+            'search_seconds': self.search_seconds,
+            'successor_seconds': self.successor_seconds,
+            'heuristic_seconds': self.heuristic_seconds,
+            'heuristic_evaluations': self.heuristic_evaluations,
+            'expansions_per_second': self.expansions / self.search_seconds
+            if self.search_seconds > 0 else None
+        }
@@ -0,0 +1,189 @@
+import heapq
+from functools import partial
+
+
+class HeapOpenList:
+    """
+    Liste ouverte basée sur heapq avec suppression paresseuse.
+
+    Chaque découverte d'un nœud ajoute une nouvelle entrée ; les doublons
+    restent dans le tas et sont ignorés par la recherche lorsqu'ils sont
+    retirés alors que le nœud a déjà été visité.
+
+    Les entrées sont des tuples (priorité, nœud, parent, g) : indices du
+    nœud et de son parent dans le graphe compilé (parent -1 pour le départ)
+    et coût du chemin jusqu'au nœud. push et pop reçoivent et renvoient ces
+    tuples tels quels.
+    """
+    lazy = True  # La file peut contenir des entrées obsolètes
+
+    def __init__(self):
+        self._heap = []
+        # Fonctions C de heapq liées au tas : pas de surcoût d'appel Python
+        self.push = partial(heapq.heappush, self._heap)
+        self.pop = partial(heapq.heappop, self._heap)
+
+    def __len__(self):
+        return len(self._heap)
+
+    def __bool__(self):
+        return bool(self._heap)
+
+    def __contains__(self, node):
+        """Test d'appartenance en O(n) : le tas n'est pas indexé."""
+        return any(entry[1] == node for entry in self._heap)
+
+    def peek(self):
+        """Renvoie l'entrée de plus petite priorité sans la retirer (éventuellement obsolète)."""
+        return self._heap[0]
+
+    def prune(self, size):
+        """
+        Ne conserve que les `size` meilleures entrées.
+
+        Une liste triée étant un tas valide, le tri suffit à rétablir
+        l'invariant ; le tas est modifié sur place (push/pop y sont liés).
+
+        Args:
+            size: Nombre d'entrées à conserver
+
+        Returns:
+            list: Entrées retirées, de la meilleure à la pire
+        """
+        heap = self._heap
+        heap.sort()
+        removed = heap[size:]
+        del heap[size:]
+        return removed
+
+    def entries(self):
+        """Renvoie une copie des entrées dans l'ordre interne du tas."""
+        return list(self._heap)
+
+
+class IndexedOpenList:
+    """
+    Tas binaire indexé supportant la diminution de clé (decrease-key).
+
+    Chaque nœud n'apparaît qu'une fois : ajouter une entrée pour un nœud déjà
+    présent remplace l'entrée existante si la nouvelle est plus petite, sinon
+    l'ajout est ignoré. Le test d'appartenance est en O(1).
+
+    Les entrées sont des tuples (priorité, nœud, parent, g), comme pour
+    HeapOpenList. La comparaison porte sur le tuple complet, ce qui conserve
+    l'ordre de départage de HeapOpenList.
+    """
+    lazy = False
+
+    def __init__(self):
+        self._heap = []
+        self._position = {}  # nœud -> position dans le tas
+
+    def __len__(self):
+        return len(self._heap)
+
+    def __bool__(self):
+        return bool(self._heap)
+
+    def __contains__(self, node):
+        return node in self._position
+
+    def peek(self):
+        """Renvoie l'entrée de plus petite priorité sans la retirer."""
+        return self._heap[0]
+
+    def prune(self, size):
+        """
+        Ne conserve que les `size` meilleures entrées (voir HeapOpenList.prune).
+
+        Args:
+            size: Nombre d'entrées à conserver
+
+        Returns:
+            list: Entrées retirées, de la meilleure à la pire
+        """
+        heap = self._heap
+        heap.sort()
+        removed = heap[size:]
+        del heap[size:]
+        self._position = {entry[1]: index for index, entry in enumerate(heap)}
+        return removed
+
+    def entries(self):
+        """Renvoie une copie des entrées dans l'ordre interne du tas."""
+        return list(self._heap)
+
+    def push(self, entry):
+        """
+        Ajoute une entrée ou diminue la clé du nœud s'il est déjà présent.
+
+        Args:
+            entry: Tuple (priorité, nœud, parent, g)
+        """
+        node = entry[1]
+        index = self._position.get(node)
+        if index is None:
+            self._heap.append(entry)
+            self._position[node] = len(self._heap) - 1
+            self._sift_up(len(self._heap) - 1)
+        elif entry < self._heap[index]:
+            self._heap[index] = entry
+            self._sift_up(index)
+
+    def pop(self):
+        """Retire et renvoie l'entrée de plus petite priorité."""
+        heap = self._heap
+        last = heap.pop()
+        if not heap:
+            del self._position[last[1]]
+            return last
+        top = heap[0]
+        heap[0] = last
+        self._position[last[1]] = 0
+        del self._position[top[1]]
+        self._sift_down(0)
+        return top
+
+    def _sift_up(self, index):
+        heap = self._heap
+        position = self._position
+        entry = heap[index]
+        while index > 0:
+            parent = (index - 1) >> 1
+            parent_entry = heap[parent]
+            if entry < parent_entry:
+                heap[index] = parent_entry
+                position[parent_entry[1]] = index
+                index = parent
+            else:
+                break
+        heap[index] = entry
+        position[entry[1]] = index
+
+    def _sift_down(self, index):
+        heap = self._heap
+        position = self._position
+        size = len(heap)
+        entry = heap[index]
+        while True:
+            child = 2 * index + 1
+            if child >= size:
+                break
+            if child + 1 < size and heap[child + 1] < heap[child]:
+                child += 1
+            child_entry = heap[child]
+            if child_entry < entry:
+                heap[index] = child_entry
+                position[child_entry[1]] = index
+                index = child
+            else:
+                break
+        heap[index] = entry
+        position[entry[1]] = index
+
+
+# Implémentations disponibles, sélectionnables par nom dans BestFirstSearch
+OPEN_LISTS = {
+    'heap': HeapOpenList,
+    'indexed': IndexedOpenList,
+}
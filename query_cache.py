@@ -0,0 +1,224 @@
+import json
+import os
+import weakref
+from collections import OrderedDict
+
+from algorithms import BestFirstSearch
+
+
+# Nombre de requêtes mémorisées par défaut
+DEFAULT_MAX_ENTRIES = 1024
+
+# Nombre d'arbres de plus courts chemins mémorisés par défaut (voir QueryCache)
+DEFAULT_MAX_TREES = 16
+
+CACHE_FILE_VERSION = 1
+
+
+class QueryCache:
+    """
+    Cache des résultats de recherche, avec éviction LRU.
+
+    Une entrée est identifiée par l'empreinte du graphe
+    (CompiledGraph.content_hash), les nœuds de départ et d'arrivée et les
+    paramètres de la recherche (BestFirstSearch.signature). Toute
+    modification d'un Graph change son empreinte : les entrées de
+    l'ancienne version ne sont plus jamais servies, et sont retirées dès
+    que le cache revoit ce graphe modifié.
+
+    Pour les recherches à coût uniforme (BestFirstSearch en mode 'ucs'),
+    les nœuds développés forment un arbre de plus courts chemins depuis le
+    départ : l'arbre est conservé et répond aux requêtes suivantes depuis le
+    même départ vers n'importe lequel de ces nœuds, sans nouvelle recherche.
+
+    Seuls les niveaux de trace 'none' et 'expansions' sont mis en cache ; les
+    arbres ne servent qu'au niveau 'none' (ils ne gardent pas l'ordre des
+    expansions). Les recherches dont l'heuristique n'a pas d'identité
+    stable (fonction Python, voir Heuristic.signature) ne sont jamais mises
+    en cache.
+    """
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES, max_trees=DEFAULT_MAX_TREES,
+                 filename=None):
+        """
+        Args:
+            max_entries: Nombre maximal de requêtes mémorisées
+            max_trees: Nombre maximal d'arbres de plus courts chemins (0
+                désactive la réutilisation des arbres)
+            filename: Fichier JSON de persistance ; chargé s'il existe et
+                utilisé par défaut par save()
+        """
+        if max_entries < 1:
+            raise ValueError("La taille du cache doit être au moins 1")
+        self.max_entries = max_entries
+        self.max_trees = max_trees
+        self.filename = filename
+        self.hits = 0  # Requêtes servies par une entrée mémorisée
+        self.tree_hits = 0  # Requêtes servies par un arbre de plus courts chemins
+        self.misses = 0  # Requêtes ayant lancé une recherche
+        self._entries = OrderedDict()
+        self._trees = OrderedDict()
+        self._graph_hashes = weakref.WeakKeyDictionary()  # Graph -> dernière empreinte vue
+        if filename is not None and os.path.exists(filename):
+            self.load(filename)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self):
+        """Compteurs du cache : succès, succès par arbre, échecs et tailles."""
+        return {'hits': self.hits, 'tree_hits': self.tree_hits, 'misses': self.misses,
+                'entries': len(self._entries), 'trees': len(self._trees)}
+
+    def search(self, search, start=None, goal=None):
+        """
+        Exécute une recherche, ou renvoie son résultat mémorisé.
+
+        En cas de succès, les attributs de la recherche (path_cost,
+        expansions, start_node...) sont mis à jour comme si elle avait été
+        exécutée, de sorte que search.results_data reste utilisable ; un
+        résultat tiré d'un arbre de plus courts chemins compte 0 expansion.
+
+        Args:
+            search: Instance de BestFirstSearch (ou d'une sous-classe)
+            start: Nœud de départ (par défaut graph.start_node)
+            goal: Nœud objectif (par défaut graph.goal_node)
+
+        Returns:
+            tuple: (chemin, nœuds_explorés, steps) comme search.search
+        """
+        signature = search.signature()
+        if search.trace not in ('none', 'expansions') or signature is None:
+            return search.search(start, goal)
+
+        compiled, start_index, goal_index = search._prepare_query(start, goal)
+        graph_hash = self._graph_hash(search.graph, compiled)
+        key = (graph_hash, search.start_node, search.goal_node, signature)
+        record = search.trace != 'none'
+
+        entry = self._entries.get(key)
+        if entry is not None and (not record or entry['expanded_nodes'] is not None):
+            self._entries.move_to_end(key)
+            self.hits += 1
+            search.path_cost = entry['path_cost']
+            search.expansions = entry['expansions']
+            search.expanded_nodes = list(entry['expanded_nodes']) if record else []
+            return (list(entry['path']) if entry['path'] else None), search.expanded_nodes, []
+
+        reuse_tree = self.max_trees > 0 and _builds_shortest_path_tree(search)
+        tree_key = (graph_hash, search.start_node, signature)
+        if reuse_tree and not record:
+            tree = self._trees.get(tree_key)
+            if tree is not None and goal_index in tree:
+                self._trees.move_to_end(tree_key)
+                self.tree_hits += 1
+                path = _tree_path(tree, goal_index)
+                search.path_cost = _path_cost(compiled, path)
+                search.expansions = 0
+                search.expanded_nodes = []
+                node_ids = compiled.node_ids
+                return [node_ids[node] for node in path], [], []
+
+        self.misses += 1
+        path, expanded_nodes, steps = search.search(start, goal)
+        self._store(key, {
+            'path': path,
+            'path_cost': search.path_cost,
+            'expansions': search.expansions,
+            'expanded_nodes': list(expanded_nodes) if record else None
+        })
+        if reuse_tree:
+            # Nœuds développés : leur chaîne de parents est un plus court chemin
+            tree = {node: search._parents.get(node, -1) for node in search._closed}
+            self._trees[tree_key] = tree
+            self._trees.move_to_end(tree_key)
+            if len(self._trees) > self.max_trees:
+                self._trees.popitem(last=False)
+        return path, expanded_nodes, steps
+
+    def invalidate(self, graph_hash=None):
+        """
+        Retire des entrées du cache.
+
+        Args:
+            graph_hash: Empreinte d'un graphe dont les entrées sont retirées ;
+                None vide tout le cache
+        """
+        if graph_hash is None:
+            self._entries.clear()
+            self._trees.clear()
+            return
+        for store in (self._entries, self._trees):
+            for key in [key for key in store if key[0] == graph_hash]:
+                del store[key]
+
+    def save(self, filename=None):
+        """
+        Enregistre les entrées dans un fichier JSON (les arbres ne sont pas enregistrés).
+
+        Args:
+            filename: Fichier à écrire (par défaut celui du constructeur)
+        """
+        filename = filename or self.filename
+        if filename is None:
+            raise ValueError("Aucun fichier de cache indiqué")
+        cache_data = {
+            'version': CACHE_FILE_VERSION,
+            'entries': [{'key': [graph_hash, start, goal, list(signature)], **entry}
+                        for (graph_hash, start, goal, signature), entry in self._entries.items()]
+        }
+        with open(filename, 'w') as file:
+            json.dump(cache_data, file)
+
+    def load(self, filename):
+        """
+        Ajoute au cache les entrées d'un fichier écrit par save.
+
+        Args:
+            filename: Fichier JSON du cache
+        """
+        with open(filename, 'r') as file:
+            cache_data = json.load(file)
+        if cache_data.get('version') != CACHE_FILE_VERSION:
+            raise ValueError(f"Version de fichier de cache non prise en charge: {filename}")
+        for entry in cache_data['entries']:
+            graph_hash, start, goal, signature = entry.pop('key')
+            self._store((graph_hash, start, goal, tuple(signature)), entry)
+
+    def _store(self, key, entry):
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _graph_hash(self, graph, compiled):
+        """Empreinte du graphe ; retire les entrées de sa version précédente."""
+        graph_hash = compiled.content_hash()
+        if graph is not compiled:
+            previous = self._graph_hashes.get(graph)
+            if previous is not None and previous != graph_hash:
+                self.invalidate(previous)
+            self._graph_hashes[graph] = graph_hash
+        return graph_hash
+
+
+def _builds_shortest_path_tree(search):
+    """La boucle de BestFirstSearch en mode 'ucs' ne développe un nœud qu'à sa distance minimale."""
+    return search.mode == 'ucs' and type(search).search is BestFirstSearch.search
+
+
+def _tree_path(tree, node):
+    path = [node]
+    while tree[node] >= 0:
+        node = tree[node]
+        path.append(node)
+    return path[::-1]
+
+
+def _path_cost(compiled, path):
+    """Coût d'un chemin (en indices), sommé dans le même ordre que la recherche."""
+    indptr, indices, weights, _ = compiled.adjacency_lists()
+    cost = 0.0
+    for node, successor in zip(path, path[1:]):
+        cost += min(weights[k] for k in range(indptr[node], indptr[node + 1])
+                    if indices[k] == successor)
+    return cost
@@ -0,0 +1,19 @@
+from algorithms import BestFirstSearch
+from graph import Graph
+
+
+def example_graph():
+    graph = Graph()
+    graph.create_example_graph_1()
+    return graph
+
+
+def test_search_many_accepts_goal_generator():
+    goals = ['D', 'E', 'G']
+    expected = BestFirstSearch(example_graph(), trace='none').search_many('A', goals)
+    search = BestFirstSearch(example_graph(), trace='none')
+    tree = search.search_many('A', (goal for goal in goals))
+    assert tree.reached_goals == expected.reached_goals
+    assert sorted(tree.reached_goals) == goals
+    for goal in goals:
+        assert tree.path_to(goal) == expected.path_to(goal)
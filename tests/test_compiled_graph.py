@@ -0,0 +1,39 @@
+import json
+import os
+
+import generators
+from compiled_graph import CompiledGraph
+from graph import Graph
+
+EXAMPLE_GRAPHS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                              'example_graphs')
+
+
+def test_loaders_agree_on_repeated_edges(tmp_path):
+    with open(os.path.join(EXAMPLE_GRAPHS, 'graph2.json')) as file:
+        data = json.load(file)
+    first = data['edges'][0]
+    # Arête répétée avec un autre poids, après les autres arêtes de sa source
+    data['edges'].append({'from': first['from'], 'to': first['to'],
+                          'weight': first['weight'] + 1})
+    filename = tmp_path / 'repeated.json'
+    filename.write_text(json.dumps(data))
+
+    compiled = CompiledGraph.load_from_file(str(filename))
+    reference = Graph.load_from_file(str(filename)).compile()
+    assert compiled.indices.tolist() == reference.indices.tolist()
+    assert compiled.weights.tolist() == reference.weights.tolist()
+    assert compiled.content_hash() == reference.content_hash()
+
+
+def test_binary_format_keeps_positions(tmp_path):
+    graph = generators.generate('geometric', 300, seed=2)
+    json_file = str(tmp_path / 'graph.json')
+    binary_file = str(tmp_path / 'graph.bfsg')
+    graph.save_to_file(json_file)
+    graph.save_binary(binary_file)
+
+    compiled = CompiledGraph.open_binary(binary_file)
+    assert compiled.positions.tolist() == graph.compile().positions.tolist()
+    assert compiled.content_hash() == CompiledGraph.load_from_file(json_file).content_hash()
+    assert Graph.load_binary(binary_file).content_hash() == graph.content_hash()
@@ -0,0 +1,32 @@
+import numpy as np
+
+import generators
+from graph import Graph
+from incremental import IncrementalSearch
+
+
+def grid_without_stored_heuristics():
+    grid = generators.generate('grid', 400, seed=3, compiled=True)
+    sources = np.repeat(np.arange(grid.num_nodes), np.diff(grid.indptr))
+    return Graph.from_arrays(grid.node_ids, None, sources, grid.indices, grid.weights,
+                             grid.positions, start=grid.start_node, goal=grid.goal_node)
+
+
+def test_graph_heuristic_is_used():
+    graph = grid_without_stored_heuristics()
+    evaluated = []
+    graph.set_heuristic(lambda node, goal: evaluated.append(node) or 0.0)
+    IncrementalSearch(graph).search()
+    assert evaluated
+
+
+def test_repair_matches_full_search_with_graph_heuristic():
+    graph = grid_without_stored_heuristics()
+    graph.set_heuristic('euclidean')
+    planner = IncrementalSearch(graph)
+    planner.search()
+    graph.add_edge(graph.start_node, graph.goal_node, planner.path_cost / 2)
+    graph.add_node(400, 0, (0.0, 0.0))
+    planner.search()
+    comparison = planner.compare_with_full_search()
+    assert comparison['incremental_cost'] == comparison['full_cost'] == planner.path_cost
@@ -0,0 +1,28 @@
+import generators
+from algorithms import BestFirstSearch
+from heuristics import CoordinateHeuristic
+from query_cache import QueryCache
+
+
+def test_heuristic_parameters_are_part_of_the_key():
+    graph = generators.generate('grid', 400, seed=1)
+    cache = QueryCache()
+    for scale in (1.0, 50.0):
+        heuristic = CoordinateHeuristic(metric='euclidean', scale=scale)
+        search = BestFirstSearch(graph, trace='none', priority='astar', heuristic=heuristic)
+        cache.search(search)
+        fresh = BestFirstSearch(graph, trace='none', priority='astar', heuristic=heuristic)
+        fresh.search()
+        assert search.path_cost == fresh.path_cost
+    assert cache.stats()['hits'] == 0
+
+
+def test_function_heuristics_are_not_cached():
+    graph = generators.generate('grid', 400, seed=1)
+    cache = QueryCache()
+    for weight in (0.0, 5.0):
+        search = BestFirstSearch(graph, trace='none', priority='astar',
+                                 heuristic=lambda node, goal, weight=weight: weight)
+        cache.search(search)
+    assert len(cache) == 0
+    assert cache.stats()['hits'] == 0
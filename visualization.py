@@ -1,43 +1,180 @@
+import json
+import os
+
 import matplotlib.pyplot as plt
 import networkx as nx
 import matplotlib.animation as animation
+from matplotlib.collections import LineCollection
+from matplotlib.colors import to_rgba
 import numpy as np
 
+from animation_export import export_animation
+
+
+# Au-delà de ce nombre de nœuds, le graphe est dessiné en mode « grand graphe » :
+# collections uniques, sans poids d'arêtes, étiquettes seulement en zoomant
+LARGE_GRAPH_NODES = 2000
+
+# Nombre maximal d'étiquettes de nœuds affichées à la fois en mode grand graphe
+MAX_NODE_LABELS = 100
+
+# Nombre maximal de nœuds visités énumérés dans le texte d'une image d'animation ;
+# au-delà, seul leur nombre est affiché
+MAX_INFO_NODES = 10
+
+# Nombre maximal d'arêtes dessinées à la fois en mode grand graphe ; au-delà,
+# un échantillon régulier des arêtes visibles est dessiné
+MAX_DRAWN_EDGES = 20000
+
+
+def spring_layout(graph_nx):
+    """
+    Disposition par défaut : spring_layout de networkx, reproductible.
+    
+    Au-delà de LARGE_GRAPH_NODES nœuds, spring_layout devient trop coûteux :
+    une disposition aléatoire (reproductible, calculée en une passe) est
+    utilisée à la place.
+    """
+    if graph_nx.number_of_nodes() > LARGE_GRAPH_NODES:
+        return nx.random_layout(graph_nx, seed=42)
+    return nx.spring_layout(graph_nx, seed=42)
+
+
+def layout_filename(graph_filename):
+    """Nom du fichier de positions associé à un fichier de graphe."""
+    return os.path.splitext(graph_filename)[0] + ".layout.json"
+
+
 class GraphVisualizer:
     """
     Classe pour visualiser le graphe et les résultats de l'algorithme BFS.
+
+    Les positions des nœuds sont calculées une seule fois par version du
+    graphe, et la scène statique (nœuds, arêtes, étiquettes) est conservée
+    d'un dessin à l'autre : seuls les éléments ajoutés par-dessus (chemin,
+    nœuds mis en évidence) sont recréés.
+
+    Au-delà de large_graph_nodes nœuds, les nœuds et les arêtes sont dessinés
+    chacun en une seule collection, sans texte, et au plus MAX_DRAWN_EDGES
+    arêtes visibles sont tracées ; les étiquettes n'apparaissent qu'une fois
+    le zoom suffisant pour en afficher au plus MAX_NODE_LABELS, et seulement
+    pour les nœuds utiles à la recherche (chemin et nœuds visités) lorsqu'un
+    chemin est affiché.
     """
-    def __init__(self, graph):
+    def __init__(self, graph, layout=spring_layout, large_graph_nodes=LARGE_GRAPH_NODES):
         """
         Initialise le visualiseur avec un graphe.
         
         Args:
             graph: Instance de la classe Graph à visualiser
+            layout: Fonction calculant les positions, layout(graph_nx) -> {nœud: (x, y)}
+            large_graph_nodes: Nombre de nœuds à partir duquel le mode grand
+                graphe est utilisé
         """
         self.graph = graph
+        self.layout = layout
+        self.large_graph_nodes = large_graph_nodes
         self.fig = None
         self.ax = None
         self.pos = None
+        self._layout_version = None  # Version du graphe pour laquelle self.pos est valide
+        self._scene_version = None  # Version du graphe dessinée dans self.fig
+        self._overlay = []  # Éléments dessinés par-dessus la scène statique
+        self._large = False  # Scène dessinée en mode grand graphe
+        self._xy = None  # Positions (n, 2) dans l'ordre du graphe compilé (mode grand graphe)
+        self._segments = None  # Segments (m, 2, 2) de toutes les arêtes (mode grand graphe)
+        self._edge_lines = None  # Collection des arêtes dessinées (mode grand graphe)
+        self._label_candidates = None  # Indices des nœuds pouvant être étiquetés (None : tous)
+        self._labels = {}  # Étiquettes créées à la demande, par indice de nœud
+    
+    def compute_layout(self):
+        """
+        Renvoie les positions des nœuds, recalculées seulement si le graphe a changé.
+        
+        Returns:
+            dict: Positions {nœud: (x, y)}
+        """
+        if self.pos is None or self._layout_version != self.graph.version:
+            self.pos = self.layout(self.graph.graph)
+            self._layout_version = self.graph.version
+        return self.pos
+    
+    def save_layout(self, filename):
+        """
+        Enregistre les positions des nœuds dans un fichier JSON.
+        
+        L'empreinte du graphe est enregistrée avec les positions pour
+        ignorer le fichier si le graphe change.
+        
+        Args:
+            filename: Fichier de positions (voir layout_filename)
+        """
+        pos = self.compute_layout()
+        layout_data = {
+            'graph_hash': self.graph.content_hash(),
+            'positions': [[node, float(x), float(y)] for node, (x, y) in pos.items()]
+        }
+        with open(filename, 'w') as file:
+            json.dump(layout_data, file)
+    
+    def load_layout(self, filename):
+        """
+        Charge des positions enregistrées par save_layout.
         
+        Args:
+            filename: Fichier de positions
+            
+        Returns:
+            bool: True si les positions correspondent au graphe et ont été chargées
+        """
+        try:
+            with open(filename, 'r') as file:
+                layout_data = json.load(file)
+        except (OSError, ValueError):
+            return False
+        
+        if layout_data.get('graph_hash') != self.graph.content_hash():
+            return False
+        
+        self.pos = {node: np.array([x, y]) for node, x, y in layout_data['positions']}
+        self._layout_version = self.graph.version
+        return True
+    
     def draw_graph(self, title="Graphe"):
         """
         Dessine le graphe avec les nœuds et les arêtes.
         
+        La figure précédente est réutilisée si elle est encore ouverte et que
+        le graphe n'a pas changé : seuls le titre et les éléments superposés
+        sont mis à jour.
+        
         Args:
             title: Titre du graphique
         """
+        if (self.fig is not None and plt.fignum_exists(self.fig.number)
+                and self._scene_version == self.graph.version):
+            self._clear_overlay()
+            self.ax.set_title(title, fontsize=16)
+            if self._large:
+                self._label_candidates = None
+                self._update_labels(self.ax)
+            plt.figure(self.fig.number)
+            return self.fig, self.ax
+        
         self.fig, self.ax = plt.subplots(figsize=(12, 8))
+        self._overlay = []
+        self._large = self.graph.graph.number_of_nodes() > self.large_graph_nodes
+        if self._large:
+            return self._draw_large_graph(title)
         graph_nx = self.graph.graph
-        
-        # Utiliser spring_layout pour positionner les nœuds automatiquement
-        self.pos = nx.spring_layout(graph_nx, seed=42)
+        pos = self.compute_layout()
         
         # Dessiner les arêtes avec leur poids
         edge_labels = {(u, v): f"{d['weight']}" for u, v, d in graph_nx.edges(data=True)}
-        nx.draw_networkx_edge_labels(graph_nx, self.pos, edge_labels=edge_labels)
+        nx.draw_networkx_edge_labels(graph_nx, pos, edge_labels=edge_labels, ax=self.ax)
         
         # Dessiner les arêtes
-        nx.draw_networkx_edges(graph_nx, self.pos, arrows=True, arrowsize=20)
+        nx.draw_networkx_edges(graph_nx, pos, arrows=True, arrowsize=20, ax=self.ax)
         
         # Dessiner les nœuds avec leur label et valeur heuristique
         node_labels = {node: f"{node}\nh={graph_nx.nodes[node]['heuristic']}" 
@@ -48,152 +185,198 @@ class GraphVisualizer:
                       'red' if node == self.graph.goal_node else 
                       'skyblue' for node in graph_nx.nodes()]
         
-        nx.draw_networkx_nodes(graph_nx, self.pos, node_color=node_colors, 
-                              node_size=700)
-        nx.draw_networkx_labels(graph_nx, self.pos, labels=node_labels)
+        nx.draw_networkx_nodes(graph_nx, pos, node_color=node_colors, 
+                              node_size=700, ax=self.ax)
+        nx.draw_networkx_labels(graph_nx, pos, labels=node_labels, ax=self.ax)
         
         # Ajouter un titre et nettoyer l'affichage
-        plt.title(title, fontsize=16)
-        plt.axis('off')
+        self.ax.set_title(title, fontsize=16)
+        self.ax.axis('off')
+        self._scene_version = self.graph.version
         
         return self.fig, self.ax
     
-    def visualize_path(self, path, title="Chemin trouvé par Best-First Search"):
+    def _draw_large_graph(self, title):
+        """
+        Dessine un grand graphe : une collection pour les arêtes, une pour les nœuds.
+        
+        Les segments sont construits directement à partir des tableaux CSR
+        du graphe compilé, sans parcourir les arêtes de networkx.
+        """
+        compiled = self.graph.compile()
+        pos = self.compute_layout()
+        self._xy = xy = np.array([pos[node] for node in compiled.node_ids], dtype=float).reshape(-1, 2)
+        
+        # Arêtes : segments (source, cible) sans flèches ni poids, choisis au zoom
+        sources = np.repeat(np.arange(compiled.num_nodes), np.diff(compiled.indptr))
+        self._segments = np.stack([xy[sources], xy[compiled.indices]], axis=1)
+        self._edge_lines = LineCollection([], colors='gray', linewidths=0.3, alpha=0.3, zorder=1)
+        self.ax.add_collection(self._edge_lines)
+        
+        # Nœuds : petits points, départ et arrivée agrandis
+        colors = np.tile(to_rgba('skyblue'), (compiled.num_nodes, 1))
+        sizes = np.full(compiled.num_nodes, 4.0)
+        for node, color in ((self.graph.start_node, 'green'), (self.graph.goal_node, 'red')):
+            if node in compiled.index:
+                colors[compiled.index[node]] = to_rgba(color)
+                sizes[compiled.index[node]] = 80.0
+        self.ax.scatter(xy[:, 0], xy[:, 1], s=sizes, c=colors, linewidths=0, zorder=2)
+        
+        self.ax.set_title(title, fontsize=16)
+        self.ax.axis('off')
+        self._scene_version = self.graph.version
+        
+        # Arêtes et étiquettes mises à jour à chaque changement de zoom
+        self._labels = {}
+        self._label_candidates = None
+        self.ax.update_datalim(xy)
+        self.ax.autoscale_view()
+        self.ax.callbacks.connect('xlim_changed', self._update_labels)
+        self.ax.callbacks.connect('ylim_changed', self._update_labels)
+        self._update_labels(self.ax)
+        
+        return self.fig, self.ax
+    
+    def _update_labels(self, ax):
+        """
+        Adapte le niveau de détail à la zone affichée.
+        
+        Les arêtes ayant une extrémité visible sont tracées (échantillonnées
+        au-delà de MAX_DRAWN_EDGES), et les étiquettes des nœuds visibles
+        sont affichées si elles sont assez peu nombreuses.
+        
+        Args:
+            ax: Axes dont les limites viennent de changer
+        """
+        (x0, x1), (y0, y1) = sorted(ax.get_xlim()), sorted(ax.get_ylim())
+        
+        def visible(points):
+            return ((points[..., 0] >= x0) & (points[..., 0] <= x1)
+                    & (points[..., 1] >= y0) & (points[..., 1] <= y1))
+        
+        edges = np.flatnonzero(visible(self._segments).any(axis=1))
+        if len(edges) > MAX_DRAWN_EDGES:
+            edges = edges[::-(-len(edges) // MAX_DRAWN_EDGES)]
+        self._edge_lines.set_segments(self._segments[edges])
+        
+        candidates = self._label_candidates
+        if candidates is None:
+            candidates = np.arange(len(self._xy))
+        in_view = candidates[visible(self._xy[candidates])]
+        shown = set(in_view.tolist()) if len(in_view) <= MAX_NODE_LABELS else set()
+        
+        for index, label in self._labels.items():
+            label.set_visible(index in shown)
+        graph_nx = self.graph.graph
+        node_ids = self.graph.compile().node_ids
+        for index in shown.difference(self._labels):
+            node = node_ids[index]
+            self._labels[index] = ax.text(*self._xy[index], f"{node}\nh={graph_nx.nodes[node]['heuristic']}",
+                                          fontsize=9, ha='center', va='bottom', zorder=5,
+                                          clip_on=True)
+    
+    def _visualize_large_path(self, path, visited):
+        """Superpose le chemin et les nœuds visités à un grand graphe."""
+        index = self.graph.compile().index
+        xy = self._xy
+        
+        if visited:
+            visited_indices = [index[node] for node in visited]
+            self._overlay.append(self.ax.scatter(xy[visited_indices, 0], xy[visited_indices, 1],
+                                                 s=8, c='gray', linewidths=0, zorder=3))
+        else:
+            visited_indices = []
+        
+        path_indices = [index[node] for node in path]
+        path_xy = xy[path_indices]
+        path_lines = LineCollection(np.stack([path_xy[:-1], path_xy[1:]], axis=1),
+                                    colors='red', linewidths=2, zorder=4)
+        self.ax.add_collection(path_lines)
+        self._overlay.append(path_lines)
+        self._overlay.append(self.ax.scatter(path_xy[1:-1, 0], path_xy[1:-1, 1], s=20,
+                                             c='yellow', edgecolors='black', linewidths=0.5,
+                                             zorder=4))
+        
+        # Seuls le chemin et les nœuds visités peuvent recevoir une étiquette
+        self._label_candidates = np.unique(np.array(path_indices + visited_indices, dtype=np.int64))
+        self._update_labels(self.ax)
+    
+    def _clear_overlay(self):
+        """Retire les éléments superposés à la scène statique."""
+        for artist in self._overlay:
+            artist.remove()
+        self._overlay = []
+    
+    def visualize_path(self, path, title="Chemin trouvé par Best-First Search", visited=None):
         """
         Visualise le chemin trouvé par l'algorithme.
         
         Args:
             path: Liste des nœuds formant le chemin solution
             title: Titre du graphique
+            visited: Nœuds visités par la recherche, mis en évidence et
+                étiquetés avec le chemin en mode grand graphe (optionnel)
         """
         if path is None:
             print("Aucun chemin trouvé.")
             return
         
         fig, ax = self.draw_graph(title)
+        if self._large:
+            self._visualize_large_path(path, visited)
+            return fig, ax
         
         # Créer une liste des arêtes du chemin pour les mettre en évidence
         path_edges = [(path[i], path[i+1]) for i in range(len(path)-1)]
         
         # Dessiner les arêtes du chemin en rouge et plus épaisses
-        nx.draw_networkx_edges(self.graph.graph, self.pos, 
-                              edgelist=path_edges, 
-                              edge_color='red', 
-                              width=3)
+        edges = nx.draw_networkx_edges(self.graph.graph, self.pos, 
+                                      edgelist=path_edges, 
+                                      edge_color='red', 
+                                      width=3, ax=ax)
+        self._overlay.extend(edges if isinstance(edges, list) else [edges])
         
         # Mettre en évidence les nœuds du chemin
         path_nodes = path[1:-1]  # Exclure départ et arrivée qui ont déjà des couleurs spéciales
         if path_nodes:
-            nx.draw_networkx_nodes(self.graph.graph, self.pos, 
-                                  nodelist=path_nodes, 
-                                  node_color='yellow', 
-                                  node_size=700)
+            self._overlay.append(nx.draw_networkx_nodes(self.graph.graph, self.pos, 
+                                                       nodelist=path_nodes, 
+                                                       node_color='yellow', 
+                                                       node_size=700, ax=ax))
         
         return fig, ax
     
-    def animate_search(self, steps, path, interval=1000, save_animation=False, filename='search_animation.mp4'):
+    def animate_search(self, steps, path, interval=1000, save_animation=False, filename='search_animation.mp4',
+                       processes=None):
         """
         Crée une animation de l'algorithme de recherche.
         
+        La scène statique est dessinée une seule fois (voir
+        SearchAnimationScene) ; chaque image ne modifie que les couleurs des
+        nœuds, le chemin et les textes, ce qui permet un vrai blitting.
+        
         Args:
             steps: Liste des états à chaque étape de l'algorithme
+                (liste de dictionnaires ou SearchTrace rejouée à la demande)
             path: Chemin final trouvé
             interval: Intervalle entre les images en millisecondes
             save_animation: Si True, sauvegarde l'animation dans un fichier
+                (voir animation_export.export_animation)
             filename: Nom du fichier pour sauvegarder l'animation
+            processes: Nombre de processus de rendu pour la sauvegarde
             
         Returns:
             Animation
         """
         fig, ax = plt.subplots(figsize=(12, 8))
+        scene = SearchAnimationScene(self, ax)
         
         def init():
-            ax.clear()
-            graph_nx = self.graph.graph
-            
-            # Dessiner les arêtes
-            nx.draw_networkx_edges(graph_nx, self.pos, arrows=True, arrowsize=20, ax=ax)
-            
-            # Dessiner les nœuds avec leur label et valeur heuristique
-            node_labels = {node: f"{node}\nh={graph_nx.nodes[node]['heuristic']}" 
-                           for node in graph_nx.nodes()}
-            
-            # Couleurs spéciales pour les nœuds de départ et d'arrivée
-            node_colors = ['green' if node == self.graph.start_node else 
-                          'red' if node == self.graph.goal_node else 
-                          'skyblue' for node in graph_nx.nodes()]
-            
-            nx.draw_networkx_nodes(graph_nx, self.pos, node_color=node_colors, 
-                                  node_size=700, ax=ax)
-            nx.draw_networkx_labels(graph_nx, self.pos, labels=node_labels, ax=ax)
-            
-            # Dessiner les poids des arêtes
-            edge_labels = {(u, v): f"{d['weight']}" for u, v, d in graph_nx.edges(data=True)}
-            nx.draw_networkx_edge_labels(graph_nx, self.pos, edge_labels=edge_labels, ax=ax)
-            
-            ax.set_title("Exécution de Best-First Search", fontsize=16)
-            ax.axis('off')
-            return []
+            return scene.artists
         
         def update(frame_num):
-            ax.clear()
             step = steps[frame_num] if frame_num < len(steps) else steps[-1]
-            
-            graph_nx = self.graph.graph
-            
-            # Dessiner toutes les arêtes normales
-            nx.draw_networkx_edges(graph_nx, self.pos, arrows=True, arrowsize=20, ax=ax)
-            
-            # Dessiner les poids des arêtes
-            edge_labels = {(u, v): f"{d['weight']}" for u, v, d in graph_nx.edges(data=True)}
-            nx.draw_networkx_edge_labels(graph_nx, self.pos, edge_labels=edge_labels, ax=ax)
-            
-            # Préparer les couleurs des nœuds selon leur état
-            node_colors = []
-            for node in graph_nx.nodes():
-                if node == self.graph.start_node:
-                    node_colors.append('green')
-                elif node == self.graph.goal_node:
-                    node_colors.append('red')
-                elif node == step['current']:
-                    node_colors.append('orange')  # Nœud actuel
-                elif node in step['visited']:
-                    node_colors.append('gray')    # Nœuds visités
-                else:
-                    node_colors.append('skyblue') # Nœuds non visités
-            
-            # Dessiner tous les nœuds
-            nx.draw_networkx_nodes(graph_nx, self.pos, node_color=node_colors, 
-                                  node_size=700, ax=ax)
-            
-            # Dessiner les labels des nœuds
-            node_labels = {node: f"{node}\nh={graph_nx.nodes[node]['heuristic']}" 
-                           for node in graph_nx.nodes()}
-            nx.draw_networkx_labels(graph_nx, self.pos, labels=node_labels, ax=ax)
-            
-            # Dessiner le chemin trouvé jusqu'à présent
-            path_so_far = step['path_so_far']
-            if len(path_so_far) > 1:
-                path_edges = [(path_so_far[i], path_so_far[i+1]) for i in range(len(path_so_far)-1)]
-                nx.draw_networkx_edges(graph_nx, self.pos, edgelist=path_edges, 
-                                      edge_color='red', width=3, ax=ax)
-            
-            # Ajouter des informations sur l'état actuel
-            info_text = f"Étape {frame_num+1}/{len(steps)}\n"
-            info_text += f"Nœud actuel: {step['current']}\n"
-            info_text += f"Nœuds visités: {', '.join(step['visited'])}\n"
-            
-            # Ajouter un titre
-            if step['current'] == self.graph.goal_node:
-                ax.set_title("Objectif atteint!", fontsize=16)
-            else:
-                ax.set_title(f"Exploration du nœud {step['current']}", fontsize=16)
-            
-            ax.text(0.02, 0.02, info_text, transform=ax.transAxes, fontsize=10,
-                   bbox=dict(facecolor='white', alpha=0.8))
-            
-            ax.axis('off')
-            return []
+            return scene.update(step, frame_num, len(steps))
         
         # Créer l'animation
         ani = animation.FuncAnimation(fig, update, frames=len(steps), 
@@ -201,9 +384,8 @@ class GraphVisualizer:
         
         # Sauvegarder l'animation si demandé
         if save_animation:
-            # S'assurer que ffmpeg est installé pour MP4
-            writer = animation.FFMpegWriter(fps=1)
-            ani.save(filename, writer=writer)
+            # Images rendues en parallèle et envoyées directement à l'encodeur
+            export_animation(self, steps, filename, fps=1000 / interval, processes=processes)
         
         plt.close()  # Fermer la figure mais pas l'animation
         return ani
@@ -220,4 +402,131 @@ class GraphVisualizer:
         Args:
             filename: Nom du fichier pour sauvegarder la figure
         """
-        plt.savefig(filename, bbox_inches='tight')
\ No newline at end of file
+        if self.fig is not None:
+            self.fig.savefig(filename, bbox_inches='tight')
+        else:
+            plt.savefig(filename, bbox_inches='tight')
+
+class SearchAnimationScene:
+    """
+    Scène d'animation de la recherche, dessinée une seule fois.
+
+    Les arêtes, leurs poids, les nœuds et leurs étiquettes sont statiques ;
+    à chaque image, seuls les nœuds mis en évidence (visités et nœud actuel),
+    le chemin partiel, le titre et le texte d'information sont redessinés.
+    Le coût d'une image dépend du nombre de nœuds visités, plus de la
+    taille du graphe.
+    """
+    COLORS = {
+        'current': to_rgba('orange'),
+        'visited': to_rgba('gray'),
+    }
+
+    def __init__(self, visualizer, ax):
+        """
+        Dessine la scène statique et crée les artistes animés.
+        
+        Args:
+            visualizer: GraphVisualizer fournissant le graphe et les positions
+            ax: Axes matplotlib sur lesquels dessiner
+        """
+        self.graph = visualizer.graph
+        self.ax = ax
+        self.pos = visualizer.compute_layout()
+        graph_nx = self.graph.graph
+        
+        self.nodes = list(graph_nx.nodes())
+        
+        # Dessiner les arêtes et leurs poids
+        nx.draw_networkx_edges(graph_nx, self.pos, arrows=True, arrowsize=20, ax=ax)
+        edge_labels = {(u, v): f"{d['weight']}" for u, v, d in graph_nx.edges(data=True)}
+        nx.draw_networkx_edge_labels(graph_nx, self.pos, edge_labels=edge_labels, ax=ax)
+        
+        # Nœuds et étiquettes statiques ; départ et arrivée gardent leur couleur
+        node_colors = ['green' if node == self.graph.start_node else 
+                      'red' if node == self.graph.goal_node else 
+                      'skyblue' for node in self.nodes]
+        nx.draw_networkx_nodes(graph_nx, self.pos, nodelist=self.nodes, node_color=node_colors,
+                               node_size=700, ax=ax)
+        self.node_labels = {node: f"{node}\nh={graph_nx.nodes[node]['heuristic']}" 
+                            for node in self.nodes}
+        nx.draw_networkx_labels(graph_nx, self.pos, labels=self.node_labels, ax=ax)
+        
+        # Nœuds mis en évidence (visités, nœud actuel), redessinés par-dessus
+        # la scène avec leurs étiquettes : seuls ces nœuds sont dessinés à
+        # chaque image, pas le graphe entier
+        self.highlight = ax.scatter([], [], s=700, marker='o', zorder=2)
+        self._highlight_labels = {}
+        
+        # Chemin partiel : segments mis à jour à chaque image, sous les nœuds
+        self.path_lines = LineCollection([], colors='red', linewidths=3, zorder=1)
+        ax.add_collection(self.path_lines)
+        
+        # Titre dans les axes : ax.set_title est hors de la zone restaurée par le blitting
+        self.title = ax.text(0.5, 0.98, "Exécution de Best-First Search", transform=ax.transAxes,
+                             fontsize=16, ha='center', va='top')
+        self.info = ax.text(0.02, 0.02, "", transform=ax.transAxes, fontsize=10,
+                            bbox=dict(facecolor='white', alpha=0.8))
+        ax.axis('off')
+        
+        self.artists = [self.highlight, self.path_lines, self.title, self.info]
+
+    def _highlight_label(self, node):
+        """Étiquette dessinée au-dessus d'un nœud mis en évidence (créée une fois)."""
+        label = self._highlight_labels.get(node)
+        if label is None:
+            x, y = self.pos[node]
+            label = self.ax.text(x, y, self.node_labels[node], fontsize=12,
+                                 ha='center', va='center', zorder=3)
+            self._highlight_labels[node] = label
+        return label
+
+    def update(self, step, frame_num, num_frames):
+        """
+        Applique un état de la recherche aux artistes animés.
+        
+        Args:
+            step: Dictionnaire de l'étape ('current', 'visited', 'path_so_far')
+            frame_num: Numéro de l'image
+            num_frames: Nombre total d'images
+            
+        Returns:
+            list: Artistes modifiés, pour le blitting
+        """
+        special = (self.graph.start_node, self.graph.goal_node)
+        current = step['current']
+        highlighted = [node for node in step['visited']
+                       if node != current and node not in special and node in self.pos]
+        colors = [self.COLORS['visited']] * len(highlighted)
+        if current not in special and current in self.pos:
+            highlighted.append(current)
+            colors.append(self.COLORS['current'])
+        
+        self.highlight.set_offsets(np.array([self.pos[node] for node in highlighted]).reshape(-1, 2))
+        self.highlight.set_facecolor(colors)
+        labels = [self._highlight_label(node) for node in highlighted]
+        
+        path_so_far = step['path_so_far']
+        self.path_lines.set_segments([(self.pos[u], self.pos[v])
+                                      for u, v in zip(path_so_far, path_so_far[1:])])
+        
+        if current == self.graph.goal_node:
+            self.title.set_text("Objectif atteint!")
+        else:
+            self.title.set_text(f"Exploration du nœud {current}")
+        
+        visited = step['visited']
+        if len(visited) <= MAX_INFO_NODES:
+            visited_text = ', '.join(map(str, visited))
+        else:
+            visited_text = str(len(visited))  # Texte de taille constante
+        self.info.set_text(f"Étape {frame_num+1}/{num_frames}\n"
+                           f"Nœud actuel: {current}\n"
+                           f"Nœuds visités: {visited_text}\n")
+        
+        # Les étiquettes des nœuds qui ne sont plus mis en évidence sont masquées
+        for label in self._highlight_labels.values():
+            label.set_visible(False)
+        for label in labels:
+            label.set_visible(True)
+        return self.artists + labels